@@ -10,12 +10,12 @@ const fs = require('fs');
 const pythonDir = path.join(__dirname, '../../Python');
 const distDir = path.join(pythonDir, 'dist');
 
-console.log('🐍 Building Python executables with PyInstaller...');
+console.log('🐍 Building the Python bundle with PyInstaller...');
 
-// Ensure dist directory exists
-if (!fs.existsSync(distDir)) {
-  fs.mkdirSync(distDir, { recursive: true });
-}
+// Start from an empty dist directory so bundles from the former per-script
+// layout are not shipped next to the shared one
+fs.rmSync(distDir, { recursive: true, force: true });
+fs.mkdirSync(distDir, { recursive: true });
 
 // Check if PyInstaller is installed
 try {
@@ -38,12 +38,9 @@ try {
   process.exit(1);
 }
 
-// Build Python scripts
-const scripts = [
-  'createSummaryDocuments.spec',
-  'createConfirmationDocuments.spec',
-  'pdf_to_images.spec',
-];
+// Build the shared bundle: one runtime, one dispatcher executable for every job
+// (taxAutomate <createSummaryDocuments|createConfirmationDocuments|pdf_to_images> ...)
+const scripts = ['taxAutomate.spec'];
 
 scripts.forEach((specFile) => {
   console.log(`\n🔨 Building ${specFile}...`);
@@ -59,5 +56,5 @@ scripts.forEach((specFile) => {
   }
 });
 
-console.log('\n✅ All Python executables built successfully!');
+console.log('\n✅ Python bundle built successfully!');
 console.log(`📂 Output directory: ${distDir}`);
@@ -0,0 +1,105 @@
+"""
+Install size and launch time of the PyInstaller bundles.
+
+Usage (from Python/, after `npm run build:python` or `pyinstaller taxAutomate.spec`):
+
+    python -m benchmarks.bundleStartup                 # measures dist/
+    python -m benchmarks.bundleStartup --dist old/dist --output before.json
+    python -m benchmarks.bundleStartup --drop-caches   # Linux, as root: true cold start
+
+Works on both layouts: the shared dist/taxAutomate dispatcher bundle and the former
+one-bundle-per-script layout (dist/<script>/<script>). Every job is launched on its
+fast-fail path (an empty job manifest on stdin), which measures the
+bootloader, the runtime start and the entry point imports without doing any work.
+The first launch of every job (in sequence, after the optional cache drop) is
+reported separately from the median of the following ones.
+On Windows, reboot (or use RAMMap's "Empty Standby List") before the run to get
+the post-reboot cold start.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+JOBS = ('createSummaryDocuments', 'createConfirmationDocuments', 'pdf_to_images')
+DISPATCHER = 'taxAutomate'
+EXE_SUFFIX = '.exe' if sys.platform == 'win32' else ''
+
+
+def directory_size(path):
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            file_path = os.path.join(root, name)
+            if not os.path.islink(file_path):
+                total += os.path.getsize(file_path)
+    return total
+
+
+def commands(dist):
+    """(bundle directories, {job: argv}) for whichever layout is present in `dist`."""
+    dispatcher = os.path.join(dist, DISPATCHER, DISPATCHER + EXE_SUFFIX)
+    if os.path.exists(dispatcher):
+        return [os.path.join(dist, DISPATCHER)], {job: [dispatcher, job] for job in JOBS}
+    bundles, argv = [], {}
+    for job in JOBS:
+        executable = os.path.join(dist, job, job + EXE_SUFFIX)
+        if os.path.exists(executable):
+            bundles.append(os.path.join(dist, job))
+            argv[job] = [executable]
+    return bundles, argv
+
+
+def drop_caches():
+    subprocess.run(['sync'], check=False)
+    with open('/proc/sys/vm/drop_caches', 'w') as f:
+        f.write('3\n')
+
+
+def launch(argv):
+    start = time.perf_counter()
+    subprocess.run(argv, input='', capture_output=True, text=True, check=False)
+    return time.perf_counter() - start
+
+
+def measure(dist, runs=5, cold=False, log=print):
+    bundles, argv = commands(dist)
+    if not argv:
+        raise SystemExit(f"No bundle found in {dist}")
+    size = sum(directory_size(bundle) for bundle in bundles)
+    log(f"{dist}: {len(bundles)} bundle(s), {size / 2**20:.1f} MiB")
+
+    # First launches run back to back after (optionally) one cache drop, as after a
+    # reboot: with the shared runtime only the first job pays for loading it from disk.
+    if cold:
+        drop_caches()
+    first = {job: launch(command) for job, command in argv.items()}
+    results = {}
+    for job, command in argv.items():
+        warm = statistics.median(launch(command) for _ in range(runs))
+        results[job] = {'first_s': round(first[job], 4), 'warm_median_s': round(warm, 4)}
+        log(f"    {job:<32} first {first[job] * 1000:8.1f} ms   warm {warm * 1000:8.1f} ms")
+    return {'dist': os.path.abspath(dist), 'bundles': len(bundles), 'size_bytes': size, 'cold': cold, 'jobs': results}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure PyInstaller bundle size and launch time.")
+    parser.add_argument('--dist', default=os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'dist'))
+    parser.add_argument('--runs', type=int, default=5, help="warm launches per job (default: 5)")
+    parser.add_argument('--drop-caches', action='store_true', help="drop the Linux page cache before the first launches")
+    parser.add_argument('--output', help="write the measurements to this JSON file")
+    args = parser.parse_args(argv)
+
+    report = measure(args.dist, runs=args.runs, cold=args.drop_caches)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    return report
+
+
+if __name__ == '__main__':
+    main()
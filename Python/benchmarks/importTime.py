@@ -0,0 +1,109 @@
+"""
+Start-up import cost of the CLI entry points, checked against a budget.
+
+Usage (from Python/):
+
+    python -m benchmarks.importTime
+    python -m benchmarks.importTime --runs 10 --top 15 --output import-times.json
+
+Every entry point is imported in a fresh interpreter with `-X importtime`; the
+parsed report keeps the fastest of `--runs` runs. benchmarks/importBudget.json
+gives each entry point a time budget in milliseconds and the modules it must not
+load at import time (the heavy PDF/docx stacks are imported when a job needs
+them). Exits with status 1 when an entry point is over budget or loads a
+forbidden module.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "importBudget.json")
+
+
+def parse_importtime(stderr):
+    """Parse `-X importtime` output into [(module, self_us, cumulative_us, depth)] in import order."""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        entries.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return entries
+
+
+def measure(module, runs=5):
+    """Import `module` in `runs` fresh interpreters and return the parsed fastest run."""
+    best = None
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+            cwd=PYTHON_DIR, capture_output=True, text=True, check=True,
+        )
+        entries = parse_importtime(result.stderr)
+        total = next(cumulative for name, _, cumulative, _ in reversed(entries) if name == module)
+        if best is None or total < best[0]:
+            best = (total, entries)
+    total, entries = best
+    return {
+        'module': module,
+        'total_ms': round(total / 1000, 2),
+        'modules': [name for name, _, _, _ in entries],
+        'top': [
+            {'module': name, 'cumulative_ms': round(cumulative / 1000, 2), 'self_ms': round(self_us / 1000, 2)}
+            for name, self_us, cumulative, depth in sorted(entries, key=lambda e: -e[2])
+            if name != module
+        ],
+    }
+
+
+def check(report, budget):
+    """Budget violations of one entry point's report, as readable strings."""
+    problems = []
+    if report['total_ms'] > budget.get('max_ms', float('inf')):
+        problems.append(f"{report['module']}: {report['total_ms']} ms over the {budget['max_ms']} ms budget")
+    loaded = set(report['modules'])
+    for module in budget.get('forbidden', []):
+        if module in loaded:
+            problems.append(f"{report['module']}: imports {module} at start-up")
+    return problems
+
+
+def run(budgets, runs=5, top=10, log=print):
+    reports, problems = [], []
+    for module, budget in budgets.items():
+        report = measure(module, runs)
+        reports.append(report)
+        problems += check(report, budget)
+        log(f"{module:<32} {report['total_ms']:8.1f} ms  (budget {budget.get('max_ms', '-')} ms)")
+        for entry in report['top'][:top]:
+            log(f"    {entry['module']:<40} {entry['cumulative_ms']:8.1f} ms")
+    return reports, problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report and budget the CLI start-up imports.")
+    parser.add_argument('--budget', default=BUDGET_PATH, help="budget JSON (default: benchmarks/importBudget.json)")
+    parser.add_argument('--runs', type=int, default=5, help="fresh interpreters per entry point (default: 5)")
+    parser.add_argument('--top', type=int, default=10, help="slowest imports listed per entry point (default: 10)")
+    parser.add_argument('--output', help="write the parsed reports to this JSON file")
+    args = parser.parse_args(argv)
+
+    with open(args.budget, encoding='utf-8') as f:
+        budgets = json.load(f)
+    reports, problems = run(budgets, runs=args.runs, top=args.top)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'reports': reports, 'problems': problems}, f, indent=2)
+    for problem in problems:
+        print(f"OVER BUDGET  {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
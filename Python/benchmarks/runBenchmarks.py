@@ -0,0 +1,431 @@
+"""
+Benchmark the document pipeline on synthetic returns.
+
+Usage (from Python/):
+
+    python -m benchmarks.runBenchmarks --sizes 1,10,50
+    python -m benchmarks.runBenchmarks --only split,extract --repeat 5
+    python -m benchmarks.runBenchmarks --compare benchmarks/results/<commit>.json
+
+Each case runs `size` items (returns, summaries, documents, invoices, invoice line
+items or pages) and is timed `--repeat` times; one extra run is traced with
+tracemalloc for the peak Python memory (MuPDF's own allocations are not visible
+to tracemalloc). Results are written to benchmarks/results/<commit>.json unless
+--output is given, and --compare prints the time ratio of every case found in
+both files.
+"""
+
+import argparse
+import base64
+import datetime
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.syntheticReturns import (
+    CONFIGURATION,
+    YEAR,
+    build_client_files,
+    build_form_pdf,
+    build_invoice_job,
+    pair_as_couples,
+    register_synthetic_profiles,
+)
+from createConfirmationDocuments import create_confirmation_documents
+from createSummaryDocuments import split_return
+from models.createSummary import create_summary_documents, extract_return_summary, prepare_summary
+from models.extractData import (
+    extract_tax_summary,
+    extract_gst_credit,
+    extract_ecgeb_credit,
+    extract_solidarity_credit,
+    extract_child_benefit,
+    extract_family_allowance,
+    extract_carryforward_summary,
+    extract_carbon_rebate,
+    extract_ontario_trillium,
+    extract_climate_action_credit,
+)
+from models.extractDataFR import (
+    extract_tax_summaryFR,
+    extract_gst_creditFR,
+    extract_ecgeb_creditFR,
+    extract_solidarity_creditFR,
+    extract_child_benefitFR,
+    extract_family_allowanceFR,
+    extract_carryforward_summaryFR,
+    extract_carbon_rebateFR,
+    extract_ontario_trilliumFR,
+)
+from models.createWordDoc import createIndividualWordDoc, createCoupleWordDoc
+from models.createWordDocMultiYear import createIndividualWordDocMultiYear
+from models.createInvoicePDF import create_confirmation_invoice, create_confirmation_invoices
+from models.createConfirmationEmail import create_confirmation_email
+from pdf_to_images import pdf_to_images
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+LANGUAGES = ('EN', 'FR')
+INVOICE_ITEMS = 5
+# Summary pages before the parsed ones, bookmarked but without sections, and
+# explanation lines under the sections of the parsed ones
+OVERVIEW_PAGES = 4
+NOTE_LINES = 30
+LONG_SERVICE = {
+    'en': "including slips, carry-forward amounts and prior-year adjustments",
+    'fr': "avec les feuillets, les reports et les ajustements des années antérieures",
+}
+
+# (language, extractor, section title, second argument: 'year' or 'province')
+EXTRACTORS = [
+    ('EN', extract_tax_summary, "Tax return summary", 'year'),
+    ('EN', extract_gst_credit, "GST/HST Tax Credit", 'year'),
+    ('EN', extract_ecgeb_credit, "Estimated of the Canada Groceries", 'year'),
+    ('EN', extract_solidarity_credit, "Solidarity Tax Credit", 'year'),
+    ('EN', extract_child_benefit, "calculation for the Canada Child Benefit (CCB)", 'year'),
+    ('EN', extract_family_allowance, "Family allowance measure", 'year'),
+    ('EN', extract_carryforward_summary, "Summary of Carryforward Amounts", 'province'),
+    ('EN', extract_carbon_rebate, "Canada carbon rebate", 'year'),
+    ('EN', extract_ontario_trillium, "Ontario Trillium Benefit", 'year'),
+    ('EN', extract_climate_action_credit, "British Columbia Climate Action Tax Credit", 'year'),
+    ('FR', extract_tax_summaryFR, "Sommaire de la déclaration", 'year'),
+    ('FR', extract_gst_creditFR, "Estimation du crédit pour la TPS/TVH", 'year'),
+    ('FR', extract_ecgeb_creditFR, "Estimation de l'allocation canadienne pour l'épicerie", 'year'),
+    ('FR', extract_solidarity_creditFR, "Estimation du calcul du crédit d'impôt pour solidarité", 'year'),
+    ('FR', extract_child_benefitFR, "l'allocation canadienne pour enfants", 'year'),
+    ('FR', extract_family_allowanceFR, "la mesure de l'Allocation famille", 'year'),
+    ('FR', extract_carryforward_summaryFR, "Sommaire des montants reportés", 'province'),
+    ('FR', extract_carbon_rebateFR, "remise canadienne sur le carbone", 'year'),
+    ('FR', extract_ontario_trilliumFR, "prestation Trillium de l'Ontario", 'year'),
+]
+
+
+class Workspace:
+    """Synthetic inputs shared by the cases, generated once per language and size."""
+
+    def __init__(self, root, pages):
+        self.root = root
+        self.pages = pages
+        self._cache = {}
+
+    def path(self, *parts):
+        path = os.path.join(self.root, *parts)
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def _cached(self, key, build):
+        if key not in self._cache:
+            self._cache[key] = build()
+        return self._cache[key]
+
+    def client_files(self, language, size):
+        return self._cached(('returns', language, size), lambda: build_client_files(
+            self.path('returns', language, str(size)), size, language=language, filler_pages=self.pages,
+            overview_pages=OVERVIEW_PAGES, note_lines=NOTE_LINES))
+
+    def split_files(self, language, size):
+        """Client files after splitting, as create_summary_documents receives them."""
+        def build():
+            out = self.path('split', language, str(size))
+            prepared = []
+            for client_file in self.client_files(language, size):
+                split = split_return(client_file['directory'], out, CONFIGURATION)
+                prepared.append({**client_file, 'year': split['year'], 'language': split['language'],
+                                 'summary_file_path': split['summary_file_path'],
+                                 'summary_outline': split['summary_outline'],
+                                 'layout_profile': split['layout_profile']})
+            return prepared
+        return self._cached(('split', language, size), build)
+
+    def summarized_files(self, language, size):
+        def build():
+            return [{**cf, 'summary': extract_return_summary(cf['summary_file_path'], cf['language'], cf['year'],
+                                                             cf['summary_outline'], cf['layout_profile'])}
+                    for cf in self.split_files(language, size)]
+        return self._cached(('summarized', language, size), build)
+
+    def sections(self, language, title, size):
+        """`size` line lists of one section, cycling over clients that have it (one per province at least)."""
+        def build():
+            available = [
+                prepare_summary(cf['summary_file_path'], language)['sections'].get(title)
+                for cf in self.split_files(language, max(size, 3))
+            ]
+            available = [lines for lines in available if lines]
+            return [available[i % len(available)] for i in range(size)] if available else []
+        return self._cached(('sections', language, title, size), build)
+
+
+def _split_case(language):
+    def setup(ws, size):
+        client_files = ws.client_files(language, size)
+        out = ws.path('bench-split', language)
+        return (lambda: [split_return(cf['directory'], out, CONFIGURATION) for cf in client_files]), size
+    return f"split_return:{language}", setup
+
+
+def _prepare_case(language, mode='clip'):
+    """
+    prepare_summary as the pipeline runs it (mode 'clip': outline and layout
+    profile), or scanning every page for the titles ('scan').
+    """
+    def setup(ws, size):
+        files = [(cf['summary_file_path'], cf['summary_outline'] if mode == 'clip' else None,
+                  cf['layout_profile'] if mode == 'clip' else None)
+                 for cf in ws.split_files(language, size)]
+        return (lambda: [prepare_summary(path, language, outline, profile) for path, outline, profile in files]), size
+    return f"prepare_summary:{language}" if mode == 'clip' else f"prepare_summary_{mode}:{language}", setup
+
+
+def _extract_case(language, extractor, title, argument):
+    def setup(ws, size):
+        sections = ws.sections(language, title, size)
+        if argument == 'province':
+            value = 'Quebec' if language == 'EN' else 'Québec'
+        else:
+            value = YEAR
+        return (lambda: [extractor(lines, value) for lines in sections]), len(sections)
+    return f"extract:{extractor.__name__}", setup
+
+
+def _pipeline_case(language):
+    def setup(ws, size):
+        split_files = ws.split_files(language, size)
+        out = ws.path('bench-pipeline', language)
+        return (lambda: create_summary_documents(split_files, out)), size
+    return f"summary_documents:{language}", setup
+
+
+def _docx_case(language, kind):
+    def setup(ws, size):
+        out = ws.path('bench-docx', language, kind)
+        summarized = ws.summarized_files(language, max(size, 2))
+        if kind == 'individual':
+            jobs = [(createIndividualWordDoc, cf) for cf in summarized[:size]]
+        elif kind == 'couple':
+            couples = pair_as_couples(summarized)
+            pairs = [couples[i:i + 2] for i in range(0, len(couples) - 1, 2)]
+            jobs = [(createCoupleWordDoc, pairs[i % len(pairs)]) for i in range(size)]
+        else:
+            jobs = [
+                (createIndividualWordDocMultiYear, [{**cf, 'year': cf['year'] - offset} for offset in (2, 1, 0)])
+                for cf in summarized[:size]
+            ]
+
+        def run():
+            for i, (builder, argument) in enumerate(jobs):
+                builder(argument, os.path.join(out, f"{kind}-{i}.docx"))
+        return run, size
+    return f"docx:{kind}:{language}", setup
+
+
+def _invoice_case(variant):
+    language, province = {'en': ('en', 'ON'), 'fr': ('fr', 'QC'), 'bilingual': ('en', 'QC')}[variant]
+
+    def setup(ws, size):
+        out = ws.path('bench-invoice', variant)
+        selected_prices, invoice_details, tax_rate, include_taxes, _ = build_invoice_job(INVOICE_ITEMS, language, province)
+        jobs = [{**invoice_details, 'name': f"Synthetic Client {i}"} for i in range(size)]
+        return (lambda: [
+            create_confirmation_invoice(out, selected_prices, details, tax_rate, include_taxes, language) for details in jobs
+        ]), size
+    return f"invoice:{variant}", setup
+
+
+def _invoice_items_case(variant):
+    """One invoice with `size` line items; every fifth description is long enough to wrap."""
+    language, province = {'en': ('en', 'ON'), 'fr': ('fr', 'QC'), 'bilingual': ('en', 'QC')}[variant]
+
+    def setup(ws, size):
+        out = ws.path('bench-invoice-items', variant)
+        selected_prices, invoice_details, tax_rate, include_taxes, _ = build_invoice_job(size, language, province)
+        for price in selected_prices[::5]:
+            price['service'] = {lang: f"{name} {LONG_SERVICE[lang]}" for lang, name in price['service'].items()}
+        return (lambda: create_confirmation_invoice(out, selected_prices, invoice_details, tax_rate, include_taxes, language)), size
+    return f"invoice_items:{variant}", setup
+
+
+def _invoice_batch_case(combined):
+    def setup(ws, size):
+        out = ws.path('bench-invoice-batch', 'combined' if combined else 'files')
+        jobs = []
+        for i in range(size):
+            language, province = (('en', 'ON'), ('fr', 'QC'), ('en', 'QC'))[i % 3]
+            selected_prices, invoice_details, tax_rate, include_taxes, _ = build_invoice_job(INVOICE_ITEMS, language, province)
+            jobs.append({
+                'directory': out, 'selected_prices': selected_prices, 'tax_rate': tax_rate,
+                'invoice_details': {**invoice_details, 'name': f"Synthetic Client {i}"},
+                'include_taxes': include_taxes, 'language': language,
+            })
+        combined_path = os.path.join(out, 'combined.pdf') if combined else None
+        return (lambda: create_confirmation_invoices(jobs, combined_path)), size
+    return "invoice_batch:combined" if combined else "invoice_batch", setup
+
+
+def _email_case(language):
+    def setup(ws, size):
+        out = ws.path('bench-email', language)
+        selected_prices, _, tax_rate, include_taxes, _ = build_invoice_job(INVOICE_ITEMS, language, 'QC')
+        jobs = [[
+            {'title': 'Mr', 'name': f"Client {i} A", 'years': [{'year': 2024, 'confirmationNumbers': {'federal': f"F{i}", 'quebec': f"Q{i}"}}]},
+            {'title': 'Ms', 'name': f"Client {i} B", 'years': [{'year': 2024, 'confirmationNumbers': {'federal': f"G{i}", 'quebec': 'Mail QC'}}]},
+        ] for i in range(size)]
+        return (lambda: [
+            create_confirmation_email(out, clients, selected_prices, tax_rate, include_taxes, language.lower()) for clients in jobs
+        ]), size
+    return f"confirmation_email:{language}", setup
+
+
+def _confirmation_batch_case(workers):
+    def setup(ws, size):
+        out = ws.path('bench-confirmation-batch', str(workers))
+        selected_prices, invoice_details, tax_rate, include_taxes, _ = build_invoice_job(INVOICE_ITEMS, 'en', 'QC')
+        jobs = [{
+            'directory': out, 'selected_prices': selected_prices, 'tax_rate': tax_rate,
+            'include_taxes': include_taxes, 'language': ('en', 'fr')[i % 2],
+            'clients': [{'title': 'Mr', 'name': f"Client {i}", 'years': [{'year': 2024, 'confirmationNumbers': {'federal': f"F{i}", 'quebec': f"Q{i}"}}]}],
+            'invoice_details': {**invoice_details, 'name': f"Synthetic Client {i}"},
+        } for i in range(size)]
+        return (lambda: create_confirmation_documents(jobs, workers)), size
+    return f"confirmation_batch:{workers}", setup
+
+
+def _images_case():
+    def setup(ws, size):
+        path = os.path.join(ws.path('bench-images'), f"upload-{size}.pdf")
+        build_form_pdf(path, size)
+        with open(path, 'rb') as f:
+            pdf_base64 = base64.b64encode(f.read()).decode('utf-8')
+        return (lambda: pdf_to_images(pdf_base64, 'upload')), size
+    return "pdf_to_images", setup
+
+
+def all_cases():
+    cases = [_split_case(lang) for lang in LANGUAGES]
+    cases += [_prepare_case(lang, mode) for lang in LANGUAGES for mode in ('clip', 'scan')]
+    cases += [_extract_case(*extractor) for extractor in EXTRACTORS]
+    cases += [_docx_case(lang, kind) for kind in ('individual', 'couple', 'multiyear') for lang in LANGUAGES]
+    cases += [_pipeline_case(lang) for lang in LANGUAGES]
+    cases += [_invoice_case(variant) for variant in ('en', 'fr', 'bilingual')]
+    cases += [_invoice_items_case(variant) for variant in ('en', 'fr', 'bilingual')]
+    cases += [_invoice_batch_case(combined) for combined in (False, True)]
+    cases += [_email_case(lang) for lang in LANGUAGES]
+    cases += [_confirmation_batch_case(workers) for workers in (1, 4)]
+    cases.append(_images_case())
+    return cases
+
+
+def measure(run, repeat):
+    """Wall times of `repeat` runs plus the tracemalloc peak (KiB) of one more run."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return times, peak / 1024
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(sizes, repeat=3, only=None, pages=20, workdir=None, log=print):
+    """Run the selected cases at every size and return the results document."""
+    root = workdir or tempfile.mkdtemp(prefix="tax-bench-")
+    # The 'clip' cases read the synthetic returns through their layout profiles
+    register_synthetic_profiles()
+    ws = Workspace(root, pages)
+    results = {}
+    try:
+        for name, setup in all_cases():
+            if only and not any(name.startswith(prefix) for prefix in only):
+                continue
+            for size in sizes:
+                run, items = setup(ws, size)
+                if not items:
+                    continue
+                times, peak_kib = measure(run, repeat)
+                best = min(times)
+                results[f"{name}@{size}"] = {
+                    'case': name,
+                    'size': size,
+                    'items': items,
+                    'min_s': round(best, 6),
+                    'mean_s': round(sum(times) / len(times), 6),
+                    'items_per_s': round(items / best, 2) if best else None,
+                    'peak_kib': round(peak_kib, 1),
+                }
+                log(f"{name + '@' + str(size):<48} {best * 1000:10.1f} ms {items / best if best else 0:10.1f}/s {peak_kib:10.0f} KiB")
+    finally:
+        if not workdir:
+            shutil.rmtree(root, ignore_errors=True)
+
+    return {
+        'meta': {
+            'commit': git_commit(),
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'sizes': sizes,
+            'repeat': repeat,
+            'pages': pages,
+        },
+        'results': results,
+    }
+
+
+def compare(current, baseline, log=print):
+    """Print min-time ratios (current / baseline) for the cases present in both result documents."""
+    log(f"{'case':<48} {'baseline ms':>12} {'current ms':>12} {'ratio':>7}")
+    for key, result in current['results'].items():
+        previous = baseline['results'].get(key)
+        if not previous or not previous['min_s']:
+            continue
+        ratio = result['min_s'] / previous['min_s']
+        log(f"{key:<48} {previous['min_s'] * 1000:12.1f} {result['min_s'] * 1000:12.1f} {ratio:7.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the document pipeline on synthetic returns.")
+    parser.add_argument('--sizes', default="1,10", help="comma-separated item counts per case (default: 1,10)")
+    parser.add_argument('--repeat', type=int, default=3, help="timed runs per case and size (default: 3)")
+    parser.add_argument('--only', default="", help="comma-separated case name prefixes, e.g. split,extract:,invoice")
+    parser.add_argument('--pages', type=int, default=20, help="filler form pages per synthetic return (default: 20)")
+    parser.add_argument('--workdir', help="keep the generated inputs and outputs in this directory")
+    parser.add_argument('--output', help="results JSON path (default: benchmarks/results/<commit>.json)")
+    parser.add_argument('--compare', help="previous results JSON to compare against")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    only = [prefix.strip() for prefix in args.only.split(',') if prefix.strip()]
+    document = run_benchmarks(sizes, repeat=args.repeat, only=only, pages=args.pages, workdir=args.workdir)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{document['meta']['commit'] or 'results'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(document, f, indent=2, ensure_ascii=False)
+    print(f"Results written to {output}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            compare(document, json.load(f))
+    return document
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,420 @@
+"""
+Synthetic tax return PDFs for benchmarks and tests.
+
+Builds EN and FR returns with fitz that look like the tax software's output as far
+as the pipeline is concerned: a cover page whose second line carries the taxation
+year, an outline with the executive summary, summary and authorization bookmarks (and
+one per section on the summary pages), summary pages laid out line by line in the
+format the extractors parse, and filler form pages to give the splitter realistic
+work. No client data is involved; names
+and SINs are generated.
+"""
+
+import os
+
+import fitz  # PyMuPDF
+
+from models.createSummary import TITLES, TITLES_FR, is_title
+from models.summaryLayout import register_profile
+
+YEAR = 2024
+
+FIRST_NAMES = ["Alex", "Sam", "Jordan", "Camille", "Dominique", "Morgan", "Charlie", "Noa"]
+LAST_NAMES = ["Tremblay", "Gagnon", "Roy", "Smith", "Martin", "Lee", "Bouchard", "Wilson"]
+PROVINCES = {
+    'EN': ["Quebec", "Ontario", "British Columbia"],
+    'FR': ["Québec", "Ontario", "Colombie-Britannique"],
+}
+
+MONTHS_EN = ["July", "August", "September", "October", "November", "December",
+             "January", "February", "March", "April", "May", "June"]
+MONTHS_FR = ["Juillet", "Août", "Septembre", "Octobre", "Novembre", "Décembre",
+             "Janvier", "Février", "Mars", "Avril", "Mai", "Juin"]
+
+# Bookmark titles per language: cover, overview and summary pages, authorizations
+OUTLINE = {
+    'EN': {
+        'cover': "Executive summary",
+        'overview': "Two-year comparison",
+        'summary': ["Tax return summary", "Benefits and credits", "Provincial benefits", "Summary of carryforward amounts"],
+        'fed_auth': "T183 Authorization",
+        'qc_auth': "TP-1000 Authorization",
+        'form': "T1 General",
+    },
+    'FR': {
+        'cover': "Sommaire principal",
+        'overview': "Comparaison sur deux ans",
+        'summary': ["Sommaire de la déclaration", "Prestations et crédits", "Prestations provinciales", "Sommaire des montants reportés"],
+        'fed_auth': "T183 Autorisation",
+        'qc_auth': "TP-1000 Autorisation",
+        'form': "Déclaration T1",
+    },
+}
+
+# Section configuration as saved by the Summary config screen
+CONFIGURATION = {
+    'summarySection': {lang.lower(): [OUTLINE[lang]['overview']] + OUTLINE[lang]['summary'] for lang in OUTLINE},
+    'fedAuthSection': {lang.lower(): ["T183"] for lang in OUTLINE},
+    'qcAuthSection': {lang.lower(): ["TP-1000"] for lang in OUTLINE},
+}
+
+NOTE = "* Estimates are based on the information in this return."
+LINE_HEIGHT = 11
+FONT_SIZE = 6.5
+TOP, LEFT = 72, 36
+# Below the longest summary page (the benefits page of 24 lines)
+NOTES_TOP = 400
+COVER = {
+    'EN': "Synthetic Tax Software - Client copy",
+    'FR': "Logiciel d'impôt synthétique - Copie du client",
+}
+
+
+def _amount_en(cents):
+    return f"{cents // 100:,} {cents % 100:02d}"
+
+
+def _amount_fr(cents):
+    return f"{cents // 100:,} {cents % 100:02d}".replace(",", " ")
+
+
+def client_identity(index, language):
+    """Deterministic SIN, names and province for the index-th synthetic client."""
+    sin = f"{900000000 + index * 7919:09d}"
+    first = FIRST_NAMES[index % len(FIRST_NAMES)]
+    last = f"{LAST_NAMES[(index // len(FIRST_NAMES)) % len(LAST_NAMES)]}{index}"
+    province = PROVINCES[language][index % 3]
+    return sin, first, last, province
+
+
+def _sections(*sections):
+    """Join section blocks, closing each with a note line.
+
+    prepare_summary drops the line right before a title (it matches the title on the
+    line + next line pair), so the data lines must not be last before a title.
+    """
+    lines = []
+    for section in sections:
+        lines += section + [NOTE]
+    return lines
+
+
+def summary_pages_en(first, last, province, year=YEAR, seed=0):
+    """Lines of the four EN summary pages (one list of lines per bookmarked page)."""
+    y1, y2 = year + 1, year + 2
+    base = 100 + seed % 50
+    monthly = [base * 100 + 33] * 12
+    quebec = province == "Quebec"
+    tax = [
+        "Tax return summary",
+        f"First name {first}",
+        f"Last name {last}",
+        f"Province of residence {province}",
+        f"Refund 48400 {_amount_en(123456 + seed)}",
+    ]
+    if quebec:
+        tax.append(f"Refund 478 = {_amount_en(56789 + seed)}")
+    benefits = _sections([
+        "GST/HST Tax Credit",
+        f"Goods and Services Tax Credit (if line 24 is less than $1, enter zero). {_amount_en(51900)}",
+        f"July {y1} {_amount_en(12975)} January {y2} {_amount_en(12975)}",
+        f"October {y1} {_amount_en(12975)} April {y2} {_amount_en(12975)}",
+    ], [
+        "Estimated of the Canada Groceries and Essentials Benefit",
+        f"Canada Groceries and Essentials Benefit (if line 24 is less than $1, enter zero). {_amount_en(40000)}",
+        f"July {y1} {_amount_en(10000)} January {y2} {_amount_en(10000)}",
+        f"October {y1} {_amount_en(10000)} April {y2} {_amount_en(10000)}",
+    ], [
+        "Estimated calculation for the Canada Child Benefit (CCB)",
+        f"Total entitlement = {_amount_en(sum(monthly))}",
+    ] + [
+        f"{month} {y1 if i < 6 else y2} 2 0 0 {_amount_en(monthly[i])}"
+        for i, month in enumerate(MONTHS_EN)
+    ])
+    if quebec:
+        provincial = _sections([
+            "Solidarity Tax Credit",
+            " ".join(f"{m} {y1} {_amount_en(9150)}" for m in MONTHS_EN[:6]),
+            " ".join(f"{m} {y2} {_amount_en(9150)}" for m in MONTHS_EN[6:]),
+        ], ["Family allowance measure"] + [
+            f"{month} {yr} 2 0 0 {_amount_en(75000)} {_amount_en(25000)}"
+            for month, yr in (("July", y1), ("October", y1), ("January", y2), ("April", y2))
+        ])
+    elif province == "Ontario":
+        provincial = _sections(["Ontario Trillium Benefit"] + [
+            f"{a} {y1} {_amount_en(3000)} {b} {y2} {_amount_en(3000)}"
+            for a, b in zip(MONTHS_EN[:6], MONTHS_EN[6:])
+        ], [
+            "Canada carbon rebate",
+            f"Line 5 plus line 6 {_amount_en(56000)}",
+            f"April {y1} {_amount_en(14000)} October {y1} {_amount_en(14000)}",
+            f"July {y1} {_amount_en(14000)} January {y2} {_amount_en(14000)}",
+        ])
+    else:
+        provincial = _sections([
+            "British Columbia Climate Action Tax Credit",
+            f"July {y1} {_amount_en(12600)} January {y2} {_amount_en(12600)}",
+            f"October {y1} {_amount_en(12600)} April {y2} {_amount_en(12600)}",
+        ])
+    carryforward = ["Summary of Carryforward Amounts"]
+    if quebec:
+        carryforward += [
+            "Tuition and educations amounts - federal 5,000 Schedule 11",
+            "Tuition and educations amounts (20%) - Quebec 1,000 Schedule T",
+            "Tuition and educations amounts (8%) - Quebec 4,000 Schedule T",
+        ]
+    else:
+        carryforward += ["Tuition and educations amounts 5,000 Schedule 11"]
+    return [tax, benefits, provincial, carryforward]
+
+
+def summary_pages_fr(first, last, province, year=YEAR, seed=0):
+    """Lines of the four FR summary pages (one list of lines per bookmarked page)."""
+    y1, y2 = year + 1, year + 2
+    base = 100 + seed % 50
+    monthly = [base * 100 + 33] * 12
+    quebec = province == "Québec"
+    tax = [
+        "Sommaire de la déclaration",
+        f"Prénom {first}",
+        f"Nom {last}",
+        f"Province de résidence {province}",
+        f"Remboursement 48400 {_amount_fr(123456 + seed)}",
+    ]
+    if quebec:
+        tax.append(f"Remboursement 478 = {_amount_fr(56789 + seed)}")
+    benefits = _sections([
+        "Estimation du crédit pour la TPS/TVH",
+        f"Crédit pour taxe sur les produits et services (si la ligne 24 est moins de 1 $, inscrivez zéro). {_amount_fr(51900)}",
+        f"juillet {y1} {_amount_fr(12975)} janvier {y2} {_amount_fr(12975)}",
+        f"octobre {y1} {_amount_fr(12975)} avril {y2} {_amount_fr(12975)}",
+    ], [
+        "Estimation de l'allocation canadienne pour l'épicerie et les besoins essentiels",
+        f"juillet {y1} {_amount_fr(10000)} janvier {y2} {_amount_fr(10000)}",
+        f"octobre {y1} {_amount_fr(10000)} avril {y2} {_amount_fr(10000)}",
+    ], [
+        "Estimation de l'allocation canadienne pour enfants",
+        f"Prestation totale = {_amount_fr(sum(monthly))}",
+    ] + [
+        f"{month} {y1 if i < 6 else y2} 2 0 0 {_amount_fr(monthly[i])}"
+        for i, month in enumerate(MONTHS_FR)
+    ])
+    if quebec:
+        provincial = _sections([
+            "Estimation du calcul du crédit d'impôt pour solidarité",
+            " ".join(f"{m} {y1} {_amount_fr(9150)}" for m in MONTHS_FR[:6]),
+            " ".join(f"{m} {y2} {_amount_fr(9150)}" for m in MONTHS_FR[6:]),
+        ], ["Estimation de la mesure de l'Allocation famille"] + [
+            f"{month} {yr} 2 0 0 {_amount_fr(75000)} {_amount_fr(25000)}"
+            for month, yr in (("Juillet", y1), ("Octobre", y1), ("Janvier", y2), ("Avril", y2))
+        ])
+    elif province == "Ontario":
+        provincial = _sections(["Estimation de la prestation Trillium de l'Ontario"] + [
+            f"{a} {y1} {_amount_fr(3000)} {b} {y2} {_amount_fr(3000)}"
+            for a, b in zip(MONTHS_FR[:6], MONTHS_FR[6:])
+        ], [
+            "Estimation de la remise canadienne sur le carbone",
+            f"avril {y1} {_amount_fr(14000)} octobre {y1} {_amount_fr(14000)}",
+            f"juillet {y1} {_amount_fr(14000)} janvier {y2} {_amount_fr(14000)}",
+        ])
+    else:
+        provincial = [NOTE]
+    carryforward = ["Sommaire des montants reportés"]
+    carryforward += [
+        "Frais de scolarité et montant relatif aux études - fédéral 5 000 Annexe 11",
+        "Frais de scolarité et montant relatif aux études (20%) - Québec 1 000 Annexe T",
+        "Frais de scolarité et montant relatif aux études (8%) - Québec 4 000 Annexe T",
+    ]
+    return [tax, benefits, provincial, carryforward]
+
+
+def _write_lines(page, lines, top=TOP, left=LEFT):
+    y = top
+    for line in lines:
+        page.insert_text((left, y), line, fontname="helv", fontsize=FONT_SIZE)
+        y += LINE_HEIGHT
+
+
+def _filler_lines(page_number, count=60):
+    return [
+        f"Line {10000 + page_number * 100 + i} Amount from schedule {i} of form page {page_number} "
+        f"................................ {_amount_en((page_number * 977 + i * 131) % 1000000)}"
+        for i in range(count)
+    ]
+
+
+def _section_bookmarks(title, lines, language):
+    """Level 2 bookmarks for the sections of a summary page, other than one named like the page."""
+    titles = TITLES_FR if language == 'FR' else TITLES
+    return [line for line in lines if is_title(line, titles) and line.lower() != title.lower()]
+
+
+def _notes(count):
+    """Explanatory lines in the lower part of a summary page, which no extractor reads."""
+    sentences = [
+        "Amounts are estimates based on the information available when this return was prepared.",
+        "Payments may change if your situation changes or if the agency reassesses the return.",
+        "Keep this page with your records; it is not a notice of assessment.",
+    ]
+    return [sentences[i % len(sentences)] for i in range(count)]
+
+
+def build_return(path, index, language='EN', year=YEAR, filler_pages=20, with_quebec_auth=None, overview_pages=0,
+                 note_lines=0):
+    """
+    Write one synthetic return to `path` and return its expected identity.
+
+    Page layout: cover, `overview_pages` summary pages the extractors do not
+    parse, 4 summary pages, `filler_pages` form pages with the federal (and, for
+    Quebec residents, provincial) authorization forms in the middle. Summary
+    pages end with `note_lines` lines of explanations from NOTES_TOP down.
+    """
+    sin, first, last, province = client_identity(index, language)
+    outline = OUTLINE[language]
+    pages_builder = summary_pages_en if language == 'EN' else summary_pages_fr
+    summary = pages_builder(first, last, province, year=year, seed=index)
+    if with_quebec_auth is None:
+        with_quebec_auth = province in ("Quebec", "Québec")
+
+    doc = fitz.open()
+    toc = []
+
+    cover = doc.new_page()
+    if language == 'EN':
+        header = [COVER[language], f"T1 return for the {year} taxation year"]
+    else:
+        header = [COVER[language], f"Déclaration pour l'année d'imposition {year}"]
+    _write_lines(cover, header + [f"{first} {last}", outline['cover']])
+    toc.append([1, outline['cover'], 1])
+
+    for number in range(overview_pages):
+        page = doc.new_page()
+        _write_lines(page, _filler_lines(number))
+        toc.append([1, f"{outline['overview']} {number + 1}", page.number + 1])
+
+    for title, lines in zip(outline['summary'], summary):
+        page = doc.new_page()
+        _write_lines(page, lines)
+        _write_lines(page, _notes(note_lines), top=NOTES_TOP)
+        toc.append([1, title, page.number + 1])
+        toc += [[2, section, page.number + 1] for section in _section_bookmarks(title, lines, language)]
+
+    auth_at = max(filler_pages // 2, 0)
+    for i in range(filler_pages):
+        if i == auth_at:
+            page = doc.new_page()
+            _write_lines(page, [outline['fed_auth'], f"{first} {last}", f"SIN {sin}"] + _filler_lines(i, 20))
+            toc.append([1, outline['fed_auth'], page.number + 1])
+            if with_quebec_auth:
+                page = doc.new_page()
+                _write_lines(page, [outline['qc_auth'], f"{first} {last}"] + _filler_lines(i, 20))
+                toc.append([1, outline['qc_auth'], page.number + 1])
+        page = doc.new_page()
+        _write_lines(page, _filler_lines(i))
+        if i == 0:
+            toc.append([1, outline['form'], page.number + 1])
+
+    doc.set_toc(toc)
+    doc.save(path, garbage=3, deflate=True)
+    doc.close()
+    return {'sin': sin, 'first_name': first, 'last_name': last, 'province': province, 'year': year}
+
+
+def layout_profile(language):
+    """
+    summaryLayout sections of the synthetic summary pages, measured from the
+    lines every province gets. A table ends before the note closing it, or
+    above the explanations when its section is the last of the page.
+    """
+    titles = TITLES_FR if language == 'FR' else TITLES
+    pages_builder = summary_pages_en if language == 'EN' else summary_pages_fr
+    sections = {}
+    for province in PROVINCES[language]:
+        for lines in pages_builder("First", "Last", province):
+            starts = [(index, is_title(line, titles)) for index, line in enumerate(lines) if is_title(line, titles)]
+            for (start, title), following in zip(starts, starts[1:] + [(None, None)]):
+                # Band of a line: 8 points above its baseline to 3 below
+                top = TOP + start * LINE_HEIGHT - 8
+                if following[0] is None:
+                    bottom = NOTES_TOP - 8 - top
+                else:
+                    bottom = (following[0] - 1 - start) * LINE_HEIGHT
+                section = {
+                    'anchor': (LEFT - 6, top, 580, top + LINE_HEIGHT),
+                    'table': (0, LINE_HEIGHT, 550, bottom),
+                }
+                known = sections.setdefault(title, section)
+                if known != section:
+                    raise ValueError(f"{title} moves between provinces")
+    return sections
+
+
+def register_synthetic_profiles():
+    """Register the layout profile of the synthetic returns of each language; returns their names."""
+    return [register_profile(f"synthetic-{language.lower()}", COVER[language], language, layout_profile(language))
+            for language in OUTLINE]
+
+
+def build_form_pdf(path, page_count):
+    """Write a `page_count`-page PDF of form pages (the kind of upload pdf_to_images converts)."""
+    doc = fitz.open()
+    for i in range(page_count):
+        _write_lines(doc.new_page(), _filler_lines(i))
+    doc.save(path, garbage=3, deflate=True)
+    doc.close()
+
+
+def build_client_files(directory, count, language='EN', year=YEAR, filler_pages=20, start=0, **options):
+    """
+    Write `count` returns into `directory` and return client_files entries as the
+    UI sends them. `options` go to build_return.
+    """
+    os.makedirs(directory, exist_ok=True)
+    client_files = []
+    for index in range(start, start + count):
+        sin, first, last, _ = client_identity(index, language)
+        path = os.path.join(directory, f"{sin} - {first} {last}.pdf")
+        build_return(path, index, language=language, year=year, filler_pages=filler_pages, **options)
+        client_files.append({
+            'directory': path,
+            'label': f"{first} {last}",
+            'coupleWith': 'Individual Summary',
+            'isPrimary': True,
+            'title': 'Mr',
+            'isMailQC': False,
+            'isNewcomer': False,
+        })
+    return client_files
+
+
+def pair_as_couples(client_files):
+    """Mark consecutive client files as couples (primary first), leaving an odd last one individual."""
+    paired = [dict(cf) for cf in client_files]
+    for primary, secondary in zip(paired[0::2], paired[1::2]):
+        primary.update({'coupleWith': secondary['label'], 'isPrimary': True})
+        secondary.update({'coupleWith': secondary['label'], 'isPrimary': False, 'title': 'Ms'})
+    return paired
+
+
+def build_invoice_job(item_count, language='en', province='QC'):
+    """Arguments for create_confirmation_invoice with `item_count` priced lines."""
+    selected_prices = [
+        {
+            'service': {'en': f"Tax return preparation - service {i}", 'fr': f"Préparation de déclaration - service {i}"},
+            'amount': 45.0 + (i % 7) * 12.5,
+            'quantity': 1 + i % 3,
+            'type': 'number',
+        }
+        for i in range(item_count)
+    ]
+    invoice_details = {
+        'invoiceNumber': 4242,
+        'name': 'Synthetic Client',
+        'fullName': 'Synthetic Client',
+        'address': '1 Example Street, Montreal QC',
+        'email': 'client@example.com',
+        'phoneNumber': '555-0100',
+        'notes': 'Thank you',
+    }
+    tax_rate = {'province': province, 'fedRate': 5, 'provRate': 9.975}
+    return selected_prices, invoice_details, tax_rate, True, language
@@ -0,0 +1 @@
+# Lets the tests import `models.*` the same way the entry-point scripts do.
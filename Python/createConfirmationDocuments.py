@@ -1,72 +1,119 @@
-import sys
+import contextvars
 import json
-import ast
-from json.decoder import JSONDecodeError
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from models.instrumentation import job
+from models.jobManifest import load_manifest, manifest_source
+from models.profiling import profiled_client, profiled_job
 
-from models.createConfirmationEmail import create_confirmation_email
-from models.createInvoicePDF import create_confirmation_invoice
+# Payload fields a household may override
+HOUSEHOLD_FIELDS = ('selected_prices', 'tax_rate', 'include_taxes', 'language')
 
 
-def _parse_arg(arg_str, name="arg"):
+def household_jobs(payload):
     """
-    Attempt to parse a CLI argument as JSON, falling back to Python literal eval
-    or simple single-quote replacement.
+    One email/invoice job per household. Without `households` the payload is a
+    single household; with it, each household has its clients and invoice
+    details and may override the payload's prices, rates, taxes and language.
+    """
+    households = payload.get('households') or [
+        {'clients': payload['clients'], 'invoice_details': payload['invoice_details']}
+    ]
+    return [
+        {
+            'directory': payload['directory'],
+            'clients': household['clients'],
+            'invoice_details': household['invoice_details'],
+            **{field: household.get(field, payload[field]) for field in HOUSEHOLD_FIELDS},
+        }
+        for household in households
+    ]
+
 
-    Raises ValueError if parsing fails.
+def render_households(jobs, combined_invoice=None):
+    """
+    Price the household jobs once, then write their emails and invoices in this
+    process: every email in one batch on one thread and every invoice in one
+    batch on another, so python-docx and PyMuPDF each stay on a single thread.
+    With `combined_invoice`, the invoices are also saved together in that PDF.
+    Returns the documents, one {'email', 'invoice', 'timings'} dict per job,
+    and the pricing time.
     """
-    if arg_str is None:
-        return None
+    # Deferred until the arguments are parsed: python-docx and fitz dominate start-up
+    from models.createConfirmationEmail import create_confirmation_emails
+    from models.createInvoicePDF import create_confirmation_invoices
+    from models.pricing import price_batch
 
-    try:
-        return json.loads(arg_str)
-    except JSONDecodeError:
-        pass
+    start = time.perf_counter()
+    # The email and the invoice print the same amounts
+    pricings = price_batch([(j['selected_prices'], j['tax_rate'], j['include_taxes']) for j in jobs])
+    jobs = [{**j, 'pricing': pricing} for j, pricing in zip(jobs, pricings)]
+    pricing_s = round(time.perf_counter() - start, 6)
 
-    try:
-        return ast.literal_eval(arg_str)
-    except Exception:
-        pass
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        # In copies of this context, so the renderers' spans go to the current job
+        emails = pool.submit(contextvars.copy_context().run, create_confirmation_emails, jobs, timed=True)
+        invoices = pool.submit(contextvars.copy_context().run, create_confirmation_invoices, jobs, combined_invoice,
+                               timed=True)
+        emails, invoices = emails.result(), invoices.result()
+    documents = [
+        {'email': email, 'invoice': invoice, 'timings': {'email_s': email_s, 'invoice_s': invoice_s}}
+        for (email, email_s), (invoice, invoice_s) in zip(emails, invoices)
+    ]
+    return {'documents': documents, 'pricing_s': pricing_s}
 
-    try:
-        return json.loads(arg_str.replace("'", '"'))
-    except Exception:
-        raise ValueError(f"Unable to parse {name} argument as JSON: {arg_str}")
+
+def create_confirmation_documents(jobs, workers=1, combined_invoice=None):
+    """
+    Write the confirmation documents of every household job, in order. With
+    more than one worker the jobs are split into contiguous chunks rendered by a
+    process pool; each worker builds its own cached templates. With
+    `combined_invoice`, every invoice is also saved in that one PDF; each worker
+    writes its chunk's part, and the parts are joined in order.
+    """
+    workers = min(workers, len(jobs))
+    if workers <= 1:
+        return render_households(jobs, combined_invoice)
+    size = -(-len(jobs) // workers)
+    chunks = [jobs[start:start + size] for start in range(0, len(jobs), size)]
+    parts = [None] * len(chunks)
+    if combined_invoice:
+        root, extension = os.path.splitext(combined_invoice)
+        parts = [f"{root}.part{index}{extension}" for index in range(len(chunks))]
+    with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+        results = list(pool.map(render_households, chunks, parts))
+    if combined_invoice:
+        from models.createInvoicePDF import combine_invoices
+        combine_invoices(parts, combined_invoice)
+    return {
+        'documents': [document for result in results for document in result['documents']],
+        'pricing_s': round(sum(result['pricing_s'] for result in results), 6),
+    }
 
 
 def main():
-    if len(sys.argv) < 8:
-        print(
-            "Insufficient arguments provided. Usage:\n"
-            "<dir> <clients_json> <selected_prices_json> "
-            "<invoice_details_json> <tax_rate_json> <includeTaxes> <language>"
-        )
-        sys.exit(1)
-
-    directory_path = sys.argv[1]
-    clients = _parse_arg(sys.argv[2], "clients")
-    selected_prices = _parse_arg(sys.argv[3], "selected_prices")
-    invoice_details = _parse_arg(sys.argv[4], "invoice_details")
-    tax_rate = _parse_arg(sys.argv[5], "tax_rate")
-    include_taxes = str(sys.argv[6]).lower() == "true"
-    language = sys.argv[7]
-
-    create_confirmation_email(
-        directory_path,
-        clients,
-        selected_prices,
-        tax_rate,
-        include_taxes,
-        language,
-    )
-
-    create_confirmation_invoice(
-        directory_path,
-        selected_prices,
-        invoice_details,
-        tax_rate,
-        include_taxes,
-        language,
-    )
+    start = time.perf_counter()
+    payload = load_manifest(manifest_source(sys.argv), 'createConfirmationDocuments')['payload']
+    directory_path = payload['directory']
+    jobs = household_jobs(payload)
+
+    client_names = [client['name'] for j in jobs for client in j['clients']]
+    with job('confirmation', households=len(jobs), clients=len(client_names),
+             items=len(payload['selected_prices']), language=payload['language']), \
+            profiled_job('confirmation', directory_path), \
+            profiled_client('confirmation', directory_path, *client_names):
+        result = create_confirmation_documents(jobs, payload.get('workers', 1), payload.get('combined_invoice'))
+
+    # Paths and timings of every artefact, so the UI can tell which one is slow
+    print(json.dumps({
+        'result': 'Documents created successfully.',
+        'documents': result['documents'],
+        **({'combined_invoice': payload['combined_invoice']} if payload.get('combined_invoice') else {}),
+        'timings': {'pricing_s': result['pricing_s'], 'total_s': round(time.perf_counter() - start, 6)},
+    }))
 
 
 if __name__ == "__main__":
@@ -1,10 +1,28 @@
 import sys
-import PyPDF2
 from pathlib import Path
+import io
 import json
+import os
 import re
-
-from models.createSummary import process_summaries
+import time
+
+# PyPDF2, models.summaryLayout and models.createSummary (fitz, python-docx, extractors) are imported where
+# they are first needed, so argument errors are reported without loading them.
+from models.instrumentation import count, job, span, timed
+from models.jobManifest import load_manifest, manifest_source
+from models.profiling import profiled_client, profiled_job
+
+# A read_pdf bookmark line: " > Title (Page 12)"
+BOOKMARK_PATTERN = re.compile(r"^.*? > (.*) \(Page (\d+)\)$")
+# Height of the cover header read for the language and year, in points
+COVER_HEADER_HEIGHT = 160
+# The cover line naming the taxation year, per language
+YEAR_PATTERNS = {
+    'EN': re.compile(r"\bfor\b.*\b(\d{4}) taxation year", re.IGNORECASE),
+    'FR': re.compile(r"pour l['’]année d'imposition (\d{4})", re.IGNORECASE),
+}
+# The taxation year wording looked for when the language comes from the outline
+YEAR_WORDING = {'EN': "taxation year", 'FR': "année d'imposition"}
 
 
 def extract_sin_and_name(file_path):
@@ -20,29 +38,78 @@ def extract_sin_and_name(file_path):
         raise ValueError(f"Filename format is incorrect: {file_name}")
 
 
-def read_pdf(file_path):
+def page_lines(page, header_only=True):
+    """Text lines of an open MuPDF page; with `header_only`, only the band at the top."""
+    import fitz  # PyMuPDF
+
+    clip = fitz.Rect(0, 0, page.rect.width, COVER_HEADER_HEIGHT) if header_only else None
+    return [line.strip() for line in page.get_text("text", clip=clip).splitlines() if line.strip()]
+
+def read_cover_lines(file_path, header_only=True, data=None):
+    """
+    Text lines of the cover page, read by MuPDF; with `header_only`, only the
+    band at the top where the tax software prints its name and the taxation year.
+    `data`, the file's bytes when already read, is used instead of the file.
+    """
+    import fitz  # PyMuPDF
+
+    with (fitz.open(stream=data, filetype='pdf') if data is not None else fitz.open(file_path)) as doc:
+        return page_lines(doc[0], header_only)
+
+def read_cover(file_path, data=None):
+    """
+    (header lines, cover lines) of a return, from a single MuPDF open. The
+    cover lines are the header's when it names the taxation year, else the
+    whole cover page's.
+    """
+    import fitz  # PyMuPDF
+
+    with (fitz.open(stream=data, filetype='pdf') if data is not None else fitz.open(file_path)) as doc:
+        with span('pdf.first_page_text'):
+            first_page_lines = page_lines(doc[0])
+        if detect_language_and_year(first_page_lines)[0] is not None:
+            return first_page_lines, first_page_lines
+        # The year is not in the header band: read the whole cover
+        with span('pdf.cover_text'):
+            return first_page_lines, page_lines(doc[0], header_only=False)
+
+def read_pdf(reader):
+    """The outline of an open PdfReader, as " > Title (Page 12)" bookmark lines."""
     bookmarks = []
-    first_page_lines = []
     try:
-        with open(file_path, "rb") as file:
-            reader = PyPDF2.PdfReader(file)
-            first_page = reader.pages[0]
-            first_page_text = first_page.extract_text().splitlines()
-            first_page_lines = first_page_text[:2]
-
-            def extract_bookmarks(outlines, parent_title=""):
-                for item in outlines:
-                    if isinstance(item, list):
-                        extract_bookmarks(item, parent_title)
-                    else:
-                        title = item.title
-                        page_num = reader.get_destination_page_number(item)
-                        bookmarks.append(f"{parent_title} > {title} (Page {page_num + 1})")
-
+        def extract_bookmarks(outlines, parent_title=""):
+            for item in outlines:
+                if isinstance(item, list):
+                    extract_bookmarks(item, parent_title)
+                else:
+                    title = item.title
+                    page_num = reader.get_destination_page_number(item)
+                    bookmarks.append(f"{parent_title} > {title} (Page {page_num + 1})")
+
+        with span('outline.parse'):
             extract_bookmarks(reader.outline)
     except Exception as e:
         bookmarks = [f"Error reading PDF: {e}"]
-    return bookmarks, first_page_lines
+    return bookmarks
+
+def parse_bookmark(bookmark):
+    """(title, 0-based page) of a read_pdf bookmark line, or None for an error line."""
+    match = BOOKMARK_PATTERN.match(bookmark)
+    return (match.group(1), int(match.group(2)) - 1) if match else None
+
+def summary_outline(bookmarks, summary_pages):
+    """
+    The bookmarks that point into the Summary PDF, as (title, page in that PDF)
+    in page order, so prepare_summary can go straight to its sections.
+    """
+    positions = {}
+    for index, page_num in enumerate(summary_pages):
+        positions.setdefault(page_num, []).append(index)
+    outline = []
+    for bookmark in filter(None, map(parse_bookmark, bookmarks)):
+        title, page_num = bookmark
+        outline += [(title, index) for index in positions.get(page_num, [])]
+    return sorted(outline, key=lambda entry: entry[1])
 
 def determine_language(bookmarks):
     for bookmark in bookmarks:
@@ -52,39 +119,67 @@ def determine_language(bookmarks):
             return "FR"
     raise ValueError("Neither 'Executive Summary' nor 'Sommaire principal' found in the bookmarks.")
 
-def extract_year(first_page_lines, language):
-    year_line = first_page_lines[1] if len(first_page_lines) > 1 else ""
-    if language == "EN" and "for" in year_line.lower() and "taxation year" in year_line.lower():
-        # Extract the second-to-last item in the string, which is the year
-        year = year_line.split()[-3]
-    elif language == "FR" and "pour l'année d'imposition" in year_line.lower():
-        # Extract the last item in the string, which is the year
-        year = year_line.split()[-1]
-    else:
-        raise ValueError("Could not determine the year from the PDF.")
-    return year
-
-def create_documents(file_data, directory_path, configuration):
+def find_year(cover_lines, language):
+    """The year on the first cover line with `language`'s taxation year wording, however phrased, or None."""
+    for line in cover_lines:
+        if YEAR_WORDING[language] in line.lower().replace('’', "'"):
+            match = re.search(r"\b(\d{4})\b", line)
+            if match:
+                return match.group(1)
+    return None
+
+def detect_language_and_year(cover_lines):
+    """(language, year) from the first cover line naming the taxation year, or (None, None)."""
+    for line in cover_lines:
+        for language, pattern in YEAR_PATTERNS.items():
+            match = pattern.search(line)
+            if match:
+                return language, match.group(1)
+    return None, None
+
+@timed('split')
+def split_return(file_path, directory_path, configuration, data=None, deferred=False):
+    """
+    Split one return PDF into the COPY, authorization and summary files.
+
+    Reentrant: only reads its arguments and returns a new result dict, so
+    several returns can be split concurrently. `data`, the return's bytes
+    when already read, is used instead of reading the file. With `deferred`
+    nothing is written: the outputs are returned under 'files' as (path,
+    bytes) pairs, for write_outputs.
+    """
     from PyPDF2 import PdfWriter, PdfReader
-
-    file_path = file_data["directory"]
+    from models.summaryLayout import profile_for
 
     def protect_pdf(pdf_writer, password):
         pdf_writer.encrypt(user_pwd=password, owner_pwd=password)
 
-    def save_document(pdf_writer, output_path):
-        with open(output_path, "wb") as f:
-            pdf_writer.write(f)
+    outputs, files = [], []
 
-    sin, name = extract_sin_and_name(file_path)
-    pdf_reader = PdfReader(file_path)
-    bookmarks, first_page_lines = read_pdf(file_path)
-    language = determine_language(bookmarks)
-    year = extract_year(first_page_lines, language)
+    def save_document(pdf_writer, output_path, stage='split.write'):
+        # encrypt() only sets up the keys; PyPDF2 encrypts the objects while writing, so the COPY's write is 'split.encrypt'
+        with span(stage):
+            if deferred:
+                buffer = io.BytesIO()
+                pdf_writer.write(buffer)
+                files.append((str(output_path), buffer.getvalue()))
+            else:
+                with open(output_path, "wb") as f:
+                    pdf_writer.write(f)
+        outputs.append(output_path)
 
-    # Assign year and language to client file data
-    file_data['year'] = year
-    file_data['language'] = language
+    sin, name = extract_sin_and_name(file_path)
+    with span('pdf.open'):
+        pdf_reader = PdfReader(io.BytesIO(data) if data is not None else file_path)
+    bookmarks = read_pdf(pdf_reader)
+    first_page_lines, cover_lines = read_cover(file_path, data)
+    language, year = detect_language_and_year(cover_lines)
+    if language is None:
+        # No year line in a known wording: the language comes from the outline, as before the cover was read
+        language = determine_language(bookmarks)
+        year = find_year(cover_lines, language)
+    if year is None:
+        raise ValueError("Could not determine the year from the PDF.")
 
     def get_config_for_language(section_key, language):
         return configuration.get(section_key, {}).get(language.lower(), [])
@@ -108,11 +203,15 @@ def create_documents(file_data, directory_path, configuration):
 
     base_path = Path(directory_path)
     name_dir = base_path
-    name_dir.mkdir(parents=True, exist_ok=True)
 
     sin_file_path = name_dir / f"{sin}.txt"
-    with open(sin_file_path, "w") as f:
-        pass
+    outputs.append(sin_file_path)
+    if deferred:
+        files.append((str(sin_file_path), b''))
+    else:
+        name_dir.mkdir(parents=True, exist_ok=True)
+        with open(sin_file_path, "w") as f:
+            pass
 
     if language == "FR":
         copy_file_name = f"COPIE de la Déclaration d'Impôt {year} - {name}.pdf"
@@ -129,7 +228,9 @@ def create_documents(file_data, directory_path, configuration):
     protect_pdf(copy_of_td_writer, sin)
     for page_num in range(len(pdf_reader.pages)):
         copy_of_td_writer.add_page(pdf_reader.pages[page_num])
-    save_document(copy_of_td_writer, name_dir / copy_file_name)
+    save_document(copy_of_td_writer, name_dir / copy_file_name, 'split.encrypt')
+    count('split.returns')
+    count('split.pages', len(pdf_reader.pages))
 
     if fed_authorization_pages:
         fed_auth_writer = PdfWriter()
@@ -150,48 +251,224 @@ def create_documents(file_data, directory_path, configuration):
             summary_writer.add_page(pdf_reader.pages[page_num])
         save_document(summary_writer, summary_file_path)
 
-    # Append the summary file path to the client file data
-    file_data['summary_file_path'] = str(summary_file_path) if summary_file_path else None
-
-    return {
+    result = {
+        'sin': sin,
+        'name': name,
         'year': int(year),
+        'language': language,
         'summary_file_path': str(summary_file_path) if summary_file_path else None,
+        'summary_outline': summary_outline(bookmarks, summary_pages) if summary_pages else [],
+        'layout_profile': profile_for(first_page_lines[0] if first_page_lines else "", language),
+        'outputs': [str(path) for path in outputs],
         'result': 'Documents created successfully',
     }
-
-def process_files(client_files, directory_path, configuration, doc_text_config=None):
+    if deferred:
+        result['files'] = files
+    return result
+
+def write_outputs(files):
+    """Write the (path, bytes) outputs of a deferred split_return."""
+    for path, content in files:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(content)
+
+def split_and_record(file_path, directory_path, configuration, registry=None):
+    """
+    split_return, recording the return in the `registry` SQLite file when one
+    is given. The return is read once, for the split and its source hash; its
+    earlier records are looked up before it is split and returned under
+    'processed_before'.
+    """
+    if not registry:
+        return split_return(file_path, directory_path, configuration)
+    from models.returnRegistry import data_hash, find_returns, record_return
+
+    start = time.perf_counter()
+    with open(file_path, "rb") as f:
+        data = f.read()
+    digest = data_hash(data)
+    timings = {'read_s': time.perf_counter() - start}
+    with span('split.register'):
+        processed_before = find_returns(registry, source_hash=digest)
+    start = time.perf_counter()
+    response = split_return(file_path, directory_path, configuration, data=data, deferred=True)
+    timings['split_s'] = time.perf_counter() - start
+    start = time.perf_counter()
+    write_outputs(response.pop('files'))
+    timings['write_s'] = time.perf_counter() - start
+    with span('split.register'):
+        record_return(registry, file_path, directory_path, response, digest, timings)
+    return {**response, 'processed_before': processed_before}
+
+def create_documents(file_data, directory_path, configuration, registry=None):
+    response = split_and_record(file_data["directory"], directory_path, configuration, registry)
+
+    # Assign SIN, year, language and summary file path to client file data
+    file_data['sin'] = response['sin']
+    file_data['year'] = str(response['year'])
+    file_data['language'] = response['language']
+    file_data['summary_file_path'] = response['summary_file_path']
+    file_data['summary_outline'] = response['summary_outline']
+    file_data['layout_profile'] = response['layout_profile']
+
+    return response
+
+def prepare_client_files(client_files, directory_path, configuration, registry=None):
+    """Split every return and return copies of the client files carrying SIN, year, language and summary path."""
+    prepared = []
     for client_file in client_files:
-        response = create_documents(client_file, directory_path, configuration)
-        client_file['year'] = response['year']
-    process_summaries(client_files, directory_path, doc_text_config=doc_text_config)
-    return
+        with profiled_client('split', directory_path, client_file.get('label'), client_file["directory"]):
+            response = split_and_record(client_file["directory"], directory_path, configuration, registry)
+        prepared.append(_client_fields(client_file, response))
+    return prepared
+
+def check_prior_years(client_files, summary_store):
+    """Fail before any return is split when a client's `prior_years` are not in the summary store."""
+    from models.summaryStore import check_prior_years as check_stored
+
+    check_stored(summary_store, [{**cf, 'sin': extract_sin_and_name(cf["directory"])[0]} for cf in client_files])
+
+def processed_before(prepared):
+    """Source path -> earlier registry records, for the prepared client files whose return was already processed."""
+    return {cf["directory"]: cf['processed_before'] for cf in prepared if cf.get('processed_before')}
+
+def process_batch(client_files, directory_path, configuration, doc_text_config=None, export=False, summary_store=None,
+                  registry=None):
+    """process_files, returning the output paths and, with a `registry`, the returns it had already recorded."""
+    from models.createSummary import create_summary_documents
+
+    if summary_store:
+        check_prior_years(client_files, summary_store)
+    prepared = prepare_client_files(client_files, directory_path, configuration, registry)
+    paths = create_summary_documents(prepared, directory_path, doc_text_config=doc_text_config, export=export,
+                                     summary_store=summary_store)
+    return {'paths': paths, 'processed_before': processed_before(prepared)}
+
+def process_files(client_files, directory_path, configuration, doc_text_config=None, export=False, summary_store=None,
+                  registry=None):
+    return process_batch(client_files, directory_path, configuration, doc_text_config, export, summary_store,
+                         registry)['paths']
+
+def _client_fields(client_file, response):
+    return {
+        **client_file,
+        'sin': response['sin'],
+        'year': response['year'],
+        'language': response['language'],
+        'summary_file_path': response['summary_file_path'],
+        'summary_outline': response['summary_outline'],
+        'layout_profile': response['layout_profile'],
+        'processed_before': response.get('processed_before', []),
+    }
 
-def _load_arg(arg):
-    """Load a JSON arg, reading from a temp file if it starts with @file:"""
-    if arg.startswith('@file:'):
-        file_path = arg[6:]
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return json.loads(arg)
+# Stages of pipeline_files. The process stages are module-level so that their pool can pickle them.
+# Each item carries a `source` dict: the return's hash, its earlier registry records and its stage times.
+
+def read_stage(client_file, registry=None):
+    start = time.perf_counter()
+    with open(client_file["directory"], "rb") as f:
+        data = f.read()
+    source = {'hash': None, 'processed_before': [], 'timings': {}}
+    if registry:
+        # Hashed and looked up here, before the return is split
+        from models.returnRegistry import data_hash, find_returns
+        source['hash'] = data_hash(data)
+        source['timings']['read_s'] = time.perf_counter() - start
+        source['processed_before'] = find_returns(registry, source_hash=source['hash'])
+    return client_file, data, source
+
+def split_stage(item, directory_path, configuration):
+    # PyPDF2 encrypts the COPY while serializing it, so encryption is part of this stage
+    client_file, data, source = item
+    start = time.perf_counter()
+    response = split_return(client_file["directory"], directory_path, configuration, data=data, deferred=True)
+    source['timings']['split_s'] = time.perf_counter() - start
+    return client_file, response, source
+
+def write_stage(item, directory_path, registry=None):
+    client_file, response, source = item
+    start = time.perf_counter()
+    write_outputs(response['files'])
+    if registry:
+        from models.returnRegistry import record_return
+        source['timings']['write_s'] = time.perf_counter() - start
+        record_return(registry, client_file["directory"], directory_path, response, source['hash'], source['timings'])
+    # Only the Summary's bytes go on, to be extracted without reading the file back
+    summary_data = next((content for path, content in response['files'] if path == response['summary_file_path']),
+                        None)
+    return _client_fields(client_file, {**response, 'processed_before': source['processed_before']}), summary_data
+
+def extract_stage(item):
+    from models.createSummary import extract_return_summary
+
+    prepared, summary_data = item
+    summary = extract_return_summary(prepared['summary_file_path'], prepared.get('language', 'EN'), prepared['year'],
+                                     prepared.get('summary_outline'), prepared.get('layout_profile'), summary_data)
+    return {**prepared, 'summary': summary}
+
+def pipeline_files(client_files, directory_path, configuration, workers, doc_text_config=None, export=False,
+                   summary_store=None, registry=None):
+    """
+    process_files as a pipeline (models.pipeline): returns are read, split,
+    written and extracted in overlapping stages, `workers` threads for the
+    file stages and up to one process per core for the PDF stages. The Word
+    documents are built once every client is extracted, since couples and
+    prior years are grouped across the batch. Returns the output paths, the
+    stats of each stage and, as process_batch, the returns already recorded
+    in the `registry`.
+    """
+    from functools import partial
+    from models.createSummary import document_summaries
+    from models.pipeline import run_stages
+    from models.summaryLayout import PROFILES, register_profiles
+
+    if summary_store:
+        check_prior_years(client_files, summary_store)
+    processes = max(1, min(workers, os.cpu_count() or 1))
+    # One core gains nothing from a process pool but the cost of spawning it and pickling the PDFs
+    kind = 'process' if processes > 1 else 'thread'
+    # A spawned worker starts without the layout profiles of this job, so each one registers them once
+    summarized, stats = run_stages(client_files, [
+        ('read', partial(read_stage, registry=registry), workers, 'thread'),
+        ('split', partial(split_stage, directory_path=directory_path, configuration=configuration), processes, kind),
+        ('write', partial(write_stage, directory_path=directory_path, registry=registry), workers, 'thread'),
+        ('extract', extract_stage, processes, kind),
+    ], initializer=register_profiles, initargs=(dict(PROFILES),))
+    with span('pipeline.render'):
+        start = time.perf_counter()
+        paths = document_summaries(summarized, directory_path, doc_text_config, export, summary_store)
+        render_s = time.perf_counter() - start
+    # Rendering runs alone after the other stages, so it is busy for all of its time
+    stats['stages']['render'] = {'kind': 'thread', 'workers': 1, 'items': len(summarized),
+                                 'busy_s': round(render_s, 6), 'utilization': 1.0}
+    stats['wall_s'] = round(stats['wall_s'] + render_s, 6)
+    return {'paths': paths, 'stages': stats, 'processed_before': processed_before(summarized)}
+
+def main():
+    payload = load_manifest(manifest_source(sys.argv), 'createSummaryDocuments')['payload']
+    client_files = payload['client_files']
+    directory_path = payload['directory']
+    if payload.get('layout_profiles'):
+        from models.summaryLayout import load_profiles
+        load_profiles(payload['layout_profiles'])
+
+    result = {'result': 'Documents created successfully.'}
+    with job('summary', clients=len(client_files)), profiled_job('summary', directory_path):
+        if payload.get('workers'):
+            batch = pipeline_files(client_files, directory_path, payload['configuration'], payload['workers'],
+                                   payload.get('doc_text_config'), payload.get('export', False),
+                                   payload.get('summary_store'), payload.get('return_registry'))
+            result['stages'] = batch['stages']
+        else:
+            batch = process_batch(client_files, directory_path, payload['configuration'], payload.get('doc_text_config'),
+                                  payload.get('export', False), payload.get('summary_store'),
+                                  payload.get('return_registry'))
+    if batch['processed_before']:
+        # Sources of this batch the registry had already recorded, with their earlier outputs
+        result['processed_before'] = batch['processed_before']
+    print(json.dumps(result))
 
 
 if __name__ == "__main__":
-    if len(sys.argv) >= 3:
-        client_files = _load_arg(sys.argv[1])
-        directory_path = sys.argv[2]
-        try:
-            configuration = _load_arg(sys.argv[3])
-        except (json.JSONDecodeError, FileNotFoundError) as e:
-            print(json.dumps({'error': f"Error parsing configuration JSON: {e}"}))
-
-        doc_text_config = None
-        if len(sys.argv) >= 5:
-            try:
-                doc_text_config = _load_arg(sys.argv[4])
-            except (json.JSONDecodeError, FileNotFoundError):
-                pass
-
-        process_files(client_files, directory_path, configuration, doc_text_config)
-        print(json.dumps({'result': 'Documents created successfully.'}))
-    else:
-        print(json.dumps({'error': 'Insufficient arguments provided.'}))
+    main()
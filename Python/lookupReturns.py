@@ -0,0 +1,41 @@
+"""
+Look up the returns recorded in a registry (models.returnRegistry).
+
+    lookupReturns <registry.sqlite> [--sin SIN] [--year YEAR] [--name NAME]
+    lookupReturns <registry.sqlite> --file <return.pdf> [<return.pdf> ...]
+
+Prints the matching records as JSON, most recent first. With --file, prints
+for each PDF already processed the records of the same source file (by
+hash), so duplicates can be found before a batch is split.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from models.returnRegistry import find_returns, processed_sources
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='lookupReturns', description="Look up processed returns.")
+    parser.add_argument('registry', help="registry SQLite file (the return_registry of the summary job)")
+    parser.add_argument('--sin', help="client SIN")
+    parser.add_argument('--year', type=int, help="tax year")
+    parser.add_argument('--name', help="client name as in the return's file name, any case")
+    parser.add_argument('--file', nargs='+', dest='files', help="return PDFs to check for earlier processing")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    if not os.path.isfile(args.registry):
+        print(json.dumps({'error': f"No registry at {args.registry}"}))
+        return 1
+    if args.files:
+        result = {'processed': processed_sources(args.registry, args.files)}
+    else:
+        result = {'returns': find_returns(args.registry, args.sin, args.year, args.name)}
+    print(json.dumps(result))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
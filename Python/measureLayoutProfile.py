@@ -0,0 +1,49 @@
+"""
+Measure the Summary layout profile of a tax software release (models.summaryLayout).
+
+    measureLayoutProfile <profiles.json> <name> <return.pdf> <Summary.pdf>
+
+<return.pdf> is a return of that release and <Summary.pdf> the Summary the
+summary job split from it. The profile, selected for returns whose cover
+starts like this one's, is added to <profiles.json> (created if missing),
+replacing any profile of the same name. Prints the measured sections as JSON.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='measureLayoutProfile', description="Measure a Summary layout profile.")
+    parser.add_argument('profiles', help="JSON file of the profiles (the layout_profiles of the summary job)")
+    parser.add_argument('name', help="profile name, e.g. the software and its version")
+    parser.add_argument('source', help="a return PDF of that software version")
+    parser.add_argument('summary', help="the Summary PDF split from that return")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    from createSummaryDocuments import detect_language_and_year, read_cover
+    from models.createSummary import TITLES, TITLES_FR
+    from models.summaryLayout import load_profiles, measure_profile, register_profile, save_profiles
+
+    cover_lines, year_lines = read_cover(args.source)
+    language, _ = detect_language_and_year(year_lines)
+    if not cover_lines or language is None:
+        print(json.dumps({'error': f"Could not read the cover of {args.source}"}))
+        return 1
+    sections = measure_profile(args.summary, TITLES_FR if language == 'FR' else TITLES)
+    if not sections:
+        print(json.dumps({'error': f"No section title found in {args.summary}"}))
+        return 1
+
+    if os.path.isfile(args.profiles):
+        load_profiles(args.profiles)
+    register_profile(args.name, cover_lines[0], language, sections)
+    save_profiles(args.profiles)
+    print(json.dumps({'profile': args.name, 'cover': cover_lines[0], 'language': language, 'sections': sections}))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
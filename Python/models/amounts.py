@@ -0,0 +1,84 @@
+"""
+Amounts printed in the return summaries, parsed to integer cents.
+
+The summaries print dollars and cents as two numbers separated by a space,
+with thousands grouped by commas in English and by spaces in French:
+
+    EN: 1,006 33    FR: 1 006 33    both: 75 00
+
+The extractors used to clean and re-parse these through strings and floats,
+each with its own regex. parse_cents and find_cents read them with one
+compiled pattern per language and return exact integer cents, so sums and
+comparisons have no float error. Extractors work in cents and return them
+as the TaxSummary and BenefitSchedule records of models.returnSummary.
+
+parse_cents and cents_between_labels find the same amount the old regexes
+did: the leftmost match, even inside a longer run of digits ('12,345 678'
+reads 12,345.67). find_cents only reads whole amounts, so the years and line
+numbers between them are skipped.
+"""
+
+import re
+
+AMOUNT_PATTERNS = {
+    'EN': re.compile(r'(\d{1,3}(?:,\d{3})*)\s(\d{2})'),
+    'FR': re.compile(r'(\d{1,3}(?:\s\d{3})*)\s(\d{2})'),
+}
+# Amounts that neither start nor end inside another number
+_WHOLE_AMOUNT_PATTERNS = {
+    'EN': re.compile(r'(?<![\d,])(\d{1,3}(?:,\d{3})*)\s(\d{2})(?!\d)'),
+    'FR': re.compile(r'(?<!\d)(\d{1,3}(?:\s\d{3})*)\s(\d{2})(?!\d)'),
+}
+# The amount columns of a French table row (the family allowance), each ending at a number's end
+FR_COLUMN_PATTERN = re.compile(r'(\d{1,3}(?:\s\d{3})*)\s(\d{2})(?!\d)')
+# A value printed as digits only, the last two being the cents (e.g. after "Refund 48400")
+_DIGITS = re.compile(r'(-?)(\d{2,})')
+
+
+def _without_separators(text):
+    # Two replaces are ten times faster than str.translate on strings this short
+    return text.replace(',', '').replace(' ', '')
+
+
+def amount_cents(dollars, cents):
+    """Cents of one matched amount: its dollars with their separators, and its two cent digits."""
+    return int(_without_separators(dollars)) * 100 + int(cents)
+
+
+def parse_cents(text, language='EN'):
+    """Cents of the first amount in `text`, or None."""
+    match = AMOUNT_PATTERNS[language].search(text)
+    return amount_cents(*match.groups()) if match else None
+
+
+def find_cents(text, language='EN'):
+    """Cents of every whole amount in `text`, left to right."""
+    return [amount_cents(dollars, cents) for dollars, cents in _WHOLE_AMOUNT_PATTERNS[language].findall(text)]
+
+
+def cents_between_labels(label, next_label, line, language='EN'):
+    """
+    Cents of the first amount after the last `label` of `line` and before
+    `next_label` (when given and present); 0 when there is none.
+    """
+    if label not in line:
+        return 0
+    after_label = line.split(label)[-1]
+    if next_label and next_label in after_label:
+        after_label = after_label.split(next_label)[0]
+    return parse_cents(after_label, language) or 0
+
+
+def digits_cents(value):
+    """
+    Cents of a value printed as its digits, e.g. '1,234 56' -> 123456; 0 when
+    it is empty or not such a number.
+    """
+    if not value:
+        return 0
+    match = _DIGITS.fullmatch(_without_separators(value))
+    if not match:
+        return 0
+    sign, digits = match.groups()
+    return -int(digits) if sign else int(digits)
+
@@ -1,39 +1,107 @@
 import sys
 import json
+import time
+from functools import lru_cache
 from docx import Document
 from docx.shared import Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
 
+from models.currencyFormat import format_money
+from models.instrumentation import count, span, timed
+from models.pricing import price_services
 
-def _parse_rate(value):
-    """Parse a tax rate value into a float. Accepts numbers, numeric strings, or strings with a trailing '%'."""
-    try:
-        if value is None:
-            return 0.0
-        # Convert to string and strip whitespace
-        s = str(value).strip()
-        if s.endswith('%'):
-            s = s[:-1].strip()
-        return float(s)
-    except Exception:
-        return 0.0
-
-def create_confirmation_email(directory_path, clients, selected_prices, tax_rate, includeTaxes, language):
 
+FRENCH_TITLES = {'Mr': 'M.', 'Mrs': 'Mme', 'Ms': 'Mme'}
+
+@timed('email.build')
+def create_confirmation_email(directory_path, clients, selected_prices, tax_rate, includeTaxes, language, pricing=None):
+      """`pricing` is the price_services result of the same arguments, when the caller already has it."""
       if language == "fr":
-          create_confirmation_email_french(directory_path, clients, selected_prices, tax_rate, includeTaxes)
+          return create_confirmation_email_french(directory_path, clients, selected_prices, tax_rate, includeTaxes, pricing)
       elif language == "en":
-          create_confirmation_email_english(directory_path, clients, selected_prices, tax_rate, includeTaxes)
+          return create_confirmation_email_english(directory_path, clients, selected_prices, tax_rate, includeTaxes, pricing)
       else:
           raise ValueError(f"Unsupported language: {language}")
 
-def create_confirmation_email_english(directory_path, clients, selected_prices, tax_rate, includeTaxes):
+@timed('email.batch')
+def create_confirmation_emails(jobs, timed=False):
+    """
+    Build many confirmation emails in one process and return their paths, in order.
+
+    Each job is a dict with the arguments of create_confirmation_email:
+    directory, clients, selected_prices, tax_rate, include_taxes, language and
+    optionally pricing. Loading python-docx's default template costs more than
+    writing an email, so every email of a language and province is written into
+    one cached document that already holds the default font and the footer
+    (_static_document), and the household's sections are taken out again after
+    saving. With `timed`, returns (path, seconds) of each job instead.
+    """
+    paths = []
+    for job in jobs:
+        start = time.perf_counter()
+        language = job['language']
+        if language not in ('en', 'fr'):
+            raise ValueError(f"Unsupported language: {language}")
+        pricing = job.get('pricing') or price_services(job['selected_prices'], job['tax_rate'], job['include_taxes'])
+        with span('email.render'):
+            path = _write_household_email(job['directory'], job['clients'], pricing, language)
+        count('email.emails')
+        paths.append((path, round(time.perf_counter() - start, 6)) if timed else path)
+    return paths
+
+@lru_cache(maxsize=None)
+def _static_document(language, province):
+    """Document holding the default font and the footer of an email, built once per process."""
+    doc = Document()
+    set_default_font(doc, "Calibri", 10)
+    if language == "fr":
+        add_footer_section_french(doc, province)
+    else:
+        add_footer_section(doc, province)
+    return doc
+
+def _write_household_email(directory_path, clients, pricing, language):
+    province = pricing['province']
+    doc = _static_document(language, province)
+    body = doc.element.body
+    footer = [element for element in body if element is not body.sectPr]
+    rels = set(doc.part.rels)
+    for element in footer:
+        body.remove(element)
+    try:
+        if language == "fr":
+            clients = [{**client, 'title': FRENCH_TITLES.get(client['title'], client['title'])} for client in clients]
+            add_intro_section_french(doc, clients)
+            add_confirmation_numbers_section_french(doc, clients, province)
+            if pricing['lines']:
+                add_tax_summary_fees_section_french(doc, pricing)
+        else:
+            add_intro_section(doc, clients)
+            add_confirmation_numbers_section(doc, clients, province)
+            if pricing['lines']:
+                add_tax_summary_fees_section(doc, pricing)
+        for element in footer:
+            body.sectPr.addprevious(element)
+
+        output_file_path = _email_file_path(directory_path, clients)
+        with span('docx.save'):
+            doc.save(output_file_path)
+        return output_file_path
+    finally:
+        # Back to the static parts only: the footer, and the hyperlinks it relates to
+        for element in list(body):
+            if element is not body.sectPr and element not in footer:
+                body.remove(element)
+        for element in footer:
+            if element.getparent() is None:
+                body.sectPr.addprevious(element)
+        for r_id in set(doc.part.rels) - rels:
+            doc.part.drop_rel(r_id)
+
+def create_confirmation_email_english(directory_path, clients, selected_prices, tax_rate, includeTaxes, pricing=None):
     province = tax_rate.get("province")
-    # Ensure rates are numeric (allow strings like "5" or "5%")
-    gst_rate = _parse_rate(tax_rate.get("fedRate", 0))
-    qst_rate = _parse_rate(tax_rate.get("provRate", 0)) if province == "QC" else 0
 
     doc = Document()
 
@@ -43,9 +111,15 @@ def create_confirmation_email_english(directory_path, clients, selected_prices,
     add_intro_section(doc, clients)
     add_confirmation_numbers_section(doc, clients, province)
     if selected_prices:
-      add_tax_summary_fees_section(doc, selected_prices, gst_rate, qst_rate, province, includeTaxes)
+      add_tax_summary_fees_section(doc, pricing or price_services(selected_prices, tax_rate, includeTaxes))
     add_footer_section(doc, province)
 
+    output_file_path = _email_file_path(directory_path, clients)
+    with span('docx.save'):
+        doc.save(output_file_path)
+    return output_file_path
+
+def _email_file_path(directory_path, clients):
     years = sorted(set(year['year'] for client in clients for year in client['years']))
     if len(years) == 2:
         year_str = f"{years[0]} & {years[1]}"
@@ -54,9 +128,7 @@ def create_confirmation_email_english(directory_path, clients, selected_prices,
     else:
         year_str = str(years[0])
     client_names = " & ".join([f"{client['name']}" for client in clients])
-    output_file_path = f"{directory_path}/Confirmation {client_names} {year_str}.docx"
-
-    doc.save(output_file_path)
+    return f"{directory_path}/Confirmation {client_names} {year_str}.docx"
 
 # Function to set default font and size for the entire document
 def set_default_font(doc, font_name, font_size):
@@ -147,29 +219,10 @@ def add_confirmation_numbers_section(doc, clients, province):
     para.add_run('If there is a discrepancy ').bold = True
     para.add_run('between the notice of assessment and the results mentioned in the summary that we emailed you, please send us a copy of the notice of assessment as soon as possible.').bold = False
 
-def add_tax_summary_fees_section(doc, selected_prices, gst_rate, qst_rate, province, includeTaxes):
-    subtotal = 0
-    percentage_adjustments = 0
-
-    # Calculate subtotal and percentage adjustments
-    for price in selected_prices:
-        if price['type'] == "number":
-            subtotal += price['amount'] * price['quantity']
-        elif price['type'] == "%":
-            percentage_adjustments += price['amount']
-
-    adjustment_amount = subtotal * (percentage_adjustments / 100)
-    adjusted_subtotal = subtotal + adjustment_amount
-
-    if includeTaxes:
-        gst = adjusted_subtotal * (gst_rate / 100)
-        qst = adjusted_subtotal * (qst_rate / 100) if province == "QC" else 0
-    else:
-        gst = 0
-        qst = 0
-
-    # Calculate total as the adjusted subtotal plus taxes
-    total = adjusted_subtotal + gst + qst
+def add_tax_summary_fees_section(doc, pricing):
+    """Fees paragraph, printed from a price_services result."""
+    province = pricing['province']
+    adjusted_subtotal, gst, qst, total = pricing['adjusted_subtotal'], pricing['gst'], pricing['qst'], pricing['total']
 
     # Add the title for the fees section
     para = doc.add_paragraph("")
@@ -180,29 +233,27 @@ def add_tax_summary_fees_section(doc, selected_prices, gst_rate, qst_rate, provi
     para.add_run(" (Attached is a copy of the invoice for your reference)\n")  # Adding a line break
 
     # Display the services and their amounts
-    for price in selected_prices:
-        service_name = price['service']['en']
-        if price['type'] == "number":
-            amount_display = f"${price['amount']:.2f}"
-            if price['quantity'] > 1:
-                amount_display += f" x {price['quantity']} = ${(price['amount'] * price['quantity']):.2f}"
-        elif price['type'] == "%":
-            amount_display = f"{price['amount']:.0f}%"
+    for line in pricing['lines']:
+        service_name = line['service']['en']
+        if line['type'] == "%":
+            amount_display = f"{line['amount']:.0f}%"
         else:
-            continue
+            amount_display = format_money(line['amount'], 'en', grouping=False)
+            if line['quantity'] > 1:
+                amount_display += f" x {line['quantity']} = {format_money(line['total'], 'en', grouping=False)}"
 
         # Add each service and amount to the same paragraph with line breaks
         run = para.add_run(f"{service_name}: {amount_display}\n")
 
     # Add subtotal information
-    if includeTaxes:
+    if pricing['include_taxes']:
         para.add_run("Subtotal: ")
-        para.add_run(f"${adjusted_subtotal:.2f}\n")
-        para.add_run(f"GST (837298611RT0001): ${gst:.2f}\n")
+        para.add_run(f"{format_money(adjusted_subtotal, 'en', grouping=False)}\n")
+        para.add_run(f"GST (837298611RT0001): {format_money(gst, 'en', grouping=False)}\n")
         if province == "QC":
-            para.add_run(f"QST (1213576115TQ0002): ${qst:.2f}\n")
+            para.add_run(f"QST (1213576115TQ0002): {format_money(qst, 'en', grouping=False)}\n")
 
-    total_run = para.add_run(f"Total: ${total:.2f}")
+    total_run = para.add_run(f"Total: {format_money(total, 'en', grouping=False)}")
     total_run.bold = True
 
     # Payment instructions in italic
@@ -257,40 +308,28 @@ def add_footer_section(doc, province):
 
     footer_para.add_run("\nThank you for using our services & have a profitable year!")
 
-def create_confirmation_email_french(directory_path, clients, selected_prices, tax_rate, includeTaxes):
+def create_confirmation_email_french(directory_path, clients, selected_prices, tax_rate, includeTaxes, pricing=None):
     province = tax_rate.get("province")
-    # Ensure rates are numeric (allow strings like "5" or "5%")
-    gst_rate = _parse_rate(tax_rate.get("fedRate", 0))
-    qst_rate = _parse_rate(tax_rate.get("provRate", 0)) if province == "QC" else 0
 
     doc = Document()
 
     # Set default font to Calibri and size 10pt for the entire document
     set_default_font(doc, "Calibri", 10)
 
-    for client in clients:
-        if client['title'] == 'Mr':
-            client['title'] = 'M.'
-        elif client['title'] in ['Mrs', 'Ms']:
-            client['title'] = 'Mme'
+    # Work on copies so the caller's client dicts keep their English titles
+    clients = [{**client, 'title': FRENCH_TITLES.get(client['title'], client['title'])} for client in clients]
 
     add_intro_section_french(doc, clients)
     add_confirmation_numbers_section_french(doc, clients, province)
     if selected_prices:
-        add_tax_summary_fees_section_french(doc, selected_prices, gst_rate, qst_rate, province, includeTaxes)
+        add_tax_summary_fees_section_french(doc, pricing or price_services(selected_prices, tax_rate, includeTaxes))
     add_footer_section_french(doc, province)
 
-    years = sorted(set(year['year'] for client in clients for year in client['years']))
-    if len(years) == 2:
-        year_str = f"{years[0]} & {years[1]}"
-    elif len(years) > 2:
-        year_str = ", ".join(str(year) for year in years[:-1]) + f", & {years[-1]}"
-    else:
-        year_str = str(years[0])
-    client_names = " & ".join([f"{client['name']}" for client in clients])
-    output_file_path = f"{directory_path}/Confirmation {client_names} {year_str}.docx"
+    output_file_path = _email_file_path(directory_path, clients)
 
-    doc.save(output_file_path)
+    with span('docx.save'):
+        doc.save(output_file_path)
+    return output_file_path
 
 def add_intro_section_french(doc, clients):
     # Get unique years from all clients
@@ -372,29 +411,10 @@ def add_confirmation_numbers_section_french(doc, clients, province):
     para.add_run("S'il y a un écart ").bold = True
     para.add_run("entre l'avis de cotisation et les résultats mentionnés dans le résumé que nous vous avons envoyé par e-mail, veuillez nous envoyer une copie de l'avis de cotisation dès que possible.").bold = False
 
-def add_tax_summary_fees_section_french(doc, selected_prices, gst_rate, qst_rate, province, includeTaxes):
-    subtotal = 0
-    percentage_adjustments = 0
-
-    # Calculate subtotal and percentage adjustments
-    for price in selected_prices:
-        if price['type'] == "number":
-            subtotal += price['amount'] * price['quantity']
-        elif price['type'] == "%":
-            percentage_adjustments += price['amount']
-
-    adjustment_amount = subtotal * (percentage_adjustments / 100)
-    adjusted_subtotal = subtotal + adjustment_amount
-
-    if includeTaxes:
-        gst = adjusted_subtotal * (gst_rate / 100)
-        qst = adjusted_subtotal * (qst_rate / 100) if province == "QC" else 0
-    else:
-        gst = 0
-        qst = 0
-
-    # Calculate total as the adjusted subtotal plus taxes
-    total = adjusted_subtotal + gst + qst
+def add_tax_summary_fees_section_french(doc, pricing):
+    """Fees paragraph, printed from a price_services result."""
+    province = pricing['province']
+    adjusted_subtotal, gst, qst, total = pricing['adjusted_subtotal'], pricing['gst'], pricing['qst'], pricing['total']
 
     # Add the title for the fees section
     para = doc.add_paragraph("")
@@ -403,34 +423,28 @@ def add_tax_summary_fees_section_french(doc, selected_prices, gst_rate, qst_rate
     run.underline = True
     para.add_run(" (Ci-joint la facture pour votre référence)\n")  # Adding a line break
 
-    # Function to format currency for French locale
-    def format_currency_french(amount):
-        return f"{amount:,.2f}".replace(",", " ").replace(".", ",") + " $"
-
     # Display the services and their amounts in French format
-    for price in selected_prices:
-        service_name = price['service']['fr']
-        if price['type'] == "number":
-            amount_display = format_currency_french(price['amount'])
-            if price['quantity'] > 1:
-                amount_display += f" x {price['quantity']} = {format_currency_french(price['amount'] * price['quantity'])}"
-        elif price['type'] == "%":
-            amount_display = f"{price['amount']:.0f}%"
+    for line in pricing['lines']:
+        service_name = line['service']['fr']
+        if line['type'] == "%":
+            amount_display = f"{line['amount']:.0f}%"
         else:
-            continue
+            amount_display = format_money(line['amount'], 'fr', thousands=' ')
+            if line['quantity'] > 1:
+                amount_display += f" x {line['quantity']} = {format_money(line['total'], 'fr', thousands=' ')}"
 
         # Add each service and amount to the same paragraph with line breaks
         run = para.add_run(f"{service_name}: {amount_display}\n")
 
     # Add subtotal information in French format
-    if includeTaxes:
+    if pricing['include_taxes']:
         para.add_run("Sous-total: ")
-        para.add_run(f"{format_currency_french(adjusted_subtotal)}\n")
-        para.add_run(f"TPS (837298611RT0001): {format_currency_french(gst)}\n")
+        para.add_run(f"{format_money(adjusted_subtotal, 'fr', thousands=' ')}\n")
+        para.add_run(f"TPS (837298611RT0001): {format_money(gst, 'fr', thousands=' ')}\n")
         if province == "QC":
-            para.add_run(f"TVQ (1213576115TQ0002): {format_currency_french(qst)}\n")
+            para.add_run(f"TVQ (1213576115TQ0002): {format_money(qst, 'fr', thousands=' ')}\n")
 
-    total_run = para.add_run(f"Total: {format_currency_french(total)}")
+    total_run = para.add_run(f"Total: {format_money(total, 'fr', thousands=' ')}")
     total_run.bold = True
 
     # Payment instructions in italic
@@ -1,6 +1,7 @@
 import fitz
 import os
 from collections import defaultdict
+from contextlib import contextmanager
 
 from models.extractData import (
     extract_tax_summary,
@@ -25,12 +26,14 @@ from models.extractDataFR import (
     extract_carbon_rebateFR,
     extract_ontario_trilliumFR
 )
-from models.createWordDoc import createIndividualWordDoc, createCoupleWordDoc
-from models.createWordDocMultiYear import createIndividualWordDocMultiYear
+from models.instrumentation import count, span, timed
+from models.profiling import profiled_client
+from models.returnSummary import ReturnSummary
+from models.summaryLayout import PROFILES, profile_clip, section_words
 
 
-# List of titles to search for in the document
-TITLES = [
+# List of titles to search for in the document (tuples: shared read-only across threads)
+TITLES = (
     "Tax return summary",
     "Estimated of the Canada Groceries",
     "GST/HST Tax Credit",
@@ -41,8 +44,9 @@ TITLES = [
     "Canada carbon rebate",
     "Ontario Trillium Benefit",
     'British Columbia Climate Action Tax Credit'
-]
-TITLES_FR = [
+)
+
+TITLES_FR = (
     "Sommaire de la déclaration",
     "Estimation de l'allocation canadienne pour l'épicerie",
     "Estimation du crédit pour la TPS/TVH",
@@ -52,10 +56,29 @@ TITLES_FR = [
     "la mesure de l'Allocation famille",
     "remise canadienne sur le carbone",
     "prestation Trillium de l'Ontario",
-]
+)
+
+@contextmanager
+def page_text(page, clip=None):
+    """
+    One TextPage of `page`, or of `clip` on it, for every pass over the page:
+    words, title search and table clips all read it instead of running the
+    text layout analysis again. It is dropped on exit, so the callers, which
+    keep no other reference, free it with the page.
+    """
+    textpage = page.get_textpage(clip=clip, flags=fitz.TEXTFLAGS_WORDS)
+    count('summary.textpages')
+    try:
+        yield textpage
+    finally:
+        del textpage
 
-def extract_lines_from_page(page, vertical_tolerance=1.0):
-    words = page.get_text("words")
+def extract_lines_from_page(page, vertical_tolerance=1.0, textpage=None):
+    return words_to_lines(page.get_text("words", textpage=textpage), vertical_tolerance)
+
+def words_to_lines(words, vertical_tolerance=1.0):
+    """Join get_text("words") tuples into lines of text, top to bottom."""
+    words = list(words)
     lines = []
 
     words.sort(key=lambda w: (round(w[3], 1), w[0]))
@@ -92,18 +115,60 @@ def is_title(line_text, titles):
             return title
     return None
 
-def prepare_summary(summary_file_path, language):
+def outline_sections(outline, titles):
+    """Section titles named by the bookmarks of each page: {page index: [title, ...]}."""
+    sections = defaultdict(list)
+    for bookmark, page in outline or ():
+        title = is_title(bookmark, titles)
+        if title and title not in sections[page]:
+            sections[page].append(title)
+    return sections
+
+def prepare_summary(summary_file_path, language, outline=None, profile=None, data=None):
+    """
+    Group the lines of a Summary PDF by section title.
+
+    Every page is scanned for the titles: a return's bookmarks name groups
+    of pages ("Benefits and credits") more often than the sections on them,
+    so they cannot tell which pages to skip. With the outline recorded by
+    split_return and a layout profile (a summaryLayout.PROFILES name), a page
+    whose bookmarked sections all sit at their profile anchors is read only
+    in their tables, and one whose sections moved is read in their tables
+    where their titles are found. Each pass over a page shares one TextPage (see page_text).
+    `data`, the file's bytes when already in memory, is read instead of the file.
+    """
     try:
-        doc = fitz.open(summary_file_path)
+        with span('summary.open'):
+            doc = fitz.open(stream=data, filetype='pdf') if data is not None else fitz.open(summary_file_path)
+        count('summary.pages', len(doc))
         all_sections = {}
         current_section = None
 
         # Choose titles based on language
         titles_to_use = TITLES_FR if language == 'FR' else TITLES
 
+        layout = PROFILES.get(profile) if profile else None
+        page_sections = outline_sections(outline, titles_to_use) if layout else {}
+
         for page_num in range(len(doc)):
             page = doc.load_page(page_num)
-            lines = extract_lines_from_page(page)
+            titles_here = page_sections.get(page_num)
+            clip = profile_clip(layout, titles_here) if titles_here else None
+            located = None
+            if clip is not None:
+                with span('lines.clip'), page_text(page, clip) as textpage:
+                    located = section_words(page, textpage, layout, titles_here)
+            if located is None:
+                with span('lines.extract'), page_text(page) as textpage:
+                    if clip is not None:
+                        located = section_words(page, textpage, layout, titles_here, relocate=True)
+                    if located is None:
+                        lines = extract_lines_from_page(page, textpage=textpage)
+            if located is not None:
+                for current_section, words in located:
+                    all_sections.setdefault(current_section, []).extend(words_to_lines(words))
+                count('summary.pages_clipped')
+                continue
 
             for i, line_text in enumerate(lines):
                 next_line_text = lines[i + 1] if i + 1 < len(lines) else ""
@@ -129,86 +194,104 @@ def prepare_summary(summary_file_path, language):
     except Exception as e:
         return {'error': str(e)}
 
-def process_summaries(client_files, directory_path, doc_text_config=None):
-    # Initialize lists to hold summaries for couples and individuals
-    coupled_summaries = []
-    individual_summaries = []
-
-    # Iterate through client files and process their summaries
+def _extract(extractor, lines, *args):
+    with span('extract.' + extractor.__name__):
+        return extractor(lines, *args)
+
+@timed('summary.extract')
+def extract_return_summary(summary_file_path, language, year, outline=None, profile=None, data=None):
+    """
+    Extract the return summary of one client from its Summary PDF, reading
+    only the tables of its layout profile when split_return recorded its
+    outline and profile.
+
+    Reentrant: reads only its arguments and returns a new ReturnSummary, so
+    several clients can be extracted concurrently from a thread pool. `data`,
+    the Summary PDF's bytes, is read instead of the file when given.
+    """
+    result = prepare_summary(summary_file_path, language, outline, profile, data)
+    sections = result.get("sections", {})
+
+    # Extract relevant data
+    if language == 'EN':
+        tax_summary = _extract(extract_tax_summary, sections.get("Tax return summary", []), year)
+        province = tax_summary.province
+        gst_amounts = _extract(extract_gst_credit, sections.get("GST/HST Tax Credit", []), year)
+        ecgeb_amounts = _extract(extract_ecgeb_credit, sections.get("Estimated of the Canada Groceries", []), year)
+        solidarity_amounts = _extract(extract_solidarity_credit, sections.get("Solidarity Tax Credit", []), year)
+        ccb_amounts = _extract(extract_child_benefit, sections.get("calculation for the Canada Child Benefit (CCB)", []), year)
+        family_allowance_amounts = _extract(extract_family_allowance, sections.get("Family allowance measure", []), year)
+        carryforward_amounts = _extract(extract_carryforward_summary, sections.get("Summary of Carryforward Amounts", []), province)
+        carbon_rebate_amounts = _extract(extract_carbon_rebate, sections.get("Canada carbon rebate", []), year)
+        ontario_trillium_amounts = _extract(extract_ontario_trillium, sections.get("Ontario Trillium Benefit", []), year)
+        climate_action_credit_amounts = _extract(extract_climate_action_credit, sections.get("British Columbia Climate Action Tax Credit", []), year)
+
+    elif language == 'FR':
+        tax_summary = _extract(extract_tax_summaryFR, sections.get("Sommaire de la déclaration", []), year)
+        province = tax_summary.province
+        gst_amounts = _extract(extract_gst_creditFR, sections.get("Estimation du crédit pour la TPS/TVH", []), year)
+        ecgeb_amounts = _extract(extract_ecgeb_creditFR, sections.get("Estimation de l'allocation canadienne pour l'épicerie", []), year)
+        solidarity_amounts = _extract(extract_solidarity_creditFR, sections.get("Estimation du calcul du crédit d'impôt pour solidarité", []), year)
+        ccb_amounts = _extract(extract_child_benefitFR, sections.get("l'allocation canadienne pour enfants", []), year)
+        family_allowance_amounts = _extract(extract_family_allowanceFR, sections.get("la mesure de l'Allocation famille", []), year)
+        carryforward_amounts = _extract(extract_carryforward_summaryFR, sections.get("Sommaire des montants reportés", []), province)
+        carbon_rebate_amounts = _extract(extract_carbon_rebateFR, sections.get("remise canadienne sur le carbone", []), year)
+        ontario_trillium_amounts = _extract(extract_ontario_trilliumFR, sections.get("prestation Trillium de l'Ontario", []), year)
+        climate_action_credit_amounts = _extract(extract_climate_action_credit, sections.get("British Columbia Climate Action Tax Credit", []), year)
+
+    # Create the summary, without the sections the return prints no amount in
+    schedules = {
+        'gst': gst_amounts,
+        'ecgeb': ecgeb_amounts,
+        'solidarity': solidarity_amounts,
+        'ccb': ccb_amounts,
+        'family_allowance': family_allowance_amounts,
+        'carbon_rebate': carbon_rebate_amounts,
+        'ontario_trillium': ontario_trillium_amounts,
+        'climate_action_credit': climate_action_credit_amounts,
+    }
+    sections = {name: schedule for name, schedule in schedules.items() if schedule.has_amounts()}
+    if carryforward_amounts and any(carryforward_amounts.values()):
+        sections['carryforward'] = carryforward_amounts
+
+    return ReturnSummary(tax_summary, **sections)
+
+def summarize_client_files(client_files):
+    """Return copies of the client files with their extracted 'summary' attached; inputs are left untouched."""
+    summarized = []
     for client_file in client_files:
         # Access the summary file path directly from the client file's directory
         summary_file_path = os.path.join(client_file['summary_file_path'])
         language = client_file.get('language', 'EN')
+        with profiled_client('extract', os.path.dirname(summary_file_path), client_file.get('label'), client_file.get('directory')):
+            return_summary = extract_return_summary(summary_file_path, language, client_file['year'],
+                                                    client_file.get('summary_outline'), client_file.get('layout_profile'))
+        summarized.append({**client_file, 'summary': return_summary})
+    return summarized
+
+def write_summary_documents(summarized_files, directory_path, doc_text_config=None):
+    """
+    Group summarized client files into couples and individuals and build their Word documents.
+
+    Works only on its own grouping structures and returns the list of generated paths.
+    """
+    # python-docx is the slowest import of the pipeline; load it only once documents are built
+    from models.createWordDoc import createIndividualWordDoc, createCoupleWordDoc
+    from models.createWordDocMultiYear import createIndividualWordDocMultiYear
+
+    # The builders read each ReturnSummary by its dict keys (ReturnSummary.__getitem__)
+    # Initialize lists to hold summaries for couples and individuals
+    coupled_summaries = []
+    individual_summaries = []
+    output_paths = []
 
-        result = prepare_summary(summary_file_path, language)
-
-        # Extract relevant data
-        if language == 'EN':
-            tax_summary = extract_tax_summary(result.get("sections", {}).get("Tax return summary", []), client_file['year'])
-            province = tax_summary['province']
-            gst_amounts = extract_gst_credit(result.get("sections", {}).get("GST/HST Tax Credit", []), client_file['year'])
-            ecgeb_amounts = extract_ecgeb_credit(result.get("sections", {}).get("Estimated of the Canada Groceries", []), client_file['year'])
-            solidarity_amounts = extract_solidarity_credit(result.get("sections", {}).get("Solidarity Tax Credit", []), client_file['year'])
-            ccb_amounts = extract_child_benefit(result.get("sections", {}).get("calculation for the Canada Child Benefit (CCB)", []), client_file['year'])
-            family_allowance_amounts = extract_family_allowance(result.get("sections", {}).get("Family allowance measure", []), client_file['year'])
-            carryforward_amounts = extract_carryforward_summary(result.get("sections", {}).get("Summary of Carryforward Amounts", []), province)
-            carbon_rebate_amounts = extract_carbon_rebate(result.get("sections", {}).get("Canada carbon rebate", []), client_file['year'])
-            ontario_trillium_amounts = extract_ontario_trillium(result.get("sections", {}).get("Ontario Trillium Benefit", []), client_file['year'])
-            climate_action_credit_amounts = extract_climate_action_credit(result.get("sections", {}).get("British Columbia Climate Action Tax Credit", []), client_file['year'])
-
-        elif language == 'FR':
-            tax_summary = extract_tax_summaryFR(result.get("sections", {}).get("Sommaire de la déclaration", []), client_file['year'])
-            province = tax_summary['province']
-            gst_amounts = extract_gst_creditFR(result.get("sections", {}).get("Estimation du crédit pour la TPS/TVH", []), client_file['year'])
-            ecgeb_amounts = extract_ecgeb_creditFR(result.get("sections", {}).get("Estimation de l'allocation canadienne pour l'épicerie", []), client_file['year'])
-            solidarity_amounts = extract_solidarity_creditFR(result.get("sections", {}).get("Estimation du calcul du crédit d'impôt pour solidarité", []), client_file['year'])
-            ccb_amounts = extract_child_benefitFR(result.get("sections", {}).get("l'allocation canadienne pour enfants", []), client_file['year'])
-            family_allowance_amounts = extract_family_allowanceFR(result.get("sections", {}).get("la mesure de l'Allocation famille", []), client_file['year'])
-            carryforward_amounts = extract_carryforward_summaryFR(result.get("sections", {}).get("Sommaire des montants reportés", []), province)
-            carbon_rebate_amounts = extract_carbon_rebateFR(result.get("sections", {}).get("remise canadienne sur le carbone", []), client_file['year'])
-            ontario_trillium_amounts = extract_ontario_trilliumFR(result.get("sections", {}).get("prestation Trillium de l'Ontario", []), client_file['year'])
-            climate_action_credit_amounts = extract_climate_action_credit(result.get("sections", {}).get("British Columbia Climate Action Tax Credit", []), client_file['year'])
-
-        # Create a summary dictionary
-        return_summary = {
-            "tax_summary": tax_summary,
-        }
-        if gst_amounts and any(gst_amounts.values()):
-            return_summary["gst_amounts"] = gst_amounts
-
-        if ecgeb_amounts and any(ecgeb_amounts.values()):
-            return_summary["ecgeb_amounts"] = ecgeb_amounts
-
-        if carryforward_amounts and any(carryforward_amounts.values()):
-            return_summary["carryforward_amounts"] = carryforward_amounts
-
-        if solidarity_amounts and any(solidarity_amounts.values()):
-            return_summary["solidarity_amounts"] = solidarity_amounts
-
-        if ccb_amounts and any(ccb_amounts.values()):
-            return_summary["ccb_amounts"] = ccb_amounts
-
-        if family_allowance_amounts and any(family_allowance_amounts.values()):
-            return_summary["family_allowance_amounts"] = family_allowance_amounts
-
-        if carbon_rebate_amounts and any(carbon_rebate_amounts.values()):
-            return_summary["carbon_rebate_amounts"] = carbon_rebate_amounts
-
-        if ontario_trillium_amounts and any(ontario_trillium_amounts.values()):
-            return_summary["ontario_trillium_amounts"] = ontario_trillium_amounts
-
-        if climate_action_credit_amounts and any(climate_action_credit_amounts.values()):
-            return_summary["climate_action_credit_amounts"] = climate_action_credit_amounts
-
-        client_file['summary'] = return_summary
+    for client_file in summarized_files:
+        return_summary = client_file['summary']
 
         if client_file.get('coupleWith') and client_file['coupleWith'] != 'Individual Summary':
             couple_label = client_file['coupleWith']
 
-            partner_file = next((cf for cf in client_files if cf['label'] == couple_label), None)
-
-            # Create a summary for the current client
-            return_summary = client_file['summary']  # Assuming this contains the summary
+            partner_file = next((cf for cf in summarized_files if cf['label'] == couple_label), None)
 
             # Find existing couple summary or create a new one
             existing_couple = next((s for s in coupled_summaries if s['label'] == couple_label), None)
@@ -250,7 +333,11 @@ def process_summaries(client_files, directory_path, doc_text_config=None):
         file_prefix = "Sommaire" if couple['clients'][0]['language'] == 'FR' else "Summary"
         output_file_name = f"{file_prefix} {couple_name} {year}.docx"
         output_file_path = os.path.join(directory_path, output_file_name)
-        createCoupleWordDoc(couple['clients'], output_file_path, doc_text_config=doc_text_config)  # Always use single-year function
+        client_names = [c.get('label') for c in couple['clients']] + [c.get('directory') for c in couple['clients']]
+        with span('docx.couple'), profiled_client('docx', directory_path, couple_name, *client_names):
+            createCoupleWordDoc(couple['clients'], output_file_path, doc_text_config=doc_text_config)  # Always use single-year function
+        count('docx.documents')
+        output_paths.append(output_file_path)
 
     # Group summaries by individual name
     individual_summaries_by_name = defaultdict(list)
@@ -261,17 +348,55 @@ def process_summaries(client_files, directory_path, doc_text_config=None):
 
     # Process individuals (multi-year allowed)
     for full_name, summaries in individual_summaries_by_name.items():
-        summaries.sort(key=lambda s: int(s['year']))  # Ensure sorting by year (converted to int)
+        summaries = sorted(summaries, key=lambda s: int(s['year']))  # Ensure sorting by year (converted to int)
         years = [s['year'] for s in summaries]  # Extract years for naming
 
         if len(summaries) > 1:  # Multi-year case
             year_str = ", ".join(map(str, years[:-1])) + f" & {years[-1]}" if len(years) > 1 else str(years[0])
             file_prefix = "Sommaire" if summaries[0]['language'] == 'FR' else "Summary"
             output_file_path = os.path.join(directory_path, f"{file_prefix} {full_name} {year_str}.docx")
-            createIndividualWordDocMultiYear(summaries, output_file_path, doc_text_config=doc_text_config)
+            with span('docx.multiyear'), profiled_client('docx', directory_path, full_name, *[s.get('directory') for s in summaries]):
+                createIndividualWordDocMultiYear(summaries, output_file_path, doc_text_config=doc_text_config)
         else:  # Single-year case
             individual = summaries[0]
             year = individual['year']
             file_prefix = "Sommaire" if individual['language'] == 'FR' else "Summary"
             output_file_path = os.path.join(directory_path, f"{file_prefix} {full_name} {year}.docx")
-            createIndividualWordDoc(individual, output_file_path, doc_text_config=doc_text_config)
+            with span('docx.individual'), profiled_client('docx', directory_path, full_name, individual.get('directory')):
+                createIndividualWordDoc(individual, output_file_path, doc_text_config=doc_text_config)
+        count('docx.documents')
+        output_paths.append(output_file_path)
+
+    return output_paths
+
+def create_summary_documents(client_files, directory_path, doc_text_config=None, export=False, summary_store=None):
+    """
+    Reentrant summary job: extract every client and build the Word documents
+    without mutating the inputs. With `export`, the extracted amounts are also
+    written as one CSV and one .npz file (models.summaryExport). With a
+    `summary_store` path, the summaries are saved there and the `prior_years`
+    of individual clients are read from it (models.summaryStore).
+    """
+    return document_summaries(summarize_client_files(client_files), directory_path, doc_text_config, export,
+                              summary_store)
+
+def document_summaries(summarized, directory_path, doc_text_config=None, export=False, summary_store=None):
+    """The store, Word documents and export steps of create_summary_documents, for already extracted clients."""
+    if summary_store:
+        from models.summaryStore import add_prior_years, save_summaries
+        with span('summary.store'):
+            save_summaries(summary_store, summarized)
+            summarized = summarized + add_prior_years(summary_store, summarized)
+    output_paths = write_summary_documents(summarized, directory_path, doc_text_config=doc_text_config)
+    if export:
+        from models.summaryExport import export_summaries
+        output_paths += export_summaries(summarized, directory_path)
+    return output_paths
+
+def process_summaries(client_files, directory_path, doc_text_config=None):
+    # Legacy entry point: same as create_summary_documents, but also stores each
+    # extracted summary back on the caller's client_file dicts.
+    summarized = summarize_client_files(client_files)
+    for client_file, summarized_file in zip(client_files, summarized):
+        client_file['summary'] = summarized_file['summary'].to_dict()
+    return write_summary_documents(summarized, directory_path, doc_text_config=doc_text_config)
@@ -3,9 +3,10 @@ from docx.shared import Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
-import locale
 import time
 
+from models.currencyFormat import format_amount, format_money
+from models.instrumentation import span
 from models.docTextHelper import resolve_doc_type_key, get_cfg, get_text, get_style, apply_style, apply_alignment, styled_run
 
 
@@ -24,17 +25,8 @@ def createCoupleWordDoc(couple_summaries, output_file_path, doc_text_config=None
         createCoupleWordDocFR(couple_summaries, output_file_path, doc_text_config)
 
 
-try:
-    locale.setlocale(locale.LC_ALL, 'fr_CA.UTF-8')
-except locale.Error:
-    try:
-        locale.setlocale(locale.LC_ALL, 'French_Canada.1252')  # Windows
-    except locale.Error:
-        pass
-
 def format_currency(amount):
-    # Convert the amount to a float and format it as a string
-    return f"{locale.format_string('%.2f', amount, grouping=True).replace('.', ',')} $"
+    return format_money(amount, 'FR')
 
 # Function to set default font and size for the entire document
 def set_default_font(doc, font_name, font_size):
@@ -121,7 +113,8 @@ def createIndividualWordDocEN(individual, output_file_path, doc_text_config=None
     conclusion(doc, isMailQC, cfg=cfg)
 
     # Save the document in the specified path
-    doc.save(output_file_path)
+    with span('docx.save'):
+        doc.save(output_file_path)
 
 def createCoupleWordDocEN(couple_summaries, output_file_path, doc_text_config=None):
     doc = Document()
@@ -179,7 +172,8 @@ def createCoupleWordDocEN(couple_summaries, output_file_path, doc_text_config=No
     conclusion(doc, cfg=cfg)
 
     # Save the document in the specified path
-    doc.save(output_file_path)
+    with span('docx.save'):
+        doc.save(output_file_path)
 
 # Section 1: Title and Header
 def section_1(doc, primary_summary, ind_title, year, isMailQC, couple=False, secondary_summary=None, secondary_ind_title=None, cfg=None):
@@ -1121,7 +1115,8 @@ def createIndividualWordDocFR(individual, output_file_path, doc_text_config=None
 
     conclusionFR(doc, isMailQC, cfg=cfg)
     # Save the document in the specified path
-    doc.save(output_file_path)
+    with span('docx.save'):
+        doc.save(output_file_path)
 
 def createCoupleWordDocFR(couple_summaries, output_file_path, doc_text_config=None):
     doc = Document()
@@ -1185,7 +1180,8 @@ def createCoupleWordDocFR(couple_summaries, output_file_path, doc_text_config=No
     conclusionFR(doc, isMailQC=isMailQC, cfg=cfg)
 
     # Save the document in the specified path
-    doc.save(output_file_path)
+    with span('docx.save'):
+        doc.save(output_file_path)
 
 def section_1FR(doc, return_summary, ind_title, year, isMailQC, couple=False, secondary_summary=None, secondary_ind_title=None, cfg=None):
     # Title: Centered, Dark Gray, 14pt, Calibri
@@ -1361,7 +1357,7 @@ def tax_returnFR(doc, return_summary, year, secondary_summary=None, primary_titl
 
     # Helper function for formatting numbers in the French style
     def format_french_number(amount):
-        return f"{amount:,.2f}".replace(",", " ").replace(".", ",")
+        return format_amount(amount, 'FR', thousands=' ')
 
     # Federal and Quebec Tax Return for primary individual
     if isCouple:
@@ -1469,9 +1465,9 @@ def tax_returnFR(doc, return_summary, year, secondary_summary=None, primary_titl
             else:
                 quebec_tuition_8_percent = 0
 
-        # Format the amounts without decimals and replace commas with spaces
-        formatted_federal_amount = locale.format_string("%d", federal_tuition_amount, grouping=True).replace(",", " ")
-        formatted_quebec_amount = locale.format_string("%d", quebec_tuition_8_percent, grouping=True).replace(",", " ")
+        # Format the amounts without decimals using French thousands separators
+        formatted_federal_amount = format_amount(int(federal_tuition_amount), 'FR', decimals=0)
+        formatted_quebec_amount = format_amount(int(quebec_tuition_8_percent), 'FR', decimals=0)
 
         # Add formatted amounts to the paragraph
         if federal_tuition_amount > 0:
@@ -1592,9 +1588,9 @@ def tax_returnFR(doc, return_summary, year, secondary_summary=None, primary_titl
                 else:
                     quebec_tuition_8_percent = 0
 
-            # Format the amounts without decimals and replace commas with spaces
-            formatted_federal_amount = locale.format_string("%d", federal_tuition_amount, grouping=True).replace(",", " ")
-            formatted_quebec_amount = locale.format_string("%d", quebec_tuition_8_percent, grouping=True).replace(",", " ")
+            # Format the amounts without decimals using French thousands separators
+            formatted_federal_amount = format_amount(int(federal_tuition_amount), 'FR', decimals=0)
+            formatted_quebec_amount = format_amount(int(quebec_tuition_8_percent), 'FR', decimals=0)
 
             # Add formatted amounts to the paragraph
             if federal_tuition_amount > 0:
@@ -1826,9 +1822,9 @@ def carryforward_amountsFR(doc, return_summary, cfg=None):
         else:
             quebec_tuition_8_percent = 0
 
-    # Format the amounts without decimals and replace commas with spaces
-    formatted_federal_amount = locale.format_string("%d", federal_tuition_amount, grouping=True).replace(",", " ")
-    formatted_quebec_amount = locale.format_string("%d", quebec_tuition_8_percent, grouping=True).replace(",", " ")
+    # Format the amounts without decimals using French thousands separators
+    formatted_federal_amount = format_amount(int(federal_tuition_amount), 'FR', decimals=0)
+    formatted_quebec_amount = format_amount(int(quebec_tuition_8_percent), 'FR', decimals=0)
 
     # Add formatted amounts to the paragraph
     if federal_tuition_amount > 0:
@@ -3,8 +3,9 @@ from docx.shared import Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
-import locale
 
+from models.currencyFormat import format_amount, format_money
+from models.instrumentation import span
 from models.docTextHelper import resolve_doc_type_key, get_cfg, get_text, get_style, apply_style, apply_alignment, styled_run
 
 def createIndividualWordDocMultiYear(individual, output_file_path, doc_text_config=None):
@@ -14,11 +15,8 @@ def createIndividualWordDocMultiYear(individual, output_file_path, doc_text_conf
         createIndividualWordDocFR(individual, output_file_path, doc_text_config)
 
 
-locale.setlocale(locale.LC_ALL, 'fr_CA.UTF-8')
-
 def format_currency(amount):
-    # Convert the amount to a float and format it as a string
-    return f"{locale.format_string('%.2f', amount, grouping=True).replace('.', ',')} $"
+    return format_money(amount, 'FR')
 
 # Function to set default font and size for the entire document
 def set_default_font(doc, font_name, font_size):
@@ -106,7 +104,8 @@ def createIndividualWordDocEN(individual, output_file_path, doc_text_config=None
             carryforward_amounts(doc, return_summary, cfg=cfg)
 
     conclusion(doc, isMailQC, cfg=cfg)
-    doc.save(output_file_path)
+    with span('docx.save'):
+        doc.save(output_file_path)
 
 
 # Section 1: Title and Header
@@ -841,7 +840,8 @@ def createIndividualWordDocFR(individual, output_file_path, doc_text_config=None
             carryforward_amountsFR(doc, return_summary, cfg=cfg)
 
     conclusionFR(doc, cfg=cfg)
-    doc.save(output_file_path)
+    with span('docx.save'):
+        doc.save(output_file_path)
 
 
 def section_1FR(doc, return_summary, ind_title, years, isMailQC, couple=False, secondary_summary=None, secondary_ind_title=None, cfg=None):
@@ -1019,7 +1019,7 @@ def tax_returnFR(doc, return_summary, year, last_year, secondary_summary=None, p
 
     # Helper function to format numbers in the French style
     def format_french_number(amount):
-        return f"{amount:,.2f}".replace(",", " ").replace(".", ",")
+        return format_amount(amount, 'FR', thousands=' ')
 
         # Function to handle payment section if amounts are owed
     def add_payment_section(para, federal_owing, quebec_owing, year, last_year):
@@ -1138,35 +1138,35 @@ def tax_returnFR(doc, return_summary, year, last_year, secondary_summary=None, p
             no_bal = get_text(cfg, 'noBalance', 'Vous n\u2019avez ni remboursement ni solde d\u00fb.')
             para.add_run(f"{no_bal}\n")
 
-    if province == "Qu\u00e9bec":
-        # Quebec Tax Return for secondary individual
-        qc_label = get_text(cfg, 'quebecReturnLabel', 'D\u00e9claration Provinciale')
-        r = para.add_run(f'{qc_label}\n')
-        apply_style(r, get_style(cfg, 'quebecReturnLabel') or {'bold': True})
-        quebec_refund = secondary_summary["tax_summary"]["quebec_refund"]
-        quebec_owing = secondary_summary["tax_summary"]["quebec_owing"]
+        if province == "Qu\u00e9bec":
+            # Quebec Tax Return for secondary individual
+            qc_label = get_text(cfg, 'quebecReturnLabel', 'D\u00e9claration Provinciale')
+            r = para.add_run(f'{qc_label}\n')
+            apply_style(r, get_style(cfg, 'quebecReturnLabel') or {'bold': True})
+            quebec_refund = secondary_summary["tax_summary"]["quebec_refund"]
+            quebec_owing = secondary_summary["tax_summary"]["quebec_owing"]
 
-        if quebec_refund > 0:
-            refund_prefix = get_text(cfg, 'refundPrefix', 'Vous avez droit \u00e0 un remboursement de')
-            para.add_run(f"{refund_prefix} ").bold = False
-            refund_run = para.add_run(f"{format_french_number(quebec_refund)} $ \n")
-            refund_run.bold = True
-            refund_run.font.color.rgb = RGBColor(0, 128, 0)
-        elif quebec_owing > 0:
-            owing_prefix = get_text(cfg, 'owingPrefix', 'Vous devez un montant de')
-            para.add_run(f"{owing_prefix} ").bold = False
-            owing_run = para.add_run(f"{format_french_number(quebec_owing)} $ \n")
-            owing_run.bold = True
-            owing_run.font.color.rgb = RGBColor(255, 0, 0)
-        else:
-            no_bal = get_text(cfg, 'noBalance', 'Vous n\u2019avez ni remboursement ni solde d\u00fb.')
-            para.add_run(f"{no_bal}\n")
+            if quebec_refund > 0:
+                refund_prefix = get_text(cfg, 'refundPrefix', 'Vous avez droit \u00e0 un remboursement de')
+                para.add_run(f"{refund_prefix} ").bold = False
+                refund_run = para.add_run(f"{format_french_number(quebec_refund)} $ \n")
+                refund_run.bold = True
+                refund_run.font.color.rgb = RGBColor(0, 128, 0)
+            elif quebec_owing > 0:
+                owing_prefix = get_text(cfg, 'owingPrefix', 'Vous devez un montant de')
+                para.add_run(f"{owing_prefix} ").bold = False
+                owing_run = para.add_run(f"{format_french_number(quebec_owing)} $ \n")
+                owing_run.bold = True
+                owing_run.font.color.rgb = RGBColor(255, 0, 0)
+            else:
+                no_bal = get_text(cfg, 'noBalance', 'Vous n\u2019avez ni remboursement ni solde d\u00fb.')
+                para.add_run(f"{no_bal}\n")
 
-        # Add payment section for secondary individual if this is the last year
-        add_payment_section(doc, federal_owing, quebec_owing if province == "Qu\u00e9bec" else 0, year, last_year)
+            # Add payment section for secondary individual if this is the last year
+            add_payment_section(doc, federal_owing, quebec_owing if province == "Qu\u00e9bec" else 0, year, last_year)
 
-        if "carryforward_amounts" in secondary_summary and secondary_summary["carryforward_amounts"]:
-            carryforward_amounts(doc, secondary_summary, cfg=cfg)
+            if "carryforward_amounts" in secondary_summary and secondary_summary["carryforward_amounts"]:
+                carryforward_amounts(doc, secondary_summary, cfg=cfg)
 
 
 # Section: Crédit de solidarité
@@ -1376,9 +1376,9 @@ def carryforward_amountsFR(doc, return_summary, cfg=None):
         else:
             quebec_tuition_8_percent = 0
 
-    # Format the amounts without decimals and replace commas with spaces
-    formatted_federal_amount = locale.format_string("%d", federal_tuition_amount, grouping=True).replace(",", " ")
-    formatted_quebec_amount = locale.format_string("%d", quebec_tuition_8_percent, grouping=True).replace(",", " ")
+    # Format the amounts without decimals using French thousands separators
+    formatted_federal_amount = format_amount(int(federal_tuition_amount), 'FR', decimals=0)
+    formatted_quebec_amount = format_amount(int(quebec_tuition_8_percent), 'FR', decimals=0)
 
     # Add formatted amounts to the paragraph
     if federal_tuition_amount > 0:
@@ -0,0 +1,70 @@
+"""
+Locale-independent money formatting for Canadian English and French documents.
+
+The docx builders used to call locale.setlocale('fr_CA.UTF-8') at import time and
+format through locale.format_string. That mutated process-global state, failed on
+machines without the French locale installed and was slow. The separators below
+reproduce the fr_CA / en_CA conventions directly:
+
+    EN: $1,234.56
+    FR: 1 234,56 $   (thousands separator is a no-break space, as in fr_CA)
+
+The French amounts that were formatted with f-strings (the summaries' results
+section and the confirmation email) are grouped by an ASCII space; pass
+thousands=' ' to keep them so.
+"""
+
+from functools import lru_cache
+
+NBSP = '\u00a0'
+
+# language -> (prefix, suffix, thousands separator, decimal separator)
+SEPARATORS = {
+    'EN': ('$', '', ',', '.'),
+    'FR': ('', ' $', NBSP, ','),
+}
+
+# Python's format mini-language always emits ',' and '.'; translate them in one pass.
+_TRANSLATIONS = {
+    language: str.maketrans({',': thousands, '.': decimal})
+    for language, (_, _, thousands, decimal) in SEPARATORS.items()
+}
+_SPECS = {
+    (decimals, grouping): f"{',' if grouping else ''}.{decimals}f"
+    for decimals in (0, 2)
+    for grouping in (True, False)
+}
+
+
+def _normalize_language(language):
+    """Accept 'EN'/'FR' as used by the summaries and 'en'/'fr' as used by confirmations."""
+    return 'FR' if str(language).upper() == 'FR' else 'EN'
+
+
+@lru_cache(maxsize=8192)
+def _format(amount, language, decimals, grouping, thousands):
+    spec = _SPECS.get((decimals, grouping)) or f"{',' if grouping else ''}.{decimals}f"
+    translation = _TRANSLATIONS[language]
+    if thousands is not None:
+        translation = {**translation, ord(','): thousands}
+    return format(amount, spec).translate(translation)
+
+
+def _cache_key(amount):
+    # -0.0 == 0.0 would otherwise share a cache slot with '-0.00'; None still raises, as it did
+    return 0 if amount == 0 else amount
+
+
+def format_amount(amount, language='EN', decimals=2, grouping=True, thousands=None):
+    """
+    Format a number with the language's separators but without the currency
+    sign; `thousands` replaces the language's thousands separator.
+    """
+    return _format(_cache_key(amount), _normalize_language(language), decimals, grouping, thousands)
+
+
+def format_money(amount, language='EN', grouping=True, thousands=None):
+    """Format an amount as Canadian dollars, e.g. '$1,234.56' or '1 234,56 $'."""
+    language = _normalize_language(language)
+    prefix, suffix, _, _ = SEPARATORS[language]
+    return f"{prefix}{_format(_cache_key(amount), language, 2, grouping, thousands)}{suffix}"
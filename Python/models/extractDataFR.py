@@ -1,60 +1,19 @@
 import json
 import re
 
+from models.amounts import FR_COLUMN_PATTERN, amount_cents, cents_between_labels, digits_cents, parse_cents
+from models.returnSummary import BenefitSchedule, TaxSummary
 
-def convert_to_float(value):
-    # Check if value is None or empty
-    if not value:
-        return 0.0
-
-    cleaned_value = value.replace(' ', '').replace(',', '')
-    if len(cleaned_value) < 2:
-        return 0.0
-
-    decimal_part = cleaned_value[-2:]
-    integer_part = cleaned_value[:-2]
-    final_value = f"{integer_part}.{decimal_part}"
-
-    try:
-        return float(final_value)
-    except ValueError:
-        print(f"Error converting '{value}' to float.")
-        return 0.0
-
-def extract_value_between_labelsFR(label, next_label, line):
-    """
-    Extract the value in the format #### ## or # ### ## between the given label and the next_label.
-    """
-    # Regex to match #### ## or # ### ##
-    number_pattern = r'(\d{1,3}(?:\s\d{3})*\s\d{2}|\d{1,3}\s\d{2})'
-
-    # Check if the label is present in the line
-    if label in line:
-        # Extract the part of the line after the current label
-        after_label = line.split(label)[-1]
-
-        # Only split by the next label if it is not empty
-        if next_label and next_label in after_label:
-            after_label = after_label.split(next_label)[0]
-
-        # Search for the number pattern in the part after the label
-        match = re.search(number_pattern, after_label.strip())
-
-        if match:
-            # Return the float value by cleaning the string
-            return convert_to_float(match.group(0).replace(' ', ''))
-
-    return 0.0
 
 def extract_tax_summaryFR(tax_summary_lines, year):
     result = {
         "first_name": None,
         "last_name": None,
         "province": None,
-        "federal_refund": 0.0,
-        "federal_owing": 0.0,
-        "quebec_refund": 0.0,
-        "quebec_owing": 0.0
+        "federal_refund": None,
+        "federal_owing": None,
+        "quebec_refund": None,
+        "quebec_owing": None
     }
 
     for line in tax_summary_lines:
@@ -74,79 +33,73 @@ def extract_tax_summaryFR(tax_summary_lines, year):
             result["quebec_owing"] = line.split("Solde à payer 479 =")[-1].strip()
 
 
-    result["federal_refund"] = convert_to_float(result.get("federal_refund"))
-    result["federal_owing"] = convert_to_float(result.get("federal_owing"))
-    result["quebec_refund"] = convert_to_float(result.get("quebec_refund"))
-    result["quebec_owing"] = convert_to_float(result.get("quebec_owing"))
+    result["federal_refund"] = digits_cents(result.get("federal_refund"))
+    result["federal_owing"] = digits_cents(result.get("federal_owing"))
+    result["quebec_refund"] = digits_cents(result.get("quebec_refund"))
+    result["quebec_owing"] = digits_cents(result.get("quebec_owing"))
 
-    return result
+    return TaxSummary(**result)
 
 def extract_gst_creditFR(gst_credit_lines, year):
     gst_credit_result = {
-        "gst_credit_amount": 0.0,
-        "july_amount": 0.0,
-        "october_amount": 0.0,
-        "january_amount": 0.0,
-        "april_amount": 0.0
+        "gst_credit_amount": 0,
+        "july_amount": 0,
+        "october_amount": 0,
+        "january_amount": 0,
+        "april_amount": 0
     }
 
-    number_pattern = r'(\d{1,3}(?:\s\d{3})*\s\d{2}|\d{1,3}\s\d{2})'
-
     for line in gst_credit_lines:
         if "Crédit pour taxe sur les produits et services (si la ligne 24 est moins de 1 $, inscrivez zéro)." in line:
-            match = re.search(number_pattern, line)
-            if match:
-                gst_credit_result["gst_credit_amount"] = convert_to_float(match.group(0).replace(' ', ''))
+            amount = parse_cents(line, 'FR')
+            if amount is not None:
+                gst_credit_result["gst_credit_amount"] = amount
         if f"juillet {year + 1}" in line:
-            gst_credit_result["july_amount"] = extract_value_between_labelsFR(f"juillet {year + 1}", f"janvier {year + 2}", line)
+            gst_credit_result["july_amount"] = cents_between_labels(f"juillet {year + 1}", f"janvier {year + 2}", line, 'FR')
         if f"octobre {year + 1}" in line:
-            gst_credit_result["october_amount"] = extract_value_between_labelsFR(f"octobre {year + 1}", f"avril {year + 2}", line)
+            gst_credit_result["october_amount"] = cents_between_labels(f"octobre {year + 1}", f"avril {year + 2}", line, 'FR')
         if f"janvier {year + 2}" in line:
-            gst_credit_result["january_amount"] = extract_value_between_labelsFR(f"janvier {year + 2}", "", line)
+            gst_credit_result["january_amount"] = cents_between_labels(f"janvier {year + 2}", "", line, 'FR')
         if f"avril {year + 2}" in line:
-            gst_credit_result["april_amount"] = extract_value_between_labelsFR(f"avril {year + 2}", "", line)
+            gst_credit_result["april_amount"] = cents_between_labels(f"avril {year + 2}", "", line, 'FR')
 
-    return gst_credit_result
+    return BenefitSchedule.from_cents('gst_amounts', gst_credit_result)
 
 def extract_ecgeb_creditFR(ecgeb_lines, year):
     ecgeb_result = {
-        "ecgeb_credit_amount": 0.0,
-        "july_amount": 0.0,
-        "october_amount": 0.0,
-        "january_amount": 0.0,
-        "april_amount": 0.0
+        "ecgeb_credit_amount": 0,
+        "july_amount": 0,
+        "october_amount": 0,
+        "january_amount": 0,
+        "april_amount": 0
     }
 
-    number_pattern = r'(\d{1,3}(?:\s\d{3})*\s\d{2}|\d{1,3}\s\d{2})'
-
     for line in ecgeb_lines:
         # if "Allocation canadienne pour l'épicerie et les besoins essentiels (0$ si la ligne 24 est moins de 1 $)." in line:
-        #    match = re.search(number_pattern, line)
-        #    if match:
-        #        ecgeb_result["ecgeb_credit_amount"] = convert_to_float(match.group(0).replace(' ', ''))
+        #    amount = parse_cents(line, 'FR')
+        #    if amount is not None:
+        #        ecgeb_result["ecgeb_credit_amount"] = amount
         if f"juillet {year + 1}" in line:
-            ecgeb_result["july_amount"] = extract_value_between_labelsFR(f"juillet {year + 1}", f"janvier {year + 2}", line)
+            ecgeb_result["july_amount"] = cents_between_labels(f"juillet {year + 1}", f"janvier {year + 2}", line, 'FR')
         if f"octobre {year + 1}" in line:
-            ecgeb_result["october_amount"] = extract_value_between_labelsFR(f"octobre {year + 1}", f"avril {year + 2}", line)
+            ecgeb_result["october_amount"] = cents_between_labels(f"octobre {year + 1}", f"avril {year + 2}", line, 'FR')
         if f"janvier {year + 2}" in line:
-            ecgeb_result["january_amount"] = extract_value_between_labelsFR(f"janvier {year + 2}", "", line)
+            ecgeb_result["january_amount"] = cents_between_labels(f"janvier {year + 2}", "", line, 'FR')
         if f"avril {year + 2}" in line:
-            ecgeb_result["april_amount"] = extract_value_between_labelsFR(f"avril {year + 2}", "", line)
+            ecgeb_result["april_amount"] = cents_between_labels(f"avril {year + 2}", "", line, 'FR')
         ecgeb_result["ecgeb_credit_amount"] = ecgeb_result["july_amount"] + ecgeb_result["october_amount"] +ecgeb_result["january_amount"] +ecgeb_result["april_amount"]
-    return ecgeb_result
+    return BenefitSchedule.from_cents('ecgeb_amounts', ecgeb_result)
 
 def extract_carbon_rebateFR(carbon_rebate_lines, year):
     # Initialize the carbon rebate result dictionary
     carbon_rebate_result = {
-        "carbon_rebate_amount": 0.0,
-        "january_amount": 0.0,
-        "april_amount": 0.0,
-        "july_amount": 0.0,
-        "october_amount": 0.0
+        "carbon_rebate_amount": 0,
+        "january_amount": 0,
+        "april_amount": 0,
+        "july_amount": 0,
+        "october_amount": 0
     }
 
-    number_pattern = r'(\d{1,3}(?:,\d{3})*\s\d{2}|\d{1,3}\s\d{2})'
-
     # Dynamic year calculation
     year_plus_1 = year + 1
     year_plus_2 = year + 2
@@ -154,36 +107,36 @@ def extract_carbon_rebateFR(carbon_rebate_lines, year):
     for line in carbon_rebate_lines:
 
         if f"avril {year_plus_1}" in line:
-            carbon_rebate_result["april_amount"] = extract_value_between_labelsFR(f"avril {year_plus_1}", f"octobre {year_plus_1}", line)
+            carbon_rebate_result["april_amount"] = cents_between_labels(f"avril {year_plus_1}", f"octobre {year_plus_1}", line, 'FR')
 
         if f"juillet {year_plus_1}" in line:
-            carbon_rebate_result["july_amount"] = extract_value_between_labelsFR(f"juillet {year_plus_1}", f"juillet {year_plus_1}", line)
+            carbon_rebate_result["july_amount"] = cents_between_labels(f"juillet {year_plus_1}", f"juillet {year_plus_1}", line, 'FR')
 
         if f"octobre {year_plus_1}" in line:
-            carbon_rebate_result["october_amount"] = extract_value_between_labelsFR(f"octobre {year_plus_1}", f"", line)
+            carbon_rebate_result["october_amount"] = cents_between_labels(f"octobre {year_plus_1}", f"", line, 'FR')
 
         if f"janvier {year_plus_2}" in line:
-            carbon_rebate_result["january_amount"] = extract_value_between_labelsFR(f"janvier {year_plus_2}", "", line)
+            carbon_rebate_result["january_amount"] = cents_between_labels(f"janvier {year_plus_2}", "", line, 'FR')
 
         carbon_rebate_result["carbon_rebate_amount"] = carbon_rebate_result["april_amount"] + carbon_rebate_result["july_amount"] + carbon_rebate_result["october_amount"] + carbon_rebate_result["january_amount"]
-    return carbon_rebate_result
+    return BenefitSchedule.from_cents('carbon_rebate_amounts', carbon_rebate_result)
 
 def extract_ontario_trilliumFR(ontario_trillium_lines, year):
     # Initialize the carbon rebate result dictionary
     ontario_trillium_result = {
-        "ontario_trillium_amount": 0.0,
-        "january_amount": 0.0,
-        "february_amount": 0.0,
-        "march_amount": 0.0,
-        "april_amount": 0.0,
-        "may_amount": 0.0,
-        "june_amount": 0.0,
-        "july_amount": 0.0,
-        "august_amount": 0.0,
-        "september_amount": 0.0,
-        "october_amount": 0.0,
-        "november_amount": 0.0,
-        "december_amount": 0.0
+        "ontario_trillium_amount": 0,
+        "january_amount": 0,
+        "february_amount": 0,
+        "march_amount": 0,
+        "april_amount": 0,
+        "may_amount": 0,
+        "june_amount": 0,
+        "july_amount": 0,
+        "august_amount": 0,
+        "september_amount": 0,
+        "october_amount": 0,
+        "november_amount": 0,
+        "december_amount": 0
     }
 
     # Dynamic year calculation
@@ -193,85 +146,85 @@ def extract_ontario_trilliumFR(ontario_trillium_lines, year):
     # Iterate over all the lines and extract the rebate amounts (French month names)
     for line in ontario_trillium_lines:
         if f"Juillet {year_plus_1}" in line and f"Janvier {year_plus_2}" in line:
-            ontario_trillium_result["july_amount"] = extract_value_between_labelsFR(f"Juillet {year_plus_1}", f"Janvier {year_plus_2}", line)
+            ontario_trillium_result["july_amount"] = cents_between_labels(f"Juillet {year_plus_1}", f"Janvier {year_plus_2}", line, 'FR')
 
         if f"Août {year_plus_1}" in line and f"Février {year_plus_2}" in line:
-            ontario_trillium_result["august_amount"] = extract_value_between_labelsFR(f"Août {year_plus_1}", f"Février {year_plus_2}", line)
+            ontario_trillium_result["august_amount"] = cents_between_labels(f"Août {year_plus_1}", f"Février {year_plus_2}", line, 'FR')
 
         if f"Septembre {year_plus_1}" in line and f"Mars {year_plus_2}" in line:
-            ontario_trillium_result["september_amount"] = extract_value_between_labelsFR(f"Septembre {year_plus_1}", f"Mars {year_plus_2}", line)
+            ontario_trillium_result["september_amount"] = cents_between_labels(f"Septembre {year_plus_1}", f"Mars {year_plus_2}", line, 'FR')
 
         if f"Octobre {year_plus_1}" in line and f"Avril {year_plus_2}" in line:
-            ontario_trillium_result["october_amount"] = extract_value_between_labelsFR(f"Octobre {year_plus_1}", f"Avril {year_plus_2}", line)
+            ontario_trillium_result["october_amount"] = cents_between_labels(f"Octobre {year_plus_1}", f"Avril {year_plus_2}", line, 'FR')
 
         if f"Novembre {year_plus_1}" in line and f"Mai {year_plus_2}" in line:
-            ontario_trillium_result["november_amount"] = extract_value_between_labelsFR(f"Novembre {year_plus_1}", f"Mai {year_plus_2}", line)
+            ontario_trillium_result["november_amount"] = cents_between_labels(f"Novembre {year_plus_1}", f"Mai {year_plus_2}", line, 'FR')
 
         if f"Décembre {year_plus_1}" in line and f"Juin {year_plus_2}" in line:
-            ontario_trillium_result["december_amount"] = extract_value_between_labelsFR(f"Décembre {year_plus_1}", f"Juin {year_plus_2}", line)
+            ontario_trillium_result["december_amount"] = cents_between_labels(f"Décembre {year_plus_1}", f"Juin {year_plus_2}", line, 'FR')
 
         if f"Janvier {year_plus_2}" in line:
-            ontario_trillium_result["january_amount"] = extract_value_between_labelsFR(f"Janvier {year_plus_2}", "", line)
+            ontario_trillium_result["january_amount"] = cents_between_labels(f"Janvier {year_plus_2}", "", line, 'FR')
 
         if f"Février {year_plus_2}" in line:
-            ontario_trillium_result["february_amount"] = extract_value_between_labelsFR(f"Février {year_plus_2}", "", line)
+            ontario_trillium_result["february_amount"] = cents_between_labels(f"Février {year_plus_2}", "", line, 'FR')
 
         if f"Mars {year_plus_2}" in line:
-            ontario_trillium_result["march_amount"] = extract_value_between_labelsFR(f"Mars {year_plus_2}", "", line)
+            ontario_trillium_result["march_amount"] = cents_between_labels(f"Mars {year_plus_2}", "", line, 'FR')
 
         if f"Avril {year_plus_2}" in line:
-            ontario_trillium_result["april_amount"] = extract_value_between_labelsFR(f"Avril {year_plus_2}", "", line)
+            ontario_trillium_result["april_amount"] = cents_between_labels(f"Avril {year_plus_2}", "", line, 'FR')
 
         if f"Mai {year_plus_2}" in line:
-            ontario_trillium_result["may_amount"] = extract_value_between_labelsFR(f"Mai {year_plus_2}", "", line)
+            ontario_trillium_result["may_amount"] = cents_between_labels(f"Mai {year_plus_2}", "", line, 'FR')
 
         if f"Juin {year_plus_2}" in line:
-            ontario_trillium_result["june_amount"] = extract_value_between_labelsFR(f"Juin {year_plus_2}", "", line)
+            ontario_trillium_result["june_amount"] = cents_between_labels(f"Juin {year_plus_2}", "", line, 'FR')
 
     # Now sum the amounts to get the total carbon rebate amount
     total_rebate = sum(ontario_trillium_result[month] for month in ontario_trillium_result if month != "carbon_rebate_amount")
     ontario_trillium_result["ontario_trillium_amount"] = total_rebate
 
-    return ontario_trillium_result
+    return BenefitSchedule.from_cents('ontario_trillium_amounts', ontario_trillium_result)
 
 
 
 def extract_solidarity_creditFR(solidarity_lines, year):
     # Initialize the solidarity credit result dictionary
     solidarity_credit_result = {
-        "solidarity_credit_amount": 0.0,
-        "july_amount": 0.0,
-        "august_amount": 0.0,
-        "september_amount": 0.0,
-        "october_amount": 0.0,
-        "november_amount": 0.0,
-        "december_amount": 0.0,
-        "january_amount": 0.0,
-        "february_amount": 0.0,
-        "march_amount": 0.0,
-        "april_amount": 0.0,
-        "may_amount": 0.0,
-        "june_amount": 0.0
+        "solidarity_credit_amount": 0,
+        "july_amount": 0,
+        "august_amount": 0,
+        "september_amount": 0,
+        "october_amount": 0,
+        "november_amount": 0,
+        "december_amount": 0,
+        "january_amount": 0,
+        "february_amount": 0,
+        "march_amount": 0,
+        "april_amount": 0,
+        "may_amount": 0,
+        "june_amount": 0
     }
 
     for line in solidarity_lines:
         # Extract amounts for each month by checking specific months and stopping at the next month's label
         if f"Juillet {year + 1}" in line:
-            solidarity_credit_result["july_amount"] = extract_value_between_labelsFR(f"Juillet {year + 1}", f"Août {year + 1}", line)
-            solidarity_credit_result["august_amount"] = extract_value_between_labelsFR(f"Août {year + 1}", f"Septembre {year + 1}", line)
-            solidarity_credit_result["september_amount"] = extract_value_between_labelsFR(f"Septembre {year + 1}", f"Octobre {year + 1}", line)
-            solidarity_credit_result["october_amount"] = extract_value_between_labelsFR(f"Octobre {year + 1}", f"Novembre {year + 1}", line)
-            solidarity_credit_result["november_amount"] = extract_value_between_labelsFR(f"Novembre {year + 1}", f"Décembre {year + 1}", line)
-            solidarity_credit_result["december_amount"] = extract_value_between_labelsFR(f"Décembre {year + 1}", "", line)
+            solidarity_credit_result["july_amount"] = cents_between_labels(f"Juillet {year + 1}", f"Août {year + 1}", line, 'FR')
+            solidarity_credit_result["august_amount"] = cents_between_labels(f"Août {year + 1}", f"Septembre {year + 1}", line, 'FR')
+            solidarity_credit_result["september_amount"] = cents_between_labels(f"Septembre {year + 1}", f"Octobre {year + 1}", line, 'FR')
+            solidarity_credit_result["october_amount"] = cents_between_labels(f"Octobre {year + 1}", f"Novembre {year + 1}", line, 'FR')
+            solidarity_credit_result["november_amount"] = cents_between_labels(f"Novembre {year + 1}", f"Décembre {year + 1}", line, 'FR')
+            solidarity_credit_result["december_amount"] = cents_between_labels(f"Décembre {year + 1}", "", line, 'FR')
 
         # Extract amounts for the second line (January to June)
         if f"Janvier {year + 2}" in line:
-            solidarity_credit_result["january_amount"] = extract_value_between_labelsFR(f"Janvier {year + 2}", f"Février {year + 2}", line)
-            solidarity_credit_result["february_amount"] = extract_value_between_labelsFR(f"Février {year + 2}", f"Mars {year + 2}", line)
-            solidarity_credit_result["march_amount"] = extract_value_between_labelsFR(f"Mars {year + 2}", f"Avril {year + 2}", line)
-            solidarity_credit_result["april_amount"] = extract_value_between_labelsFR(f"Avril {year + 2}", f"Mai {year + 2}", line)
-            solidarity_credit_result["may_amount"] = extract_value_between_labelsFR(f"Mai {year + 2}", f"Juin {year + 2}", line)
-            solidarity_credit_result["june_amount"] = extract_value_between_labelsFR(f"Juin {year + 2}", "", line)
+            solidarity_credit_result["january_amount"] = cents_between_labels(f"Janvier {year + 2}", f"Février {year + 2}", line, 'FR')
+            solidarity_credit_result["february_amount"] = cents_between_labels(f"Février {year + 2}", f"Mars {year + 2}", line, 'FR')
+            solidarity_credit_result["march_amount"] = cents_between_labels(f"Mars {year + 2}", f"Avril {year + 2}", line, 'FR')
+            solidarity_credit_result["april_amount"] = cents_between_labels(f"Avril {year + 2}", f"Mai {year + 2}", line, 'FR')
+            solidarity_credit_result["may_amount"] = cents_between_labels(f"Mai {year + 2}", f"Juin {year + 2}", line, 'FR')
+            solidarity_credit_result["june_amount"] = cents_between_labels(f"Juin {year + 2}", "", line, 'FR')
 
     monthly_amounts = [
         solidarity_credit_result["july_amount"],
@@ -291,38 +244,37 @@ def extract_solidarity_creditFR(solidarity_lines, year):
     # Sum all monthly amounts to calculate the total solidarity credit amount
     solidarity_credit_result["solidarity_credit_amount"] = sum(monthly_amounts)
 
-    return solidarity_credit_result
+    return BenefitSchedule.from_cents('solidarity_amounts', solidarity_credit_result)
 
 
 import re
 
 def parse_fa_trimestriel(line, month_label):
     """
-    Extract the trimestriel (quarterly) amount from a QC Family Allowance line.
-    Uses non-overlapping regex findall to handle FR amounts with space-separated
-    thousands (e.g. '1 006 33' = $1,006.33).
+    Extract the trimestriel (quarterly) amount, in cents, from a QC Family Allowance line.
+    Uses the non-overlapping findall of the FR column pattern to handle amounts with
+    space-separated thousands (e.g. '1 006 33' = $1,006.33).
     """
     after_month = line.split(month_label)[-1].strip()
 
     # Find all FR-formatted amounts: dollar part (space-separated thousands) + cents.
     # Non-overlapping matches naturally separate quarterly from monthly.
-    amount_re = re.compile(r'(\d{1,3}(?:\s\d{3})*)\s(\d{2})(?!\d)')
-    matches = amount_re.findall(after_month)
+    matches = FR_COLUMN_PATTERN.findall(after_month)
 
     if len(matches) < 2:
-        return 0.0
+        return 0
 
     # Last two matches: quarterly (second-to-last) and monthly (last)
     trim_match = matches[-2]
     mens_match = matches[-1]
-    mensuel = float(mens_match[0].replace(' ', '') + '.' + mens_match[1])
-    candidate = float(trim_match[0].replace(' ', '') + '.' + trim_match[1])
+    mensuel = amount_cents(*mens_match)
+    candidate = amount_cents(*trim_match)
 
     # Disambiguate — if dollar part has space, a count-column digit
     # may have been absorbed as thousands lead
     if ' ' in trim_match[0]:
         parts = trim_match[0].split()
-        short_candidate = float(''.join(parts[1:]) + '.' + trim_match[1])
+        short_candidate = amount_cents(''.join(parts[1:]), trim_match[1])
         expected = mensuel * 3
         if abs(short_candidate - expected) < abs(candidate - expected):
             return short_candidate
@@ -332,7 +284,7 @@ def parse_fa_trimestriel(line, month_label):
 
 def parse_benefit_amount(line, month_label):
     """
-    Extract the monetary amount (Montant column) from a benefit table line.
+    Extract the monetary amount (Montant column), in cents, from a benefit table line.
     The table has 3 count columns after the month label before the amount:
     (Nb personnes à charge, Nb enfants handicapés, Nb enfants en garde partagée).
     Skipping those 3 columns avoids absorbing a preceding count digit into the amount.
@@ -340,44 +292,31 @@ def parse_benefit_amount(line, month_label):
     after_month = line.split(month_label)[-1].strip()
     tokens = after_month.split()
     if len(tokens) <= 3:
-        return 0.0
-    after_counts_str = ' '.join(tokens[3:])
-    match = re.search(r'(\d{1,3}(?:\s\d{3})*\s\d{2})', after_counts_str)
-    if match:
-        return convert_to_float(match.group(1).replace(' ', ''))
-    return 0.0
+        return 0
+    return parse_cents(' '.join(tokens[3:]), 'FR') or 0
 
 
 def extract_child_benefitFR(child_benefit_lines, year):
     result_child_benefit = {
-        "ccb_amount": 0.0,
-        "july_amount": 0.0,
-        "august_amount": 0.0,
-        "september_amount": 0.0,
-        "october_amount": 0.0,
-        "november_amount": 0.0,
-        "december_amount": 0.0,
-        "january_amount": 0.0,
-        "february_amount": 0.0,
-        "march_amount": 0.0,
-        "april_amount": 0.0,
-        "may_amount": 0.0,
-        "june_amount": 0.0
+        "ccb_amount": 0,
+        "july_amount": 0,
+        "august_amount": 0,
+        "september_amount": 0,
+        "october_amount": 0,
+        "november_amount": 0,
+        "december_amount": 0,
+        "january_amount": 0,
+        "february_amount": 0,
+        "march_amount": 0,
+        "april_amount": 0,
+        "may_amount": 0,
+        "june_amount": 0
     }
 
-    # Helper to parse French-formatted amounts like "10 455 48" (no preceding count columns)
-    def parse_amount_from_line(line):
-        match = re.search(r'((?:\d{1,3}(?:\s\d{3})*)\s\d{2})', line)
-        if match:
-            raw_amount = match.group(1).replace(' ', '')
-            if len(raw_amount) >= 3:
-                return float(raw_amount[:-2] + '.' + raw_amount[-2:])
-        return 0.0
-
-    # Extract the overall CCB amount (no count columns on this line)
+    # Extract the overall CCB amount (no count columns on this line), e.g. "10 455 48"
     for line in child_benefit_lines:
         if "Prestation totale = " in line:
-            result_child_benefit["ccb_amount"] = parse_amount_from_line(line)
+            result_child_benefit["ccb_amount"] = parse_cents(line, 'FR') or 0
             break
 
     month_map = {
@@ -406,16 +345,16 @@ def extract_child_benefitFR(child_benefit_lines, year):
             result_child_benefit[key] for key in result_child_benefit if key.endswith("_amount") and key != "ccb_amount"
         ])
 
-    return result_child_benefit
+    return BenefitSchedule.from_cents('ccb_amounts', result_child_benefit)
 
 
 def extract_family_allowanceFR(family_allowance_lines, year):
     result_family_allowance = {
-        "fa_amount": 0.0,
-        "july_amount": 0.0,
-        "october_amount": 0.0,
-        "january_amount": 0.0,
-        "april_amount": 0.0
+        "fa_amount": 0,
+        "july_amount": 0,
+        "october_amount": 0,
+        "january_amount": 0,
+        "april_amount": 0
     }
 
     month_map = {
@@ -437,7 +376,7 @@ def extract_family_allowanceFR(family_allowance_lines, year):
         result_family_allowance["april_amount"]
     )
 
-    return result_family_allowance
+    return BenefitSchedule.from_cents('family_allowance_amounts', result_family_allowance)
 
 
 def extract_carryforward_summaryFR(carryforward_lines, province):
@@ -0,0 +1,197 @@
+"""
+Per-stage timing spans and counters for the document jobs.
+
+Off unless the TAX_APP_METRICS environment variable is set when a job starts:
+
+    TAX_APP_METRICS=1 (or 'stderr')  one 'METRICS {...}' JSON line on stderr, which
+                                     main.ts forwards to the application log
+    TAX_APP_METRICS=<directory>      a '<job>-<timestamp>-<pid>-<id>.json' sidecar per job
+
+While no job is recording, span() returns a shared no-op context manager and
+count() returns immediately, so the calls can stay in the hot paths.
+
+The current job's recorder is held in a context variable, so overlapping jobs
+of a persistent worker each record their own spans. A thread started inside a
+job records into it only when it runs in a copy of the job's context
+(contextvars.copy_context().run), as the jobs' own threads do.
+
+    with job('summary', clients=3):
+        with span('pdf.open'):
+            ...
+        count('pages', 12)
+"""
+
+import contextvars
+import datetime
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from functools import wraps
+
+ENV_VAR = 'TAX_APP_METRICS'
+LOG_PREFIX = 'METRICS '
+
+_recorder = contextvars.ContextVar('recorder', default=None)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ('recorder', 'name', 'start')
+
+    def __init__(self, recorder, name):
+        self.recorder = recorder
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.recorder.add(self.name, time.perf_counter() - self.start, exc_type is not None)
+        return False
+
+
+class Recorder:
+    """Aggregates span timings (count, total, max, errors) and counters; safe to share across threads."""
+
+    def __init__(self, job_name, attributes=None):
+        self.job = job_name
+        self.attributes = dict(attributes or {})
+        self.started = datetime.datetime.now().isoformat(timespec='seconds')
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+        self.spans = {}
+        self.counters = {}
+        self.token = None
+
+    def add(self, name, elapsed, failed=False):
+        with self._lock:
+            stats = self.spans.get(name)
+            if stats is None:
+                stats = self.spans[name] = [0, 0.0, 0.0, 0]
+            stats[0] += 1
+            stats[1] += elapsed
+            if elapsed > stats[2]:
+                stats[2] = elapsed
+            if failed:
+                stats[3] += 1
+
+    def count(self, name, n=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def snapshot(self, **attributes):
+        with self._lock:
+            return {
+                'job': self.job,
+                'started': self.started,
+                'wall_s': round(time.perf_counter() - self._start, 6),
+                'pid': os.getpid(),
+                'attributes': {**self.attributes, **attributes},
+                'spans': {
+                    name: {'count': c, 'total_s': round(total, 6), 'max_s': round(peak, 6), 'errors': errors}
+                    for name, (c, total, peak, errors) in sorted(self.spans.items())
+                },
+                'counters': dict(sorted(self.counters.items())),
+            }
+
+
+def enabled():
+    return _recorder.get() is not None
+
+
+def span(name):
+    """Time the enclosed block under `name` (dotted stage names, e.g. 'split.encrypt')."""
+    recorder = _recorder.get()
+    if recorder is None:
+        return _NULL_SPAN
+    return _Span(recorder, name)
+
+
+def count(name, n=1):
+    recorder = _recorder.get()
+    if recorder is not None:
+        recorder.count(name, n)
+
+
+def timed(name):
+    """Decorator form of span() for whole functions."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            recorder = _recorder.get()
+            if recorder is None:
+                return func(*args, **kwargs)
+            with _Span(recorder, name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def destination():
+    value = os.environ.get(ENV_VAR, '').strip()
+    return None if value in ('', '0') else value
+
+
+def start_job(job_name, **attributes):
+    """Start recording in the current context if TAX_APP_METRICS is set; returns the recorder or None."""
+    if destination() is None:
+        return None
+    recorder = Recorder(job_name, attributes)
+    recorder.token = _recorder.set(recorder)
+    return recorder
+
+
+def finish_job(recorder, **attributes):
+    """Stop recording `recorder` and write the metrics; returns the metrics dict (None if nothing was recorded)."""
+    if recorder is None:
+        return None
+    _recorder.reset(recorder.token)
+    metrics = recorder.snapshot(**attributes)
+    write_metrics(metrics, destination())
+    return metrics
+
+
+def write_metrics(metrics, target):
+    if not target:
+        return None
+    if target.lower() in ('1', 'stderr', 'log'):
+        # stdout is reserved for the job's JSON result
+        print(LOG_PREFIX + json.dumps(metrics, ensure_ascii=False), file=sys.stderr, flush=True)
+        return None
+    os.makedirs(target, exist_ok=True)
+    stamp = datetime.datetime.now().strftime('%Y%m%d-%H%M%S')
+    # A worker may finish two jobs of the same name within a second
+    path = os.path.join(target, f"{metrics['job']}-{stamp}-{metrics['pid']}-{uuid.uuid4().hex[:8]}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(metrics, f, indent=2, ensure_ascii=False)
+    return path
+
+
+@contextmanager
+def job(job_name, **attributes):
+    """Record one CLI job; the metrics are written even if the job raises."""
+    recorder = start_job(job_name, **attributes)
+    status = 'error'
+    try:
+        yield recorder
+        status = 'ok'
+    finally:
+        if recorder is not None:
+            finish_job(recorder, status=status)
@@ -0,0 +1,167 @@
+"""
+Text placement shared by the English, French and bilingual invoice layouts:
+the right-aligned header values, the bill-to block and the totals and notes
+below the item rows, whose labels and offsets per layout are in TRAILER_TEXT.
+
+Measuring text with fitz is slow (a Font object plus ~0.1 ms per text_length
+call), so fonts are built once per name and widths are cached per
+(text, font, size): the company header and the labels, identical on every
+invoice, are measured once per process.
+"""
+
+from functools import lru_cache
+
+import fitz  # PyMuPDF
+
+from models.currencyFormat import format_money
+from models.pricing import format_rate
+
+RIGHT_MARGIN = 550
+HEADER_STYLE = ("Helvetica-Bold", 11)
+TEXT_STYLE = ("Helvetica", 10)
+# Invoice number, date and amount due: labels end at LABEL_WIDTH, values start at VALUE_X
+LABEL_WIDTH = 470
+VALUE_X = LABEL_WIDTH + 10
+DETAIL_ROWS = (220, 240, 260)
+
+# Right-aligned company block at the top of the first page: (text, y, fontname, fontsize)
+_CONTACT = (
+    ("www.sankari.ca", 150, "Helvetica", 9),
+    ("taxdeclaration@sankari.ca", 160, "Helvetica", 9),
+)
+COMPANY_HEADERS = {
+    'english': (
+        ("INVOICE", 60, "Courier-Bold", 24),
+        ("Sankari Inc.", 80, "Helvetica-Bold", 12),
+        ("GST: 123456789RT0001", 95, "Helvetica", 10),
+        ("QST: 1234567890TQ0001", 110, "Helvetica", 10),
+    ) + _CONTACT,
+    'french': (
+        ("FACTURE", 60, "Courier-Bold", 24),
+        ("Sankari Inc.", 80, "Helvetica-Bold", 12),
+        ("TPS: 123456789RT0001", 95, "Helvetica", 10),
+        ("TVQ: 1234567890TQ0001", 110, "Helvetica", 10),
+    ) + _CONTACT,
+    'bilingual': (
+        ("INVOICE / FACTURE", 60, "Courier-Bold", 24),
+        ("Sankari Inc.", 80, "Helvetica-Bold", 12),
+        ("GST / TPS: 123456789RT0001", 95, "Helvetica", 10),
+        ("QST / TVQ: 1234567890TQ0001", 110, "Helvetica", 10),
+    ) + _CONTACT,
+}
+RULE_COLOR = (0.7, 0.7, 0.7)
+DARK_GREY = (0.2, 0.2, 0.2)
+NOTES_COLOR = (0.8, 0.2, 0.3)
+# Totals and notes below the item rows. Subtotal and tax labels start at label_x, the
+# rule above the total at rule_x; `color` is that of the labels and of the subtotal and tax values.
+_PAYMENT_EN = ("You can pay the fees by Interac e-transfer to taxdeclaration@sankari.ca. "
+               "For the password, you can use the word \"declaration\".")
+TRAILER_TEXT = {
+    'english': {
+        'money': 'en', 'label_x': 400, 'rule_x': 375, 'color': None,
+        'subtotal': "Subtotal:", 'gst': "GST", 'qst': "QST", 'total': "Total Due:",
+        'notes': "Notes / Terms:", 'payment': _PAYMENT_EN,
+    },
+    'french': {
+        'money': 'fr', 'label_x': 350, 'rule_x': 350, 'color': DARK_GREY,
+        'subtotal': "Sous-total:", 'gst': "TPS", 'qst': "TVQ", 'total': "Total:",
+        'notes': "Notes / Conditions:",
+        'payment': ("Vous pouvez payer les frais par virement électronique Interac à taxdeclaration@sankari.ca. "
+                    "Pour le mot de passe, vous pouvez utiliser le mot \"declaration\"."),
+    },
+    'bilingual': {
+        'money': 'en', 'label_x': 350, 'rule_x': 350, 'color': DARK_GREY,
+        'subtotal': "Subtotal / Sous-total:", 'gst': "GST / TPS", 'qst': "QST / TVQ", 'total': "Total Due:",
+        'notes': "Notes / Conditions:", 'payment': _PAYMENT_EN,
+    },
+}
+TOTALS_VALUE_X = 500
+TOTAL_LABEL_X = 400
+NOTES_OFFSET = 120
+# Contact lines next to the footer logo
+FOOTER_CONTACT = (
+    ("www.sankari.ca", 790, "Helvetica", 9),
+    ("taxdeclaration@sankari.ca", 800, "Helvetica", 9),
+)
+
+
+@lru_cache(maxsize=None)
+def font(fontname):
+    return fitz.Font(fontname)
+
+
+@lru_cache(maxsize=4096)
+def text_width(text, fontname, fontsize):
+    return font(fontname).text_length(text, fontsize=fontsize)
+
+
+def right_align_text(page, text, y, fontname, fontsize, right_margin=RIGHT_MARGIN):
+    x = right_margin - text_width(text, fontname, fontsize)
+    page.insert_text((x, y), text, fontname=fontname, fontsize=fontsize)
+
+
+def right_align_lines(page, lines):
+    for text, y, fontname, fontsize in lines:
+        right_align_text(page, text, y, fontname, fontsize)
+
+
+def align_label(page, label, y, label_width=LABEL_WIDTH, fontname=HEADER_STYLE[0]):
+    """Bold invoice-detail label, right-aligned on `label_width`."""
+    label_x = label_width - text_width(label, fontname, HEADER_STYLE[1])
+    page.insert_text((label_x, y), label, fontname=fontname, fontsize=HEADER_STYLE[1])
+
+
+def insert_value(page, value, y, x=VALUE_X):
+    """Invoice-detail value, left-aligned after its label."""
+    page.insert_text((x, y), str(value), fontname=TEXT_STYLE[0], fontsize=TEXT_STYLE[1])
+
+
+def draw_bill_to(page, invoice_details):
+    """Client name, company, address and contact under the "Bill to" label, each only if given."""
+    if invoice_details.get('fullName'):
+        page.insert_text((10, 235), invoice_details['fullName'], fontname="Helvetica-Bold", fontsize=10)
+    if invoice_details.get('companyName'):
+        page.insert_text((10, 250), invoice_details['companyName'], fontname="Helvetica-Bold", fontsize=10)
+    if invoice_details.get('address'):
+        page.insert_text((10, 265), invoice_details['address'], fontname=TEXT_STYLE[0], fontsize=9)
+    if invoice_details.get('email') or invoice_details.get('phoneNumber'):
+        page.insert_text((10, 280), f"{invoice_details.get('email', 'N/A')}         {invoice_details.get('phoneNumber', 'N/A')}",
+                         fontname=TEXT_STYLE[0], fontsize=9)
+
+
+def draw_trailer(page, y, pricing, invoice_details, layout):
+    """Divider, subtotal, taxes, total and notes of a layout, below the item rows ending at `y`."""
+    text = TRAILER_TEXT[layout]
+    color = text['color']
+
+    def money(amount):
+        return format_money(amount, text['money'], grouping=False)
+
+    def line(offset, label, amount):
+        page.insert_text((text['label_x'], y + offset), label, fontname=TEXT_STYLE[0], fontsize=TEXT_STYLE[1],
+                         color=color)
+        page.insert_text((TOTALS_VALUE_X, y + offset), money(amount), fontname=TEXT_STYLE[0],
+                         fontsize=TEXT_STYLE[1], color=color)
+
+    def total(offset, amount):
+        page.insert_text((TOTAL_LABEL_X, y + offset), text['total'], fontname=HEADER_STYLE[0],
+                         fontsize=HEADER_STYLE[1], color=color)
+        page.insert_text((TOTALS_VALUE_X, y + offset), money(amount), fontname=HEADER_STYLE[0],
+                         fontsize=HEADER_STYLE[1])
+
+    page.draw_line((0, y - 5), (600, y - 5), color=RULE_COLOR, width=1)
+    if pricing['include_taxes']:
+        line(15, text['subtotal'], pricing['adjusted_subtotal'])
+        line(30, f"{text['gst']} ({format_rate(pricing['gst_rate'])}%):", pricing['gst'])
+        if pricing['qst_rate'] > 0:
+            line(45, f"{text['qst']} ({format_rate(pricing['qst_rate'])}%):", pricing['qst'])
+        page.draw_line((text['rule_x'], y + 60), (550, y + 60), color=RULE_COLOR, width=1)
+        total(75, pricing['total'])
+    else:
+        total(15, pricing['adjusted_subtotal'])
+
+    notes_start = y + NOTES_OFFSET
+    page.insert_text((10, notes_start), text['notes'], fontname="Helvetica-Bold", fontsize=12, color=NOTES_COLOR)
+    page.insert_text((10, notes_start + 20), f"{invoice_details.get('notes', 'N/A')}", fontname=TEXT_STYLE[0],
+                     fontsize=9)
+    page.insert_text((10, notes_start + 35), text['payment'], fontname=TEXT_STYLE[0], fontsize=8)
@@ -0,0 +1,137 @@
+"""
+Item table of the invoice layouts.
+
+Descriptions are wrapped to their column with the cached metrics of
+invoiceLayout, and rows are paginated by the height left on the page instead of
+a fixed count per page. Continuation pages repeat the table header band at the
+top of the page.
+
+Row y values are text baselines. A one-line row is ROW_HEIGHT high, like the
+fixed table it replaces; each extra line of a wrapped description adds
+LINE_HEIGHT. The totals and notes drawn under the table take TRAILER_HEIGHT
+and must end above the footer of the last page, so they move to a new page
+when the last rows leave no room for them.
+"""
+
+from models.currencyFormat import format_money
+from models.invoiceLayout import TEXT_STYLE, text_width
+from models.invoiceTemplate import place_band
+
+FIRST_ROW_Y = 330
+ROW_HEIGHT = 20
+LINE_HEIGHT = 11
+DESCRIPTION_STYLE = ("Helvetica", 9)
+# Band at the top of continuation pages, with the first-page gap (band ends at 315, rows start at 330)
+CONTINUATION_BAND_TOP = 40
+CONTINUATION_ROW_Y = CONTINUATION_BAND_TOP + 50
+PAGE_BOTTOM = 800
+# Top of the footer logo (660) on the last page
+FOOTER_TOP = 655
+# Divider, subtotal and taxes, total, then the notes ending 155 below the row after the table
+TRAILER_HEIGHT = 160
+
+# x of each column and the money format of a layout
+COLUMNS = {
+    'english': {'description': 50, 'quantity': 325, 'price': 400, 'amount': 500, 'money': 'en'},
+    'french': {'description': 50, 'quantity': 325, 'price': 400, 'amount': 500, 'money': 'fr'},
+    'bilingual': {'description': 10, 'quantity': 325, 'price': 425, 'amount': 500, 'money': 'en'},
+}
+
+
+def _split_word(word, width, fontname, fontsize):
+    """Break a word wider than the column at character boundaries."""
+    pieces, piece = [], ""
+    for char in word:
+        if piece and text_width(piece + char, fontname, fontsize) > width:
+            pieces.append(piece)
+            piece = ""
+        piece += char
+    return pieces + [piece]
+
+
+def wrap_text(text, width, fontname=DESCRIPTION_STYLE[0], fontsize=DESCRIPTION_STYLE[1]):
+    """
+    Greedy word wrap of `text` to lines at most `width` points wide. Base14
+    widths have no kerning, so a line is measured as the sum of its cached word
+    widths and spaces.
+    """
+    space = text_width(" ", fontname, fontsize)
+    lines, line, line_width = [], [], 0
+    for word in text.split():
+        word_width = text_width(word, fontname, fontsize)
+        if word_width > width:
+            *whole, word = _split_word(word, width, fontname, fontsize)
+            if line:
+                lines.append(" ".join(line))
+            lines.extend(whole)
+            line, line_width = [], 0
+            word_width = text_width(word, fontname, fontsize)
+        if line and line_width + space + word_width > width:
+            lines.append(" ".join(line))
+            line, line_width = [], 0
+        line_width += (space if line else 0) + word_width
+        line.append(word)
+    if line or not lines:
+        lines.append(" ".join(line))
+    return lines
+
+
+def paginate(line_counts, trailer_height=TRAILER_HEIGHT):
+    """
+    Place rows of `line_counts[i]` lines on pages. Returns (pages, trailer_y):
+    one list of (row index, y) per page, and the y where the totals start on
+    the last page (which holds no rows when the totals did not fit).
+    """
+    pages = [[]]
+    y = FIRST_ROW_Y
+    for index, lines in enumerate(line_counts):
+        extra = (lines - 1) * LINE_HEIGHT
+        # A row taller than a whole page still goes on its own page
+        if pages[-1] and y + extra > PAGE_BOTTOM:
+            pages.append([])
+            y = CONTINUATION_ROW_Y
+        pages[-1].append((index, y))
+        y += ROW_HEIGHT + extra
+    if y + trailer_height > FOOTER_TOP:
+        pages.append([])
+        y = CONTINUATION_ROW_Y
+    return pages, y
+
+
+def _draw_row(shape, columns, lines, line, y):
+    fontname, fontsize = TEXT_STYLE
+    for number, text in enumerate(lines):
+        shape.insert_text((columns['description'], y + number * LINE_HEIGHT), text,
+                          fontname=DESCRIPTION_STYLE[0], fontsize=DESCRIPTION_STYLE[1])
+    if line['type'] == "%":
+        shape.insert_text((columns['amount'], y), f"{line['amount']}%", fontname=fontname, fontsize=fontsize)
+        return
+    money = columns['money']
+    shape.insert_text((columns['quantity'], y), str(line['quantity']), fontname=fontname, fontsize=fontsize)
+    shape.insert_text((columns['price'], y), format_money(line['amount'], money, grouping=False), fontname=fontname, fontsize=fontsize)
+    shape.insert_text((columns['amount'], y), format_money(line['total'], money, grouping=False), fontname=fontname, fontsize=fontsize)
+
+
+def draw_items(doc, page, layout, rows):
+    """
+    Draw the item rows, (service name, price_services line) pairs, under the
+    band of the first page, adding pages as needed. Returns the last page and
+    the y where the totals start.
+
+    The rows of a page go through one Shape committed once: page.insert_text
+    commits a Shape per call, which re-processes the page contents every time.
+    """
+    columns = COLUMNS[layout]
+    width = columns['quantity'] - columns['description'] - 10
+    wrapped = [wrap_text(service_name, width) for service_name, _ in rows]
+    pages, trailer_y = paginate([len(lines) for lines in wrapped])
+    for number, placed in enumerate(pages):
+        if number:
+            page = doc.new_page()
+            if placed:
+                place_band(page, layout, CONTINUATION_BAND_TOP)
+        shape = page.new_shape()
+        for index, y in placed:
+            _draw_row(shape, columns, wrapped[index], rows[index][1], y)
+        shape.commit()
+    return page, trailer_y
@@ -0,0 +1,171 @@
+"""
+Pre-rendered static pages of the invoice layouts.
+
+Everything that is identical on every invoice of a layout (logo, company
+header, detail labels, table header band, donation footer) is drawn once per
+process into a small template PDF (templates()) and placed on invoice pages
+with show_pdf_page. The placed pages share one form XObject per template page, so
+each invoice only draws its own text (bill-to, numbers, items, totals) and a
+batch document holds the static content once.
+
+Every layout has three template pages:
+    HEADER  top of the first page, above the bill-to block
+    BAND    dark table header band, repeated on every page of the item table
+    FOOTER  donation and contact block at the bottom of the last page
+"""
+
+import os
+import sys
+from functools import lru_cache
+
+import fitz  # PyMuPDF
+
+from models.invoiceLayout import (
+    COMPANY_HEADERS, DETAIL_ROWS, FOOTER_CONTACT, HEADER_STYLE, TEXT_STYLE, align_label, right_align_lines,
+)
+
+HEADER, BAND, FOOTER = 0, 1, 2
+BAND_TOP, BAND_BOTTOM = 280, 315
+
+DARK_GREY = (0.2, 0.2, 0.2)
+GREY = (0.5, 0.5, 0.5)
+WHITE = (1, 1, 1)
+RED = (0.8, 0.2, 0.3)
+DIVIDER = (0.7, 0.7, 0.7)
+
+# The templates name their fonts with the short Base14 codes. insert_text does not
+# add a font to a page whose placed template already uses the same resource name,
+# and the overlay text would then fall back to the viewer's default font.
+_FONTS = {"Helvetica": "helv", "Helvetica-Bold": "hebo", "Courier-Bold": "cobo"}
+
+STATIC_TEXT = {
+    'english': {
+        'logo': "logoEN.jpeg",
+        'bill_to': "Bill to",
+        'labels': ("Invoice Number:", "Invoice Date:", "Amount Due (CAD):"),
+        'columns': (("Items", 50), ("Quantity", 300), ("Price", 400), ("Amount", 500)),
+        'donation': (
+            "Together, we can help!",
+            "This year, for each tax declaration we file,",
+            "$1.00 will be donated to Humanitarian Coalition.",
+        ),
+    },
+    'french': {
+        'logo': "logoFR.jpeg",
+        'bill_to': "Facturé à",
+        'labels': ("Numéro de facture :", "Date de facture :", "Montant dû (CAD):"),
+        'columns': (("Articles", 50), ("Quantité", 300), ("Prix", 400), ("Montant", 500)),
+        'donation': (
+            "Ensemble, nous pouvons faire une difference!",
+            "Cette année, avec chaque déclaration d'impôt,",
+            "un don de 1$ sera versé à Coalition Humanitaire.",
+        ),
+    },
+    'bilingual': {
+        'logo': "logoEN.jpeg",
+        'bill_to': "Billed to / Facturé à",
+        'labels': (
+            "Invoice Number / Numéro de facture:",
+            "Invoice Date / Date de facture:",
+            "Amount Due / Montant dû (CAD):",
+        ),
+        'columns': (("Items / Articles", 50), ("Quantity / Quantité", 275), ("Price / Prix", 400), ("Amount / Montant", 490)),
+        'donation': (
+            "Together, we can help!",
+            "This year, for each tax declaration we file,",
+            "$1.00 will be donated to Humanitarian Coalition.",
+        ),
+    },
+}
+
+
+_LAYOUT_INDEX = {layout: index for index, layout in enumerate(STATIC_TEXT)}
+
+
+def get_resource_path(relative_path):
+    """Get absolute path to resource, works for dev and PyInstaller."""
+    try:
+        # PyInstaller creates a temp folder and stores path in _MEIPASS
+        base_path = sys._MEIPASS
+    except AttributeError:
+        # Development: go up from models/ to Python/ so "models/logo.jpeg" resolves correctly
+        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_path, relative_path)
+
+
+@lru_cache(maxsize=None)
+def _image_data(name):
+    """Bytes of one of the bundled invoice images, read from disk once per process."""
+    with open(get_resource_path(os.path.join("models", name)), "rb") as f:
+        return f.read()
+
+
+def _insert_image(page, rect, name, images):
+    """Embed each image once in the template document and reuse its xref afterwards."""
+    if name in images:
+        page.insert_image(rect, xref=images[name])
+    else:
+        images[name] = page.insert_image(rect, stream=_image_data(name))
+
+
+def _right_align_lines(page, lines):
+    right_align_lines(page, [(line, y, _FONTS[fontname], fontsize) for line, y, fontname, fontsize in lines])
+
+
+def _draw_header(page, text, layout, images):
+    _insert_image(page, fitz.Rect(30, 10, 250, 166), text['logo'], images)
+    _right_align_lines(page, COMPANY_HEADERS[layout])
+    page.draw_line((0, 190), (600, 190), color=DIVIDER, width=1)
+    page.insert_text((10, 220), text['bill_to'], fontname=_FONTS[HEADER_STYLE[0]], color=GREY, fontsize=10)
+    for label, y in zip(text['labels'], DETAIL_ROWS):
+        align_label(page, label, y, fontname=_FONTS[HEADER_STYLE[0]])
+
+
+def _draw_band(page, text):
+    page.draw_rect(fitz.Rect(0, BAND_TOP, 600, BAND_BOTTOM), color=DARK_GREY, fill=DARK_GREY)
+    for column, x in text['columns']:
+        page.insert_text((x, 300), column, fontname=_FONTS["Helvetica-Bold"], fontsize=HEADER_STYLE[1], color=WHITE)
+
+
+def _draw_footer(page, text, images):
+    _insert_image(page, fitz.Rect(10, 750, 110, 820), "donate.jpeg", images)
+    first, second, third = text['donation']
+    page.insert_text((100, 780), first, fontname=_FONTS[TEXT_STYLE[0]], fontsize=10, color=RED)
+    page.insert_text((100, 790), second, fontname=_FONTS[TEXT_STYLE[0]], fontsize=9)
+    page.insert_text((100, 800), third, fontname=_FONTS[TEXT_STYLE[0]], fontsize=9)
+    _insert_image(page, fitz.Rect(350, 660, 575, 770), text['logo'], images)
+    _right_align_lines(page, FOOTER_CONTACT)
+
+
+@lru_cache(maxsize=None)
+def templates():
+    """
+    One document holding the HEADER, BAND and FOOTER pages of every layout, built
+    once per process. The layouts share its image objects, so a document mixing
+    layouts still embeds each image once.
+    """
+    doc = fitz.open()
+    images = {}
+    for layout, text in STATIC_TEXT.items():
+        _draw_header(doc.new_page(), text, layout, images)
+        _draw_band(doc.new_page(), text)
+        _draw_footer(doc.new_page(), text, images)
+    return doc
+
+
+def place(page, layout, part):
+    """Draw one template page (HEADER, BAND or FOOTER) of a layout onto an invoice page."""
+    page.show_pdf_page(page.rect, templates(), _LAYOUT_INDEX[layout] * 3 + part)
+
+
+def place_band(page, layout, top):
+    """Draw the table header band of a layout with its top edge at `top`, on continuation pages."""
+    band = fitz.Rect(0, BAND_TOP, page.rect.width, BAND_BOTTOM)
+    target = fitz.Rect(0, top, page.rect.width, top + band.height)
+    page.show_pdf_page(target, templates(), _LAYOUT_INDEX[layout] * 3 + BAND, clip=band)
+
+
+def save_templates(path):
+    """Write the template document to `path`, for inspection."""
+    templates().save(path)
+    return path
@@ -0,0 +1,195 @@
+"""
+Versioned job manifest read by the CLI entry points.
+
+    {"version": 1, "job": "createSummaryDocuments", "payload": {...}}
+
+main.ts writes the manifest to the job's stdin (`<script> --manifest -`); a path
+can be given instead of `-`. It is parsed and validated once, against SCHEMAS,
+before any work starts.
+
+A persistent worker can keep stdin open and receive one manifest per line (JSON
+Lines). A line {"version": 1, "append": {"client_files": [...]}} adds items to the
+list fields of the previous manifest; only the added items are validated.
+"""
+
+import json
+import sys
+
+MANIFEST_VERSION = 1
+
+# payload field -> (type, required, required keys of each item for list fields)
+SCHEMAS = {
+    'createSummaryDocuments': {
+        'directory': (str, True, None),
+        'client_files': (list, True, ('directory',)),
+        'configuration': (dict, True, None),
+        'doc_text_config': (dict, False, None),
+        # Also write the extracted amounts as 'Summaries <batch>.csv' and '.npz'
+        'export': (bool, False, None),
+        # SQLite file keeping every extracted summary by SIN and year (models.summaryStore)
+        'summary_store': (str, False, None),
+        # SQLite file recording every split return; the result lists the returns it already had
+        # (models.returnRegistry, lookupReturns.py)
+        'return_registry': (str, False, None),
+        # JSON file of Summary page layout profiles (models.summaryLayout.load_profiles)
+        'layout_profiles': (str, False, None),
+        # Run the job as a pipeline of read, split, write and extract stages (createSummaryDocuments.pipeline_files)
+        'workers': (int, False, None),
+    },
+    'createConfirmationDocuments': {
+        'directory': (str, True, None),
+        'clients': (list, False, ('name',)),
+        'selected_prices': (list, True, None),
+        'invoice_details': (dict, False, None),
+        'tax_rate': (dict, True, ('province',)),
+        'include_taxes': (bool, True, None),
+        'language': (str, True, None),
+        # Batch mode: many households, each with clients and invoice_details
+        'households': (list, False, ('clients', 'invoice_details')),
+        'workers': (int, False, None),
+        # Also save every invoice of the batch in this one PDF
+        'combined_invoice': (str, False, None),
+    },
+    'pdf_to_images': {
+        'files': (list, True, ('name',)),
+    },
+}
+
+# Fields of which a job needs at least one
+ALTERNATIVES = {
+    'createConfirmationDocuments': (('clients', 'households'), ('invoice_details', 'households')),
+}
+
+_TYPE_NAMES = {str: 'a string', list: 'a list', dict: 'an object', bool: 'a boolean', int: 'an integer'}
+
+
+class ManifestError(ValueError):
+    pass
+
+
+def _check_version(document):
+    if not isinstance(document, dict):
+        raise ManifestError("A manifest must be a JSON object")
+    if document.get('version') != MANIFEST_VERSION:
+        raise ManifestError(f"Unsupported manifest version {document.get('version')!r} (expected {MANIFEST_VERSION})")
+
+
+def _check_items(job, field, items, keys):
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            raise ManifestError(f"{job}: {field}[{index}] must be an object")
+        missing = [key for key in keys if key not in item]
+        if missing:
+            raise ManifestError(f"{job}: {field}[{index}] is missing {', '.join(missing)}")
+
+
+def _check_field(job, field, value, schema):
+    kind, _, keys = schema
+    if not isinstance(value, kind):
+        raise ManifestError(f"{job}: {field} must be {_TYPE_NAMES[kind]}")
+    if keys and isinstance(value, list):
+        _check_items(job, field, value, keys)
+    elif keys:
+        _check_items(job, field, [value], keys)
+
+
+def validate(manifest, job=None):
+    """Check a parsed manifest against its job's schema and return its payload."""
+    _check_version(manifest)
+    name = manifest.get('job')
+    if name not in SCHEMAS:
+        raise ManifestError(f"Unknown job {name!r}")
+    if job is not None and name != job:
+        raise ManifestError(f"Manifest is for {name}, not {job}")
+    payload = manifest.get('payload')
+    if not isinstance(payload, dict):
+        raise ManifestError(f"{name}: payload must be an object")
+
+    schema = SCHEMAS[name]
+    unknown = sorted(set(payload) - set(schema))
+    if unknown:
+        raise ManifestError(f"{name}: unknown payload field(s) {', '.join(unknown)}")
+    for field, field_schema in schema.items():
+        if field in payload:
+            _check_field(name, field, payload[field], field_schema)
+        elif field_schema[1]:
+            raise ManifestError(f"{name}: payload is missing {field}")
+    for fields in ALTERNATIVES.get(name, ()):
+        if not any(field in payload for field in fields):
+            raise ManifestError(f"{name}: payload is missing {' or '.join(fields)}")
+    return payload
+
+
+def apply_addition(manifest, addition):
+    """Append the list items of an `append` line to a validated manifest, in place."""
+    _check_version(addition)
+    name = manifest['job']
+    added = addition.get('append')
+    if not isinstance(added, dict):
+        raise ManifestError(f"{name}: append must be an object")
+    for field, items in added.items():
+        schema = SCHEMAS[name].get(field)
+        if schema is None or schema[0] is not list:
+            raise ManifestError(f"{name}: {field} is not a list field and cannot be appended to")
+        _check_field(name, field, items, schema)
+    for field, items in added.items():
+        manifest['payload'].setdefault(field, []).extend(items)
+    return manifest
+
+
+def iter_manifests(lines, job=None):
+    """
+    Yield the current manifest after every non-blank JSON line: a full manifest
+    replaces the previous one, an `append` line extends it.
+    """
+    manifest = None
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            document = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ManifestError(f"Line {number} is not valid JSON: {e}") from None
+        if isinstance(document, dict) and 'append' in document:
+            if manifest is None:
+                raise ManifestError(f"Line {number} appends to a manifest that was never sent")
+            apply_addition(manifest, document)
+        else:
+            validate(document, job)
+            manifest = document
+        yield manifest
+
+
+def read_manifest(text, job=None):
+    """Parse a manifest document (one JSON object, or JSON Lines with `append` lines)."""
+    try:
+        manifest = json.loads(text)
+    except json.JSONDecodeError:
+        # More than one line: a manifest followed by additions
+        manifest = None
+        for manifest in iter_manifests(text.splitlines(), job):
+            pass
+        if manifest is None:
+            raise ManifestError("The manifest is empty") from None
+        return manifest
+    validate(manifest, job)
+    return manifest
+
+
+def load_manifest(source='-', job=None):
+    """Read and validate the manifest from a file path, or from stdin for '-'."""
+    if source == '-':
+        text = sys.stdin.read()
+    else:
+        with open(source, 'r', encoding='utf-8') as f:
+            text = f.read()
+    return read_manifest(text, job)
+
+
+def manifest_source(argv):
+    """The manifest location given on a CLI's command line: `--manifest <path|->`, stdin by default."""
+    if len(argv) == 1:
+        return '-'
+    if len(argv) == 3 and argv[1] == '--manifest':
+        return argv[2]
+    raise ManifestError(f"Usage: {argv[0]} [--manifest <path>|-]")
@@ -0,0 +1,129 @@
+"""
+Stage scheduler for batch jobs: items flow through stages connected by bounded
+queues, so the I/O of one item overlaps the CPU work of the next.
+
+    results, stats = run_stages(client_files, [
+        ('read', read_source, 4, 'thread'),
+        ('split', split_source, 2, 'process'),
+        ('write', write_split, 4, 'thread'),
+    ])
+
+Each stage has `workers` workers: threads for I/O stages, and for CPU stages
+a process pool fed by as many threads. A process stage's function must be a
+module-level function (or a functools.partial of one) and its items must
+pickle; `initializer(*initargs)` runs once in each of its worker processes,
+for the state they need from the parent. A stage takes an item only when the next stage's queue has room, so
+no more than a queue's worth of items waits between two stages.
+
+Results come back in the order of the items. When a stage raises, the items
+not yet started are skipped and the error of the earliest failed item is
+raised once every worker has stopped.
+
+stats reports, per stage, its items, the seconds its workers were busy and its
+utilization: busy seconds over workers x wall seconds. A stage near 1.0 is the
+bottleneck; the others wait on it.
+"""
+
+import contextvars
+import multiprocessing
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from models.instrumentation import span
+
+_DONE = object()
+
+
+def run_stages(items, stages, queue_size=None, initializer=None, initargs=()):
+    """
+    Run `items` through `stages`, a list of (name, function, workers, 'thread'
+    or 'process'); returns the results and the stats of each stage.
+    """
+    items = list(items)
+    queues = [queue.Queue(maxsize=queue_size or workers) for _, _, workers, _ in stages]
+    results = [None] * len(items)
+    errors = {}
+    failed = threading.Event()
+    lock = threading.Lock()
+    busy = {name: 0.0 for name, _, _, _ in stages}
+    done = {name: 0 for name, _, _, _ in stages}
+    running = [workers for _, _, workers, _ in stages]
+    # Spawned, not forked: the pools start from threads, and a forked child may inherit a held lock
+    pools = [ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn'), initializer=initializer,
+                                 initargs=initargs) if kind == 'process'
+             else None for _, _, workers, kind in stages]
+
+    def work(stage):
+        name, function, _, _ = stages[stage]
+        pool = pools[stage]
+        while True:
+            entry = queues[stage].get()
+            if entry is _DONE:
+                break
+            index, item = entry
+            if failed.is_set():
+                continue
+            start = time.perf_counter()
+            try:
+                with span('pipeline.' + name):
+                    item = pool.submit(function, item).result() if pool else function(item)
+            except Exception as e:
+                with lock:
+                    errors[index] = e
+                failed.set()
+                continue
+            finally:
+                with lock:
+                    busy[name] += time.perf_counter() - start
+                    done[name] += 1
+            if stage + 1 < len(stages):
+                queues[stage + 1].put((index, item))
+            else:
+                results[index] = item
+        with lock:
+            running[stage] -= 1
+            last = running[stage] == 0
+        if last and stage + 1 < len(stages):
+            for _ in range(stages[stage + 1][2]):
+                queues[stage + 1].put(_DONE)
+
+    start = time.perf_counter()
+    # Each thread runs in its own copy of this context, so its spans go to the caller's job
+    threads = [threading.Thread(target=contextvars.copy_context().run, args=(work, stage),
+                                name=f"pipeline-{name}-{n}", daemon=True)
+               for stage, (name, _, workers, _) in enumerate(stages) for n in range(workers)]
+    try:
+        for thread in threads:
+            thread.start()
+        for entry in enumerate(items):
+            if failed.is_set():
+                break
+            queues[0].put(entry)
+        for _ in range(stages[0][2]):
+            queues[0].put(_DONE)
+        for thread in threads:
+            thread.join()
+    finally:
+        for pool in pools:
+            if pool is not None:
+                pool.shutdown()
+    wall_s = time.perf_counter() - start
+
+    if errors:
+        raise errors[min(errors)]
+    stats = {
+        'wall_s': round(wall_s, 6),
+        'stages': {
+            name: {
+                'kind': kind,
+                'workers': workers,
+                'items': done[name],
+                'busy_s': round(busy[name], 6),
+                'utilization': round(busy[name] / (workers * wall_s), 3) if wall_s else 0.0,
+            }
+            for name, _, workers, kind in stages
+        },
+    }
+    return results, stats
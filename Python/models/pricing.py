@@ -0,0 +1,120 @@
+"""
+Exact money arithmetic for the confirmation invoice and email.
+
+Both documents used to price the selected services themselves, with floats and
+different rules for percentage lines, so their totals could differ by a cent
+(more with several percentage lines). price_services computes every line,
+adjustment and tax once, with Decimal, and both renderers print its result.
+
+The rules are those of the price selection screen (PriceSelection.tsx):
+    - a 'number' line costs amount x quantity;
+    - '%' lines then apply in order to the running subtotal of those lines;
+    - GST, and QST in Quebec, are computed separately on the adjusted subtotal.
+
+Every amount is rounded to the cent where it is computed, half a cent up as the
+CRA rounds GST/HST, so the printed lines always add up to the printed totals.
+"""
+
+import json
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+
+CENT = Decimal('0.01')
+HUNDRED = Decimal(100)
+ZERO = Decimal(0)
+
+
+def to_decimal(value):
+    """Decimal of a JSON number or numeric string; floats go through str, so 9.975 stays 9.975."""
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(str(value).strip())
+
+
+def round_cents(value):
+    return value.quantize(CENT, rounding=ROUND_HALF_UP)
+
+
+def parse_rate(value):
+    """Tax rate as a Decimal. Accepts numbers, numeric strings, or strings with a trailing '%'."""
+    if value is None:
+        return ZERO
+    s = str(value).strip()
+    if s.endswith('%'):
+        s = s[:-1]
+    try:
+        return to_decimal(s)
+    except InvalidOperation:
+        return ZERO
+
+
+def format_rate(rate):
+    """Rate as printed next to a tax, e.g. '5' or '9.975'."""
+    return f"{round(float(rate), 3):g}"
+
+
+def price_services(selected_prices, tax_rate, include_taxes):
+    """
+    Price the selected services. Returns a dict with
+        lines              one dict per selected price, in order: service,
+                           type, amount, quantity and total (amount x quantity,
+                           or the adjustment of a '%' line)
+        subtotal           sum of the 'number' lines
+        adjusted_subtotal  subtotal after the '%' lines
+        gst_rate, qst_rate rates in percent (qst_rate is 0 outside Quebec)
+        gst, qst, total    taxes (0 without include_taxes) and amount due
+    """
+    province = tax_rate.get('province')
+    gst_rate = parse_rate(tax_rate.get('fedRate', 0))
+    qst_rate = parse_rate(tax_rate.get('provRate', 0)) if province == 'QC' else ZERO
+
+    lines = [
+        {
+            'service': price['service'],
+            'type': price['type'],
+            'amount': to_decimal(price['amount']),
+            'quantity': price['quantity'],
+        }
+        for price in selected_prices
+    ]
+    subtotal = ZERO
+    for line in lines:
+        if line['type'] != '%':
+            line['total'] = round_cents(line['amount'] * to_decimal(line['quantity']))
+            subtotal += line['total']
+
+    adjusted_subtotal = subtotal
+    for line in lines:
+        if line['type'] == '%':
+            line['total'] = round_cents(adjusted_subtotal * line['amount'] / HUNDRED)
+            adjusted_subtotal += line['total']
+
+    gst = round_cents(adjusted_subtotal * gst_rate / HUNDRED) if include_taxes else ZERO
+    qst = round_cents(adjusted_subtotal * qst_rate / HUNDRED) if include_taxes else ZERO
+    return {
+        'lines': lines,
+        'subtotal': subtotal,
+        'adjusted_subtotal': adjusted_subtotal,
+        'province': province,
+        'include_taxes': include_taxes,
+        'gst_rate': gst_rate,
+        'qst_rate': qst_rate,
+        'gst': gst,
+        'qst': qst,
+        'total': adjusted_subtotal + gst + qst,
+    }
+
+
+def price_batch(jobs):
+    """
+    Price many (selected_prices, tax_rate, include_taxes) jobs, e.g. a whole
+    client list. Jobs with the same selection and rates, the common case, share
+    one result, which renderers must treat as read-only.
+    """
+    priced = {}
+    results = []
+    for selected_prices, tax_rate, include_taxes in jobs:
+        key = json.dumps([selected_prices, tax_rate, include_taxes], sort_keys=True, default=str)
+        if key not in priced:
+            priced[key] = price_services(selected_prices, tax_rate, include_taxes)
+        results.append(priced[key])
+    return results
@@ -0,0 +1,139 @@
+"""
+On-demand cProfile / tracemalloc profiling for the CLI jobs.
+
+Set before launching the app (or a packaged executable):
+
+    TAX_APP_PROFILE=cpu | memory | cpu,memory
+    TAX_APP_PROFILE_CLIENTS=<comma-separated full names or SINs>   (optional)
+    TAX_APP_PROFILE_DIR=<directory>                            (optional)
+
+Reports are written next to the job's outputs (the temp directory for jobs without
+an output directory) unless TAX_APP_PROFILE_DIR is set:
+
+    profile-<name>-<timestamp>.prof         cProfile stats for pstats or snakeviz
+    profile-<name>-<timestamp>.txt          top functions by cumulative time
+    profile-<name>-<timestamp>-memory.txt   tracemalloc peak and top allocation sites
+
+Without TAX_APP_PROFILE_CLIENTS the whole job is profiled. With it, only the
+stages of the clients whose full name or SIN is listed (ignoring case) are profiled, one report per client and stage,
+so a slow client can be isolated on the preparer's machine. Everything here is
+standard library, so it works the same from source and in PyInstaller builds.
+"""
+
+import datetime
+import os
+import re
+from contextlib import contextmanager
+
+ENV_VAR = 'TAX_APP_PROFILE'
+# A return's file name: "<SIN> - <full name>[_<year>].pdf"
+RETURN_FILE_PATTERN = re.compile(r"(.+?) - (.+?)(?:_\d{4})?$")
+CLIENTS_ENV_VAR = 'TAX_APP_PROFILE_CLIENTS'
+DIR_ENV_VAR = 'TAX_APP_PROFILE_DIR'
+
+TOP_FUNCTIONS = 40
+TOP_ALLOCATIONS = 30
+TRACEBACK_FRAMES = 10
+
+
+def profile_modes():
+    value = os.environ.get(ENV_VAR, '').lower()
+    modes = {mode.strip() for mode in value.split(',') if mode.strip()}
+    if modes & {'1', 'true', 'all'}:
+        modes = {'cpu', 'memory'}
+    return modes & {'cpu', 'memory'}
+
+
+def selected_clients():
+    value = os.environ.get(CLIENTS_ENV_VAR, '')
+    return [token.strip().lower() for token in value.split(',') if token.strip()]
+
+
+def client_keys(name):
+    """The full name, or the SIN and full name of a return's file path, that a selected client must equal."""
+    base = re.sub(r'\.(pdf|docx)$', '', os.path.basename(str(name)).strip(), flags=re.IGNORECASE)
+    match = RETURN_FILE_PATTERN.match(base)
+    keys = {base, *match.groups()} if match else {base}
+    return {key.strip().lower() for key in keys}
+
+
+def is_selected(*names):
+    """True if one of the names (label, file path, ...) is a selected client's full name or SIN."""
+    tokens = set(selected_clients())
+    return any(tokens & client_keys(name) for name in names if name)
+
+
+def _report_base(name, output_dir):
+    import tempfile
+
+    directory = os.environ.get(DIR_ENV_VAR) or output_dir or tempfile.gettempdir()
+    os.makedirs(directory, exist_ok=True)
+    safe_name = re.sub(r'[^\w.-]+', '_', name).strip('_') or 'job'
+    stamp = datetime.datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+    return os.path.join(directory, f"profile-{safe_name}-{stamp}")
+
+
+def _write_cpu_report(profiler, base):
+    import pstats
+
+    profiler.dump_stats(base + '.prof')
+    with open(base + '.txt', 'w', encoding='utf-8') as f:
+        stats = pstats.Stats(profiler, stream=f)
+        stats.sort_stats('cumulative').print_stats(TOP_FUNCTIONS)
+
+
+def _write_memory_report(snapshot, peak, base):
+    with open(base + '-memory.txt', 'w', encoding='utf-8') as f:
+        f.write(f"Peak traced memory: {peak / 1024:.1f} KiB\n\n")
+        f.write(f"Top {TOP_ALLOCATIONS} allocation sites still alive at the end of the job:\n")
+        for stat in snapshot.statistics('traceback')[:TOP_ALLOCATIONS]:
+            f.write(f"\n{stat.size / 1024:.1f} KiB in {stat.count} blocks\n")
+            for line in stat.traceback.format():
+                f.write(f"{line}\n")
+
+
+@contextmanager
+def _profile(name, output_dir, modes):
+    profiler = None
+    if 'memory' in modes:
+        import tracemalloc
+        tracemalloc.start(TRACEBACK_FRAMES)
+    if 'cpu' in modes:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        yield
+    finally:
+        base = _report_base(name, output_dir)
+        if profiler is not None:
+            profiler.disable()
+            _write_cpu_report(profiler, base)
+        if 'memory' in modes:
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            _write_memory_report(snapshot, peak, base)
+
+
+@contextmanager
+def profiled_job(name, output_dir=None):
+    """Profile a whole CLI job when TAX_APP_PROFILE is set and no clients are selected."""
+    modes = profile_modes()
+    if not modes or selected_clients():
+        yield
+        return
+    with _profile(name, output_dir, modes):
+        yield
+
+
+@contextmanager
+def profiled_client(stage, output_dir, *names):
+    """Profile one client's stage when it matches TAX_APP_PROFILE_CLIENTS."""
+    modes = profile_modes()
+    if not modes or not selected_clients() or not is_selected(*names):
+        yield
+        return
+    label = next((str(name) for name in names if name), 'client')
+    with _profile(f"{stage}-{os.path.basename(label)}", output_dir, modes):
+        yield
@@ -0,0 +1,109 @@
+"""
+Local registry of the returns processed into each output directory.
+
+Splitting a return leaves a `{sin}.txt` marker and the COPY, Authorization and
+Summary files in the chosen directory, and nothing else tells whether a
+client-year was processed. With a registry (the `return_registry` path of the
+createSummaryDocuments manifest), every split return is recorded in one SQLite
+file: SIN, name, year, language, the SHA-256 of the source PDF, the output
+directory and paths, and the time spent reading, splitting and writing it. A
+return is recorded again when it is processed into another directory;
+processing it into the same one replaces its row.
+
+The summary job hashes each return from the bytes it reads to split it, and
+looks up the earlier records of that hash before splitting, so the job result
+can list the returns that were already processed. find_returns looks returns
+up by SIN, year, name or source hash, and processed_sources does the duplicate
+check for PDFs not yet read; lookupReturns.py is the command line for both.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import closing
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS returns (
+    id INTEGER PRIMARY KEY,
+    sin TEXT NOT NULL,
+    name TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    language TEXT NOT NULL,
+    source_path TEXT NOT NULL,
+    source_hash TEXT NOT NULL,
+    directory TEXT NOT NULL,
+    outputs TEXT NOT NULL,
+    read_s REAL NOT NULL,
+    split_s REAL NOT NULL,
+    write_s REAL NOT NULL,
+    processed_at REAL NOT NULL,
+    UNIQUE (source_hash, directory)
+);
+CREATE INDEX IF NOT EXISTS returns_client_year ON returns (sin, year);
+CREATE INDEX IF NOT EXISTS returns_name ON returns (name COLLATE NOCASE);
+"""
+# Stage times of a recorded return, in seconds
+TIMINGS = ('read_s', 'split_s', 'write_s')
+COLUMNS = ('sin', 'name', 'year', 'language', 'source_path', 'source_hash', 'directory', 'outputs') + TIMINGS + (
+    'processed_at',)
+HASH_CHUNK = 1 << 20
+
+
+def _connect(path):
+    # Several jobs may share the registry; wait for a writer rather than failing
+    connection = sqlite3.connect(path, timeout=30)
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def source_hash(file_path):
+    """SHA-256 of a return PDF, hex."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as stream:
+        for chunk in iter(lambda: stream.read(HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def data_hash(data):
+    """source_hash of a return PDF's bytes, already read."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def record_return(path, file_path, directory_path, split, digest, timings):
+    """
+    Record one split_return result of `file_path` into `directory_path`:
+    `digest` is its source_hash and `timings` its TIMINGS (0 when missing).
+    """
+    row = (str(split['sin']), split['name'], int(split['year']), split['language'], str(file_path), digest,
+           str(directory_path), json.dumps(split['outputs']),
+           *(round(timings.get(name, 0), 6) for name in TIMINGS), time.time())
+    with closing(_connect(path)) as connection, connection:
+        connection.execute(f"INSERT OR REPLACE INTO returns ({', '.join(COLUMNS)}) "
+                           f"VALUES ({', '.join('?' * len(COLUMNS))})", row)
+
+
+def find_returns(path, sin=None, year=None, name=None, source_hash=None):
+    """Recorded returns matching every given criterion (`name` ignores case), most recent first."""
+    criteria = {'sin = ?': None if sin is None else str(sin), 'year = ?': None if year is None else int(year),
+                'name = ? COLLATE NOCASE': name, 'source_hash = ?': source_hash}
+    where = [condition for condition, value in criteria.items() if value is not None]
+    query = f"SELECT {', '.join(COLUMNS)} FROM returns"
+    if where:
+        query += " WHERE " + " AND ".join(where)
+    with closing(_connect(path)) as connection:
+        rows = connection.execute(query + " ORDER BY processed_at DESC",
+                                  [value for value in criteria.values() if value is not None]).fetchall()
+    return [{**dict(zip(COLUMNS, row)), 'outputs': json.loads(row[COLUMNS.index('outputs')])} for row in rows]
+
+
+def processed_sources(path, file_paths):
+    """Source path -> its recorded returns, for the PDFs of `file_paths` already processed."""
+    hashes = {file_path: source_hash(file_path) for file_path in file_paths}
+    found = {}
+    for file_path, digest in hashes.items():
+        records = find_returns(path, source_hash=digest)
+        if records:
+            found[file_path] = records
+    return found
@@ -0,0 +1,212 @@
+"""
+Extracted return summaries as compact objects.
+
+extract_return_summary used to return nested dicts: the tax summary and, per
+benefit, a dict of up to 13 keys (the total and one amount per payment month).
+ReturnSummary holds the same values in cents, in slotted dataclasses, and the
+extractors build its TaxSummary and BenefitSchedules straight from the cents
+they parse. Each BenefitSchedule keeps its payments in one 12-slot array, July
+to June, and computes its total, so a summary is a few small objects that
+pickle cheaply to worker processes.
+
+The docx builders read a ReturnSummary by the keys of the old dicts, each
+amount converted to dollars as it is read:
+
+    summary['tax_summary']['federal_refund'] -> 1234.56
+    summary['gst_amounts']['july_amount'] -> 129.75
+
+to_dict and from_dict convert to and from those dicts, in dollars for the
+client files returned to the app and in cents (`cents=True`) for the summary
+store, so stored amounts are never rounded back from floats.
+"""
+
+from array import array
+from dataclasses import dataclass
+
+# Payment months, in the order of a benefit year
+MONTHS = ('july', 'august', 'september', 'october', 'november', 'december',
+          'january', 'february', 'march', 'april', 'may', 'june')
+_MONTH_INDEX = {month: index for index, month in enumerate(MONTHS)}
+QUARTERS = ('july', 'october', 'january', 'april')
+
+# Summary key -> (key of its total, its months in the order the extractors list them)
+SCHEDULES = {
+    'gst_amounts': ('gst_credit_amount', QUARTERS),
+    'ecgeb_amounts': ('ecgeb_credit_amount', QUARTERS),
+    'solidarity_amounts': ('solidarity_credit_amount', MONTHS),
+    'ccb_amounts': ('ccb_amount', MONTHS),
+    'family_allowance_amounts': ('fa_amount', QUARTERS),
+    'carbon_rebate_amounts': ('carbon_rebate_amount', ('january', 'april', 'july', 'october')),
+    'ontario_trillium_amounts': ('ontario_trillium_amount', MONTHS[6:] + MONTHS[:6]),
+    'climate_action_credit_amounts': ('climate_action_amount', ('july', 'january', 'october', 'april')),
+}
+CARRYFORWARD = 'carryforward_amounts'
+# TaxSummary fields that are amounts
+BALANCES = ('federal_refund', 'federal_owing', 'quebec_refund', 'quebec_owing')
+
+# Summary key -> ReturnSummary field, in the order of the summary dicts
+SUMMARY_FIELDS = {
+    'gst_amounts': 'gst',
+    'ecgeb_amounts': 'ecgeb',
+    CARRYFORWARD: 'carryforward',
+    'solidarity_amounts': 'solidarity',
+    'ccb_amounts': 'ccb',
+    'family_allowance_amounts': 'family_allowance',
+    'carbon_rebate_amounts': 'carbon_rebate',
+    'ontario_trillium_amounts': 'ontario_trillium',
+    'climate_action_credit_amounts': 'climate_action_credit',
+}
+
+
+def _cents(dollars):
+    return round((dollars or 0) * 100)
+
+
+def _reduce_fields(self):
+    # Pickle as the class and its field values: slotted dataclasses otherwise
+    # pickle a dict of their field names with every object
+    return type(self), tuple(getattr(self, name) for name in self.__slots__)
+
+
+@dataclass(slots=True)
+class TaxSummary:
+    """The client and their balances; amounts in cents."""
+    first_name: str | None = None
+    last_name: str | None = None
+    province: str | None = None
+    federal_refund: int = 0
+    federal_owing: int = 0
+    quebec_refund: int = 0
+    quebec_owing: int = 0
+
+    __reduce__ = _reduce_fields
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        value = getattr(self, key)
+        return value / 100 if key in BALANCES else value
+
+    def to_dict(self, cents=False):
+        return {name: getattr(self, name) if cents else self[name] for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, values, cents=False):
+        amount = (lambda value: value or 0) if cents else _cents
+        return cls(values.get('first_name'), values.get('last_name'), values.get('province'),
+                   *(amount(values.get(name)) for name in BALANCES))
+
+
+@dataclass(slots=True)
+class BenefitSchedule:
+    """
+    Payments of one benefit (a SCHEDULES key), in cents, indexed as MONTHS.
+    `printed_total` is set only when the return prints a total other than the
+    sum of the payments.
+    """
+    kind: str
+    payments: array
+    printed_total: int | None = None
+
+    @classmethod
+    def empty(cls, kind):
+        return cls(kind, array('q', [0]) * len(MONTHS))
+
+    def __reduce__(self):
+        # A tuple of small ints pickles in half the bytes of the array
+        return _schedule, (self.kind, tuple(self.payments), self.printed_total)
+
+    @classmethod
+    def from_cents(cls, kind, values):
+        """The schedule of an extractor's result dict: its total and month amounts, in cents."""
+        schedule = cls.empty(kind)
+        total_key, months = SCHEDULES[kind]
+        for month in months:
+            schedule.payments[_MONTH_INDEX[month]] = values.get(f"{month}_amount", 0)
+        if total_key in values and values[total_key] != sum(schedule.payments):
+            schedule.printed_total = values[total_key]
+        return schedule
+
+    def payment(self, month):
+        return self.payments[_MONTH_INDEX[month]]
+
+    @property
+    def total(self):
+        return sum(self.payments) if self.printed_total is None else self.printed_total
+
+    def has_amounts(self):
+        return bool(self.total or any(self.payments))
+
+    def __getitem__(self, key):
+        total_key, months = SCHEDULES[self.kind]
+        if key == total_key:
+            return self.total / 100
+        month = key.removesuffix('_amount')
+        if month not in months:
+            raise KeyError(key)
+        return self.payment(month) / 100
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self, cents=False):
+        total_key, months = SCHEDULES[self.kind]
+        values = {total_key: self.total}
+        for month in months:
+            values[f"{month}_amount"] = self.payment(month)
+        return values if cents else {key: value / 100 for key, value in values.items()}
+
+    @classmethod
+    def from_dict(cls, kind, values, cents=False):
+        return cls.from_cents(kind, values if cents else {key: _cents(value) for key, value in values.items()})
+
+
+def _schedule(kind, payments, printed_total):
+    return BenefitSchedule(kind, array('q', payments), printed_total)
+
+
+@dataclass(slots=True)
+class ReturnSummary:
+    """One client's return summary; a section the return does not have is None."""
+    tax_summary: TaxSummary
+    gst: BenefitSchedule | None = None
+    ecgeb: BenefitSchedule | None = None
+    # Carryforward amounts are printed without cents and kept as the strings read
+    carryforward: dict | None = None
+    solidarity: BenefitSchedule | None = None
+    ccb: BenefitSchedule | None = None
+    family_allowance: BenefitSchedule | None = None
+    carbon_rebate: BenefitSchedule | None = None
+    ontario_trillium: BenefitSchedule | None = None
+    climate_action_credit: BenefitSchedule | None = None
+
+    __reduce__ = _reduce_fields
+
+    def __contains__(self, key):
+        return key == 'tax_summary' or (key in SUMMARY_FIELDS and getattr(self, SUMMARY_FIELDS[key]) is not None)
+
+    def __getitem__(self, key):
+        """A section by its summary key, as the docx builders read it, e.g. summary['gst_amounts']."""
+        if key not in self:
+            raise KeyError(key)
+        return self.tax_summary if key == 'tax_summary' else getattr(self, SUMMARY_FIELDS[key])
+
+    def to_dict(self, cents=False):
+        """The summary as nested dicts, with the amounts in dollars, or in cents with `cents`."""
+        summary = {'tax_summary': self.tax_summary.to_dict(cents)}
+        for key, name in SUMMARY_FIELDS.items():
+            section = getattr(self, name)
+            if section is not None:
+                summary[key] = dict(section) if key == CARRYFORWARD else section.to_dict(cents)
+        return summary
+
+    @classmethod
+    def from_dict(cls, summary, cents=False):
+        sections = {
+            name: dict(summary[key]) if key == CARRYFORWARD else BenefitSchedule.from_dict(key, summary[key], cents)
+            for key, name in SUMMARY_FIELDS.items() if key in summary
+        }
+        return cls(TaxSummary.from_dict(summary['tax_summary'], cents), **sections)
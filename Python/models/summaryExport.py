@@ -0,0 +1,113 @@
+"""
+Columnar export of a batch's extracted summaries.
+
+One row per client-year, with fixed columns: the client, their tax summary
+balances and, for every benefit of SCHEDULES, its total and each of its
+payment months (0 when the return has no such benefit). The columns are built
+from the ReturnSummary objects of the batch, so reviewers can sort and filter
+the totals of every client without opening the Word documents:
+
+    Summaries <batch>.csv   amounts in dollars, for a spreadsheet
+    Summaries <batch>.npz   one array per column, amounts as int64 cents; the
+                            .npy format is written here, so numpy.load reads
+                            the file without numpy being bundled
+
+<batch> is the time of the export and a random id, so the exports of earlier
+batches in the same output folder are kept.
+"""
+
+import csv
+import datetime
+import os
+import struct
+import sys
+import uuid
+import zipfile
+from array import array
+
+from models.returnSummary import SCHEDULES, SUMMARY_FIELDS
+
+EXPORT_NAME = "Summaries"
+
+TEXT_COLUMNS = ('label', 'first_name', 'last_name', 'province', 'language')
+TAX_COLUMNS = ('federal_refund', 'federal_owing', 'quebec_refund', 'quebec_owing')
+# Summary key -> (ReturnSummary field, its columns), e.g. 'gst_total', 'gst_july'
+BENEFIT_COLUMNS = {
+    key: (SUMMARY_FIELDS[key], (f"{SUMMARY_FIELDS[key]}_total",) +
+          tuple(f"{SUMMARY_FIELDS[key]}_{month}" for month in months))
+    for key, (_, months) in SCHEDULES.items()
+}
+AMOUNT_COLUMNS = TAX_COLUMNS + tuple(column for _, columns in BENEFIT_COLUMNS.values() for column in columns)
+COLUMNS = TEXT_COLUMNS + ('year',) + AMOUNT_COLUMNS
+
+
+def summary_columns(summarized_files):
+    """Column name -> list of values, one per summarized client file; amounts in cents."""
+    columns = {column: [] for column in COLUMNS}
+    for client_file in summarized_files:
+        summary = client_file['summary']
+        tax_summary = summary.tax_summary
+        columns['label'].append(client_file.get('label') or '')
+        for column in TEXT_COLUMNS[1:4]:
+            columns[column].append(getattr(tax_summary, column) or '')
+        columns['language'].append(client_file.get('language', 'EN'))
+        columns['year'].append(int(client_file['year']))
+        for column in TAX_COLUMNS:
+            columns[column].append(getattr(tax_summary, column))
+        for key, (name, names) in BENEFIT_COLUMNS.items():
+            schedule = getattr(summary, name)
+            months = SCHEDULES[key][1]
+            values = [schedule.total] + [schedule.payment(month) for month in months] if schedule else [0] * len(names)
+            for column, value in zip(names, values):
+                columns[column].append(value)
+    return columns
+
+
+def _dollars(cents):
+    return f"{cents / 100:.2f}"
+
+
+def write_csv(columns, path):
+    rows = zip(*(
+        [_dollars(value) for value in values] if column in AMOUNT_COLUMNS else values
+        for column, values in columns.items()
+    ))
+    with open(path, 'w', newline='', encoding='utf-8') as stream:
+        writer = csv.writer(stream)
+        writer.writerow(columns)
+        writer.writerows(rows)
+    return path
+
+
+def _npy(values):
+    """One column in the .npy format (version 1.0): int64, or fixed-width unicode for text."""
+    if all(isinstance(value, int) for value in values):
+        data = array('q', values)
+        if sys.byteorder == 'big':
+            data.byteswap()
+        descr, data = '<i8', data.tobytes()
+    else:
+        width = max(map(len, values), default=0) or 1
+        descr, data = f'<U{width}', ''.join(value.ljust(width, '\0') for value in values).encode('utf-32-le')
+    header = f"{{'descr': '{descr}', 'fortran_order': False, 'shape': ({len(values)},), }}"
+    # The header, with the 10 bytes before it, is padded to a multiple of 64 bytes and ends with a newline
+    header += ' ' * (-(len(header) + 11) % 64) + '\n'
+    return b'\x93NUMPY\x01\x00' + struct.pack('<H', len(header)) + header.encode('latin1') + data
+
+
+def write_npz(columns, path):
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_STORED) as archive:
+        for column, values in columns.items():
+            archive.writestr(f"{column}.npy", _npy(values))
+    return path
+
+
+def batch_id():
+    return f"{datetime.datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+
+def export_summaries(summarized_files, directory_path, batch=None):
+    """Write the CSV and .npz exports of the summarized client files, named after `batch`; returns their paths."""
+    columns = summary_columns(summarized_files)
+    base = os.path.join(directory_path, f"{EXPORT_NAME} {batch or batch_id()}")
+    return [write_csv(columns, base + '.csv'), write_npz(columns, base + '.npz')]
@@ -0,0 +1,172 @@
+"""
+Layout profiles of the Summary pages, one per tax software version and language.
+
+A profile gives, for each section title (a TITLES or TITLES_FR entry), where
+its title line sits on the page (the anchor) and the rectangle of its table
+relative to the top-left corner of the anchor. When the outline says which
+sections a page holds, prepare_summary reads only the anchors and tables of
+those sections, from one TextPage clipped to them, instead of every word of
+the page. If an anchor does not hold its title, because the software moved
+it, the titles are searched for on a TextPage of the whole page and the
+tables moved with them; when that fails too, the same TextPage is read line
+by line as before.
+
+No profile is built in: the geometry depends on the tax software's release,
+so each one is measured from a return of that release (measure_profile; the
+measureLayoutProfile CLI adds it to a JSON file) and registered explicitly,
+with register_profile or from the JSON file with load_profiles. The app
+passes its layoutProfiles.json as the `layout_profiles` path of the
+createSummaryDocuments manifest. split_return selects a profile from the
+first line of the return's cover page; without a match every page is read
+whole.
+
+    {name: {'cover': "...", 'language': 'EN', 'sections': {
+        "GST/HST Tax Credit": {'anchor': [x0, y0, x1, y1], 'table': [dx0, dy0, dx1, dy1]},
+    }}}
+"""
+
+import json
+
+import fitz  # PyMuPDF
+
+# Name -> profile
+PROFILES = {}
+
+
+def register_profile(name, cover, language, sections):
+    """Add or replace the profile `name`, used for returns whose cover starts with `cover`."""
+    PROFILES[name] = {'cover': cover, 'language': language, 'sections': sections}
+    return name
+
+
+def register_profiles(profiles):
+    """Register every profile of {name: profile}, as PROFILES or load_profiles holds them; returns their names."""
+    return [
+        register_profile(name, profile['cover'], profile['language'], {
+            title: {'anchor': tuple(section['anchor']), 'table': tuple(section['table'])}
+            for title, section in profile['sections'].items()
+        })
+        for name, profile in profiles.items()
+    ]
+
+
+def load_profiles(path):
+    """Register the profiles of a JSON file; returns their names."""
+    with open(path, encoding='utf-8') as f:
+        return register_profiles(json.load(f))
+
+
+def save_profiles(path, names=None):
+    """Write the registered profiles (or those of `names`) as a JSON file for load_profiles."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({name: PROFILES[name] for name in names or PROFILES}, f, indent=2, ensure_ascii=False)
+    return path
+
+
+def measure_profile(summary_file_path, titles, margin=6):
+    """
+    Sections of a layout profile measured from a Summary PDF: each of
+    `titles` printed once on a page anchors a band across the page, and its
+    table runs from under the title to the next title, or to the bottom
+    margin. A title found on several pages is measured where it is first.
+    """
+    sections = {}
+    with fitz.open(summary_file_path) as doc:
+        for page in doc:
+            width, height = page.rect.width, page.rect.height
+            hits = []
+            for title in titles:
+                found = page.search_for(title)
+                # A title wrapped over two lines, or repeated, is left to the full-page read
+                if len(found) == 1 and title not in sections:
+                    hits.append((found[0].y0 - 2, found[0].y1 + 2, title))
+            hits.sort()
+            for (top, bottom, title), following in zip(hits, hits[1:] + [(height - margin, None, None)]):
+                top, bottom, end = round(top, 1), round(bottom, 1), round(following[0], 1)
+                sections[title] = {
+                    'anchor': (margin, top, width - margin, bottom),
+                    'table': (-margin, bottom - top, width - margin, end - top),
+                }
+    return sections
+
+
+def profile_for(cover_line, language):
+    """Name of the profile of a return from the first line of its cover page, or None."""
+    for name, profile in PROFILES.items():
+        if profile['language'] == language and cover_line.startswith(profile['cover']):
+            return name
+    return None
+
+
+def table_rect(section):
+    """Absolute (x0, y0, x1, y1) of a section's table."""
+    x0, y0, _, _ = section['anchor']
+    dx0, dy0, dx1, dy1 = section['table']
+    return (x0 + dx0, y0 + dy0, x0 + dx1, y0 + dy1)
+
+
+def _inside(word, rect):
+    """Whether the centre of a words tuple lies in `rect`; plain arithmetic, fitz.Rect.contains is slow per word."""
+    x, y = (word[0] + word[2]) / 2, (word[1] + word[3]) / 2
+    return rect[0] <= x < rect[2] and rect[1] <= y < rect[3]
+
+
+def profile_clip(profile, titles):
+    """
+    Rectangle holding the anchors and tables of `titles` on a page, or None
+    when one of them has no entry in the profile.
+    """
+    sections = profile['sections']
+    if not titles or any(title not in sections for title in titles):
+        return None
+    clip = fitz.Rect()
+    for title in titles:
+        clip |= sections[title]['anchor']
+        clip |= table_rect(sections[title])
+    return clip
+
+
+def _shift(rect, dy):
+    return (rect[0], rect[1] + dy, rect[2], rect[3] + dy)
+
+
+def _title_shift(page, textpage, title, anchor):
+    """Vertical distance from a section's anchor to its only occurrence on the page, or None."""
+    hits = page.search_for(title, textpage=textpage)
+    if len(hits) != 1:
+        return None
+    return (hits[0].y0 + hits[0].y1) / 2 - (anchor[1] + anchor[3]) / 2
+
+
+def section_words(page, textpage, profile, titles, relocate=False):
+    """
+    Words of the tables of `titles`, sections the page is known to hold, read
+    from `textpage`, as a list of (title, words) in page order. Returns None
+    when a title is not found at its anchor.
+
+    With `relocate`, on a TextPage of the whole page, each title is first
+    searched for and its anchor and table moved to where it is; None then
+    means a title is missing or repeated, or a table reaches the next anchor.
+    """
+    sections = profile['sections']
+    regions = []
+    for title in titles:
+        anchor, table = sections[title]['anchor'], table_rect(sections[title])
+        if relocate:
+            dy = _title_shift(page, textpage, title, anchor)
+            if dy is None:
+                return None
+            anchor, table = _shift(anchor, dy), _shift(table, dy)
+        regions.append((title, anchor, table))
+    regions.sort(key=lambda region: region[1][1])
+    if any(table[3] > following[1][1] for (_, _, table), following in zip(regions, regions[1:])):
+        return None
+
+    words = page.get_text("words", textpage=textpage)
+    located = []
+    for title, anchor, table in regions:
+        anchor_text = " ".join(word[4] for word in words if _inside(word, anchor))
+        if title.lower() not in anchor_text.lower():
+            return None
+        located.append((title, [word for word in words if _inside(word, table)]))
+    return located
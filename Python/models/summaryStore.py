@@ -0,0 +1,141 @@
+"""
+Local store of extracted return summaries, keyed by SIN and tax year.
+
+A multi-year or catch-up summary used to need every year's return in the same
+batch, each one split, encrypted and extracted again. With a store (the
+`summary_store` path of the createSummaryDocuments manifest), every summary
+extracted in a batch is saved, and a client file may ask for earlier years
+with `prior_years`:
+
+    {"directory": ".../123456789 - Alex Tremblay.pdf", "prior_years": [2021, 2022]}
+
+Those years are read from the store and added to the client's multi-year
+document, as if their returns had been uploaded too. The store is one SQLite
+file; summaries are kept as the JSON of ReturnSummary.to_dict in cents, so
+they stay readable when the data model changes and their amounts stay exact.
+"""
+
+import json
+import sqlite3
+import time
+from collections import Counter
+from contextlib import closing
+
+from models.returnSummary import ReturnSummary
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS summaries (
+    sin TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    language TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (sin, year)
+)
+"""
+
+
+def _connect(path):
+    # Several jobs may share the store; wait for a writer rather than failing
+    connection = sqlite3.connect(path, timeout=30)
+    connection.execute(SCHEMA)
+    return connection
+
+
+def save_summaries(path, summarized_files):
+    """Store (or replace) the summary of every summarized client file that has a SIN; returns how many."""
+    now = time.time()
+    rows = [
+        (str(cf['sin']), int(cf['year']), cf.get('language', 'EN'), json.dumps(cf['summary'].to_dict(cents=True)), now)
+        for cf in summarized_files if cf.get('sin')
+    ]
+    with closing(_connect(path)) as connection, connection:
+        connection.executemany("INSERT OR REPLACE INTO summaries VALUES (?, ?, ?, ?, ?)", rows)
+    return len(rows)
+
+
+def load_returns(path, sin, years):
+    """Year -> (language, ReturnSummary) of the stored `years` of a SIN; years not in the store are left out."""
+    years = [int(year) for year in years]
+    if not years:
+        return {}
+    with closing(_connect(path)) as connection:
+        rows = connection.execute(
+            f"SELECT year, language, summary FROM summaries WHERE sin = ? AND year IN ({', '.join('?' * len(years))})",
+            [str(sin), *years],
+        ).fetchall()
+    return {year: (language, ReturnSummary.from_dict(json.loads(summary), cents=True)) for year, language, summary in rows}
+
+
+def load_summaries(path, sin, years):
+    """Year -> ReturnSummary of the stored `years` of a SIN; years not in the store are left out."""
+    return {year: summary for year, (language, summary) in load_returns(path, sin, years).items()}
+
+
+def stored_years(path, sin):
+    with closing(_connect(path)) as connection:
+        return [year for (year,) in connection.execute(
+            "SELECT year FROM summaries WHERE sin = ? ORDER BY year", [str(sin)])]
+
+
+def _is_individual(client_file):
+    return not client_file.get('coupleWith') or client_file['coupleWith'] == 'Individual Summary'
+
+
+def _raise_missing(missing):
+    if missing:
+        raise ValueError(f"Prior years not in the summary store: {', '.join(missing)}")
+
+
+def _asks_prior_years(client_file):
+    return client_file.get('sin') and client_file.get('prior_years') and _is_individual(client_file)
+
+
+def check_prior_years(path, client_files):
+    """
+    Raise the ValueError of add_prior_years before the returns are split: the
+    `prior_years` of an individual client file (with its `sin`) must be in the
+    store. A SIN with several returns in the batch is left to add_prior_years,
+    since the years of those returns are only known once they are split.
+    """
+    returns = Counter(str(cf['sin']) for cf in client_files if cf.get('sin'))
+    missing = []
+    for client_file in client_files:
+        sin = str(client_file.get('sin'))
+        if not _asks_prior_years(client_file) or returns[sin] > 1:
+            continue
+        stored = set(stored_years(path, sin))
+        missing += [f"{client_file.get('label') or sin} {year}"
+                    for year in sorted({int(year) for year in client_file['prior_years']}) if year not in stored]
+    _raise_missing(missing)
+
+
+def add_prior_years(path, summarized_files):
+    """
+    Summarized client files of the stored `prior_years` of the individual
+    clients, to be documented with the batch. Each has the language its return
+    was stored with and no return file; the client's other fields (title,
+    mail and newcomer flags) are the current file's. A year already in the
+    batch for the same SIN is not read again; a year that is in neither raises
+    ValueError. Couples are summarized one year at a time, so their
+    `prior_years` are ignored.
+    """
+    in_batch = {(str(cf.get('sin')), int(cf['year'])) for cf in summarized_files}
+    added, missing = [], []
+    for client_file in summarized_files:
+        if not _asks_prior_years(client_file):
+            continue
+        sin = str(client_file['sin'])
+        years = sorted({int(year) for year in client_file['prior_years']} - {year for s, year in in_batch if s == sin})
+        stored = load_returns(path, sin, years)
+        for year in years:
+            if year in stored:
+                language, summary = stored[year]
+                added.append({**client_file, 'year': year, 'language': language, 'summary': summary,
+                              'directory': None, 'summary_file_path': None, 'summary_outline': [],
+                              'layout_profile': None, 'prior_years': []})
+                in_batch.add((sin, year))
+            else:
+                missing.append(f"{client_file.get('label') or sin} {year}")
+    _raise_missing(missing)
+    return added
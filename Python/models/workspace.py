@@ -3,7 +3,8 @@ from docx.shared import Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
-import locale
+
+from models.currencyFormat import format_amount, format_money
 
 def createIndividualWordDocMultiYear(individual, output_file_path):
     if individual[0]['language'] == 'EN':
@@ -20,11 +21,8 @@ def createCoupleWordDocMultiYear(couple_summaries, output_file_path):
         createCoupleWordDocFR(couple_summaries, output_file_path)
 
 
-locale.setlocale(locale.LC_ALL, 'fr_CA.UTF-8')
-
 def format_currency(amount):
-    # Convert the amount to a float and format it as a string
-    return f"{locale.format_string('%.2f', amount, grouping=True).replace('.', ',')} $"
+    return format_money(amount, 'FR')
 
 # Function to set default font and size for the entire document
 def set_default_font(doc, font_name, font_size):
@@ -916,7 +914,7 @@ def tax_returnFR(doc, return_summary, year, secondary_summary=None, primary_titl
 
     # Helper function for formatting numbers in the French style
     def format_french_number(amount):
-        return f"{amount:,.2f}".replace(",", " ").replace(".", ",")
+        return format_amount(amount, 'FR', thousands=' ')
 
     # Function to handle payment section if amounts are owed
     def add_payment_section(para, federal_owing, quebec_owing):
@@ -1239,8 +1237,8 @@ def carryforward_amountsFR(doc, return_summary):
         quebec_tuition_8_percent = float(quebec_tuition_8_percent)
 
     # Format the amounts without decimals
-    formatted_federal_amount = locale.format_string("%d", federal_tuition_amount, grouping=True).replace(",", " ")
-    formatted_quebec_amount = locale.format_string("%d", quebec_tuition_8_percent, grouping=True).replace(",", " ")
+    formatted_federal_amount = format_amount(int(federal_tuition_amount), 'FR', decimals=0)
+    formatted_quebec_amount = format_amount(int(quebec_tuition_8_percent), 'FR', decimals=0)
 
     # Add formatted amounts to the paragraph
     para.add_run('Fédéral (admissible à 15%) : ')
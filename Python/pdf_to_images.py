@@ -2,13 +2,19 @@ import sys
 import json
 import base64
 import io
-import fitz  # PyMuPDF
+
+from models.instrumentation import count, job, span
+from models.jobManifest import load_manifest, manifest_source
+from models.profiling import profiled_job
 
 
 def pdf_to_images(pdf_base64: str, filename: str) -> list:
+    import fitz  # PyMuPDF; only loaded when the upload contains a PDF
+
     try:
         pdf_bytes = base64.b64decode(pdf_base64)
-        pdf_document = fitz.open(stream=pdf_bytes, filetype="pdf")
+        with span('pdf.open'):
+            pdf_document = fitz.open(stream=pdf_bytes, filetype="pdf")
 
         images = []
 
@@ -16,10 +22,13 @@ def pdf_to_images(pdf_base64: str, filename: str) -> list:
             page = pdf_document[page_num]
 
             mat = fitz.Matrix(2.0, 2.0)
-            pix = page.get_pixmap(matrix=mat)
+            with span('page.render'):
+                pix = page.get_pixmap(matrix=mat)
 
-            png_bytes = pix.tobytes("png")
-            png_base64 = base64.b64encode(png_bytes).decode('utf-8')
+            with span('page.encode'):
+                png_bytes = pix.tobytes("png")
+                png_base64 = base64.b64encode(png_bytes).decode('utf-8')
+            count('pages')
 
             images.append({
                 'name': f"{filename} (Page {page_num + 1})",
@@ -36,16 +45,17 @@ def pdf_to_images(pdf_base64: str, filename: str) -> list:
 
 def main():
     try:
-        input_data = json.loads(sys.stdin.read())
+        input_data = load_manifest(manifest_source(sys.argv), 'pdf_to_images')['payload']
 
         all_images = []
 
-        for file in input_data.get('files', []):
-            if file.get('type') == 'application/pdf':
-                pdf_images = pdf_to_images(file['base64'], file['name'])
-                all_images.extend(pdf_images)
-            else:
-                all_images.append(file)
+        with job('pdf_to_images', files=len(input_data.get('files', []))), profiled_job('pdf_to_images'):
+            for file in input_data.get('files', []):
+                if file.get('type') == 'application/pdf':
+                    pdf_images = pdf_to_images(file['base64'], file['name'])
+                    all_images.extend(pdf_images)
+                else:
+                    all_images.append(file)
 
         print(json.dumps({
             'success': True,
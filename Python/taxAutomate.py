@@ -0,0 +1,66 @@
+"""
+Single entry point of the packaged Python bundle.
+
+    taxAutomate <job> [job arguments...]
+
+<job> is the name of one of the CLI scripts (createSummaryDocuments,
+createConfirmationDocuments, pdf_to_images, lookupReturns,
+measureLayoutProfile); the remaining arguments and stdin are handed to that
+script's main() unchanged. All jobs share one onedir runtime
+(taxAutomate.spec), so the PyMuPDF, python-docx and Python binaries are installed
+and loaded from disk once instead of once per script.
+"""
+
+import json
+import multiprocessing
+import sys
+
+
+def _create_summary_documents():
+    from createSummaryDocuments import main
+    return main()
+
+
+def _create_confirmation_documents():
+    from createConfirmationDocuments import main
+    return main()
+
+
+def _pdf_to_images():
+    from pdf_to_images import main
+    return main()
+
+
+def _lookup_returns():
+    from lookupReturns import main
+    return main()
+
+
+def _measure_layout_profile():
+    from measureLayoutProfile import main
+    return main()
+
+
+JOBS = {
+    'createSummaryDocuments': _create_summary_documents,
+    'createConfirmationDocuments': _create_confirmation_documents,
+    'pdf_to_images': _pdf_to_images,
+    'lookupReturns': _lookup_returns,
+    'measureLayoutProfile': _measure_layout_profile,
+}
+
+
+def main(argv=None):
+    argv = sys.argv if argv is None else argv
+    if len(argv) < 2 or argv[1] not in JOBS:
+        print(json.dumps({'error': f"Usage: taxAutomate <{'|'.join(JOBS)}> [arguments...]"}))
+        return 2
+    # The job sees the same argv as when its script is run directly
+    sys.argv = [argv[1]] + argv[2:]
+    return JOBS[argv[1]]()
+
+
+if __name__ == '__main__':
+    # Worker processes of a frozen bundle start by re-running this executable
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,95 @@
+# -*- mode: python ; coding: utf-8 -*-
+#
+# One onedir bundle for every Python job: dist/taxAutomate/taxAutomate(.exe) <job> [args...]
+# (see taxAutomate.py). The jobs share a single copy of the Python runtime, PyMuPDF,
+# python-docx/lxml and PyPDF2 instead of one copy per script.
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath('.'))
+
+block_cipher = None
+
+# PyMuPDF ships its fonts and CMaps compiled into libmupdf; the wheel's only other
+# payload is the C/C++ SDK (headers and import libraries), which is never needed at runtime.
+UNUSED_PAYLOAD = ('mupdf-devel', os.path.join('pymupdf', 'include'))
+
+a = Analysis(
+    ['taxAutomate.py'],
+    pathex=[os.path.abspath('.')],
+    binaries=[],
+    datas=[
+        # Invoice images (the models' Python sources are bundled as modules)
+        ('models/donate.jpeg', 'models'),
+        ('models/logoEN.jpeg', 'models'),
+        ('models/logoFR.jpeg', 'models'),
+    ],
+    hiddenimports=[
+        # Jobs are imported lazily by taxAutomate.py and the CLIs
+        'createSummaryDocuments',
+        'createConfirmationDocuments',
+        'pdf_to_images',
+        'lookupReturns',
+        'measureLayoutProfile',
+        'PyPDF2',
+        'docx',
+        'fitz',
+        'pymupdf',
+        # Imported on demand by models/profiling.py (TAX_APP_PROFILE)
+        'cProfile',
+        'pstats',
+        'tracemalloc',
+    ],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=[
+        # Exclude unnecessary packages to reduce size
+        'tkinter', 'matplotlib', 'numpy', 'pandas',
+        'scipy', 'pytest', 'IPython', 'notebook',
+        'PIL', 'PyQt5', 'PySide2',
+        # lxml extras python-docx does not use (objectify and isoschematron carry data files)
+        'lxml.objectify', 'lxml.isoschematron', 'lxml.html',
+        'unittest', 'pydoc_data',
+    ],
+    win_no_prefer_redirects=False,
+    win_private_assemblies=False,
+    cipher=block_cipher,
+    noarchive=False,
+)
+
+a.datas = [entry for entry in a.datas if not any(part in entry[0] for part in UNUSED_PAYLOAD)]
+a.binaries = [entry for entry in a.binaries if not any(part in entry[0] for part in UNUSED_PAYLOAD)]
+
+pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='taxAutomate',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    runtime_tmpdir=None,
+    console=True,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+)
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name='taxAutomate',
+)
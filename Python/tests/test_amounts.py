@@ -0,0 +1,173 @@
+import random
+import re
+
+import pytest
+
+from models.amounts import cents_between_labels, digits_cents, find_cents, parse_cents
+from models.extractData import extract_gst_credit, extract_solidarity_credit, extract_tax_summary
+from models.extractDataFR import extract_child_benefitFR, extract_ontario_trilliumFR
+
+MONTHS_EN = ["July", "August", "September", "October", "November", "December",
+             "January", "February", "March", "April", "May", "June"]
+MONTHS_FR = ["Juillet", "Août", "Septembre", "Octobre", "Novembre", "Décembre",
+             "Janvier", "Février", "Mars", "Avril", "Mai", "Juin"]
+
+
+def printed(cents, language):
+    """An amount as the summaries print it: '1,006 33' in English, '1 006 33' in French."""
+    text = f"{cents // 100:,} {cents % 100:02d}"
+    return text if language == 'EN' else text.replace(',', ' ')
+
+
+def random_cents(rng, count):
+    """Amounts of every size, with the thousands separators near their edges."""
+    return [rng.choice([rng.randrange(100), rng.randrange(100000), rng.randrange(10 ** 10),
+                        rng.choice([99999, 100000, 99999999, 100000000])])
+            for _ in range(count)]
+
+
+@pytest.mark.parametrize('language', ['EN', 'FR'])
+def test_printed_amounts_parse_to_their_cents(language):
+    rng = random.Random(45)
+    for _ in range(2000):
+        amounts = random_cents(rng, rng.randint(1, 6))
+        # Years and line numbers between amounts are not amounts
+        line = " ".join(f"{rng.choice(MONTHS_EN)} 2025 {printed(cents, language)}" for cents in amounts)
+        assert find_cents(line, language) == amounts
+        assert parse_cents(line.split(' 2025 ', 1)[1], language) == amounts[0]
+        assert digits_cents(printed(amounts[0], language)) == amounts[0]
+
+
+@pytest.mark.parametrize('language', ['EN', 'FR'])
+def test_amount_between_labels(language):
+    rng = random.Random(46)
+    for _ in range(500):
+        first, second = random_cents(rng, 2)
+        line = f"July 2025 {printed(first, language)} January 2026 {printed(second, language)}"
+        assert cents_between_labels("July 2025", "January 2026", line, language) == first
+        assert cents_between_labels("January 2026", None, line, language) == second
+        assert cents_between_labels("April 2026", None, line, language) == 0
+
+
+def test_unparsable_amounts():
+    assert parse_cents("Line 5 plus line 6") is None
+    assert find_cents("July 2025 1,00 00") == []
+    assert digits_cents('') == digits_cents(None) == digits_cents('N/A') == 0
+    assert digits_cents('-12 34') == -1234
+
+
+# The parsing the extractors had before amounts.py, kept as the oracle of the tests below
+LEGACY_PATTERNS = {'EN': r'(\d{1,3}(?:,\d{3})*\s\d{2}|\d{1,3}\s\d{2})',
+                   'FR': r'(\d{1,3}(?:\s\d{3})*\s\d{2}|\d{1,3}\s\d{2})'}
+
+
+def legacy_convert_to_float(value):
+    if not value:
+        return 0.0
+    cleaned_value = value.replace(' ', '').replace(',', '')
+    if len(cleaned_value) < 2:
+        return 0.0
+    try:
+        return float(f"{cleaned_value[:-2]}.{cleaned_value[-2:]}")
+    except ValueError:
+        return 0.0
+
+
+def legacy_value_between_labels(label, next_label, line, language):
+    """extract_value_between_labels in English, extract_value_between_labelsFR in French."""
+    number_pattern = r'(\d{1,3}(?:,\d{3})*\s\d{2})' if language == 'EN' else LEGACY_PATTERNS['FR']
+    if label in line:
+        after_label = line.split(label)[-1]
+        if next_label and next_label in after_label:
+            after_label = after_label.split(next_label)[0]
+        match = re.search(number_pattern, after_label.strip())
+        if match:
+            return legacy_convert_to_float(match.group(0).replace(',', '').replace(' ', ''))
+    return 0.0
+
+
+def legacy_search(line, language):
+    """The whole-line search of the totals, e.g. the GST credit line."""
+    match = re.search(LEGACY_PATTERNS[language], line)
+    return legacy_convert_to_float(match.group(0).replace(',', '').replace(' ', '')) if match else None
+
+
+def noisy_line(rng, labels, language):
+    """
+    A line with some of `labels`, each followed by an amount, digits or nothing:
+    amounts running into more digits ('1,006 335'), digits running into an
+    amount ('12345 67'), lone numbers and cents.
+    """
+    parts = []
+    for label in labels:
+        if rng.random() < 0.2:
+            continue
+        [cents] = random_cents(rng, 1)
+        parts.append(label)
+        parts.append(rng.choice([
+            printed(cents, language),
+            printed(cents, language) + str(rng.randrange(10)),
+            printed(cents, language) + f" {rng.randrange(1000)}",
+            str(rng.randrange(10, 100000)) + printed(cents, language),
+            f"{rng.randrange(10)} {printed(cents, language)}",
+            str(rng.randrange(1000)),
+            f"{rng.randrange(100):02d}",
+            "",
+        ]))
+    return " ".join(parts)
+
+
+@pytest.mark.parametrize('language', ['EN', 'FR'])
+def test_parsing_matches_the_legacy_extractors(language):
+    rng = random.Random(48)
+    labels = ["July 2025", "October 2025", "January 2026", "April 2026"]
+    for _ in range(5000):
+        line = noisy_line(rng, labels, language)
+        label, next_label = rng.choice(labels), rng.choice(labels + ["", None, "Total"])
+        assert cents_between_labels(label, next_label, line, language) / 100 \
+            == legacy_value_between_labels(label, next_label, line, language), line
+        cents = parse_cents(line, language)
+        assert (None if cents is None else cents / 100) == legacy_search(line, language), line
+
+
+def test_extractors_match_the_legacy_parsing():
+    rng = random.Random(49)
+    total_label = "Goods and Services Tax Credit (if line 24 is less than $1, enter zero)."
+    for _ in range(1000):
+        lines = [noisy_line(rng, ["July 2025", "January 2026"], 'EN'),
+                 noisy_line(rng, ["October 2025", "April 2026"], 'EN'),
+                 noisy_line(rng, [total_label], 'EN')]
+        gst_credit = extract_gst_credit(lines, 2024)
+        for month, next_month in (("July 2025", "January 2026"), ("October 2025", "April 2026"),
+                                  ("January 2026", ""), ("April 2026", "")):
+            expected = legacy_value_between_labels(month, next_month, lines[0], 'EN') \
+                or legacy_value_between_labels(month, next_month, lines[1], 'EN')
+            assert gst_credit.payment(month.split()[0].lower()) / 100 == expected, lines
+        if total_label in lines[2]:
+            assert gst_credit.total / 100 == (legacy_search(lines[2], 'EN') or 0), lines
+
+
+def test_extracted_totals_are_exact_sums():
+    rng = random.Random(47)
+    for _ in range(300):
+        amounts = random_cents(rng, 12)
+        gst = [f"July 2025 {printed(amounts[0], 'EN')} January 2026 {printed(amounts[1], 'EN')}",
+               f"October 2025 {printed(amounts[2], 'EN')} April 2026 {printed(amounts[3], 'EN')}"]
+        gst_credit = extract_gst_credit(gst, 2024)
+        assert [gst_credit.payment(month) for month in ('july', 'january', 'october', 'april')] == amounts[:4]
+
+        solidarity = [" ".join(f"{m} 2025 {printed(c, 'EN')}" for m, c in zip(MONTHS_EN[:6], amounts[:6])),
+                      " ".join(f"{m} 2026 {printed(c, 'EN')}" for m, c in zip(MONTHS_EN[6:], amounts[6:]))]
+        assert extract_solidarity_credit(solidarity, 2024).total == sum(amounts)
+
+        trillium = [f"{a} 2025 {printed(x, 'FR')} {b} 2026 {printed(y, 'FR')}"
+                    for a, b, x, y in zip(MONTHS_FR[:6], MONTHS_FR[6:], amounts[:6], amounts[6:])]
+        assert extract_ontario_trilliumFR(trillium, 2024).total == sum(amounts)
+
+        ccb = [f"{m} {2025 if i < 6 else 2026} 1 0 0 {printed(c, 'FR')}"
+               for i, (m, c) in enumerate(zip(MONTHS_FR, amounts))]
+        assert extract_child_benefitFR(ccb, 2024).total == sum(amounts)
+
+        summary = extract_tax_summary([f"Refund 48400 {printed(amounts[0], 'EN')}",
+                                       f"Balance due 479 = {printed(amounts[1], 'EN')}"], 2024)
+        assert (summary.federal_refund, summary.quebec_owing) == (amounts[0], amounts[1])
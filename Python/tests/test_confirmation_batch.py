@@ -0,0 +1,86 @@
+import json
+import os
+import subprocess
+import sys
+
+import fitz
+import pytest
+
+from benchmarks.syntheticReturns import build_invoice_job
+from createConfirmationDocuments import household_jobs
+from models.jobManifest import ManifestError, validate
+
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def batch_payload(directory, households, workers=1):
+    selected_prices, invoice_details, tax_rate, include_taxes, language = build_invoice_job(3, 'en', 'QC')
+    return {
+        'directory': directory, 'selected_prices': selected_prices, 'tax_rate': tax_rate,
+        'include_taxes': include_taxes, 'language': language, 'workers': workers,
+        'households': [
+            {
+                'clients': [{'title': 'Mr', 'name': f"Client {i}", 'years': [{'year': 2024, 'confirmationNumbers': {'federal': f"F{i}", 'quebec': f"Q{i}"}}]}],
+                'invoice_details': {**invoice_details, 'name': f"Client {i}", 'invoiceNumber': i},
+                **({'language': 'fr'} if i % 2 else {}),
+            }
+            for i in range(households)
+        ],
+    }
+
+
+def test_households_override_the_payload():
+    payload = batch_payload('/out', 2)
+    validate({'version': 1, 'job': 'createConfirmationDocuments', 'payload': payload})
+    jobs = household_jobs(payload)
+    assert [j['language'] for j in jobs] == ['en', 'fr']
+    assert jobs[1]['selected_prices'] is payload['selected_prices']
+
+    single = {key: value for key, value in payload.items() if key != 'households'}
+    with pytest.raises(ManifestError, match='missing clients or households'):
+        validate({'version': 1, 'job': 'createConfirmationDocuments', 'payload': single})
+
+
+def test_batch_manifest_with_workers(tmp_path):
+    combined = str(tmp_path / 'batch' / 'Invoices.pdf')
+    payload = {**batch_payload(str(tmp_path), 5, workers=2), 'combined_invoice': combined}
+    manifest = {'version': 1, 'job': 'createConfirmationDocuments', 'payload': payload}
+    result = subprocess.run(
+        [sys.executable, 'createConfirmationDocuments.py', '--manifest', '-'],
+        input=json.dumps(manifest), cwd=PYTHON_DIR, capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    output = json.loads(result.stdout)
+    assert [os.path.basename(d['email']) for d in output['documents']] == [
+        f"Confirmation Client {i} 2024.docx" for i in range(5)
+    ]
+    assert all(d['timings']['email_s'] > 0 and d['timings']['invoice_s'] > 0 for d in output['documents'])
+    assert output['timings']['total_s'] >= output['timings']['pricing_s'] > 0
+    assert len(list(tmp_path.glob('Confirmation Client *.docx'))) == 5
+    invoices = sorted(tmp_path.glob('*.pdf'))
+    assert [path.name.split('_')[0] for path in invoices] == ['Facture', 'Facture', 'Invoice', 'Invoice', 'Invoice']
+    with fitz.open(invoices[0]) as doc:
+        assert '000001' in doc[0].get_text()
+
+    assert output['combined_invoice'] == combined
+    assert os.listdir(tmp_path / 'batch') == ['Invoices.pdf']
+    with fitz.open(combined) as doc:
+        assert [f"{i:06}" in page.get_text() for i, page in enumerate(doc)] == [True] * 5
+
+
+def test_renderers_take_the_whole_batch(tmp_path, monkeypatch):
+    from createConfirmationDocuments import create_confirmation_documents
+    from models import createConfirmationEmail, createInvoicePDF
+
+    batches = []
+    for module, name in ((createConfirmationEmail, 'create_confirmation_emails'),
+                         (createInvoicePDF, 'create_confirmation_invoices')):
+        render = getattr(module, name)
+        monkeypatch.setattr(module, name, lambda jobs, *args, render=render, **kwargs: batches.append(len(jobs)) or render(jobs, *args, **kwargs))
+
+    combined = str(tmp_path / 'Invoices.pdf')
+    result = create_confirmation_documents(household_jobs(batch_payload(str(tmp_path), 4)), combined_invoice=combined)
+    assert batches == [4, 4]
+    assert all(d['timings']['email_s'] > 0 and d['timings']['invoice_s'] > 0 for d in result['documents'])
+    with fitz.open(combined) as doc:
+        assert len(doc) == 4
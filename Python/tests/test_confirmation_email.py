@@ -0,0 +1,46 @@
+import copy
+
+from docx import Document
+
+from models.createConfirmationEmail import create_confirmation_email, create_confirmation_emails
+
+CLIENTS = [
+    {'title': 'Mr', 'name': 'Jean Tremblay', 'years': [{'year': 2024, 'confirmationNumbers': {'federal': 'A1', 'quebec': 'Q1'}}]},
+    {'title': 'Ms', 'name': 'Marie Roy', 'years': [{'year': 2024, 'confirmationNumbers': {'federal': 'A2', 'quebec': 'Mail QC'}}]},
+]
+PRICES = [{'service': {'en': 'Tax return', 'fr': "Déclaration d'impôt"}, 'amount': 1200.0, 'quantity': 2, 'type': 'number'}]
+TAX_RATE = {'province': 'QC', 'fedRate': 5, 'provRate': '9.975%'}
+
+
+def test_french_email_does_not_mutate_clients(tmp_path):
+    clients = copy.deepcopy(CLIENTS)
+    path = create_confirmation_email(str(tmp_path), clients, PRICES, TAX_RATE, True, 'fr')
+    assert clients == CLIENTS
+    assert path.endswith('Confirmation Jean Tremblay & Marie Roy 2024.docx')
+    assert (tmp_path / 'Confirmation Jean Tremblay & Marie Roy 2024.docx').exists()
+
+
+def email_content(path):
+    doc = Document(path)
+    external = sorted(rel.target_ref for rel in doc.part.rels.values() if rel.is_external)
+    return [(p.text, [run.bold for run in p.runs]) for p in doc.paragraphs], doc.styles['Normal'].font.name, external
+
+
+def test_batch_emails_match_single_emails(tmp_path):
+    (tmp_path / 'single').mkdir()
+    (tmp_path / 'batch').mkdir()
+    jobs = [
+        {'directory': str(tmp_path / 'batch'), 'clients': [{**client, 'name': f"{client['name']} {province}"}],
+         'selected_prices': prices, 'tax_rate': {**TAX_RATE, 'province': province}, 'include_taxes': True,
+         'language': language}
+        for client, prices, province, language in [
+            (CLIENTS[0], PRICES, 'QC', 'fr'), (CLIENTS[1], [], 'ON', 'en'),
+            (CLIENTS[1], PRICES, 'QC', 'fr'), (CLIENTS[0], PRICES, 'ON', 'en'),
+        ]
+    ]
+    paths = create_confirmation_emails(jobs)
+    for job, path in zip(jobs, paths):
+        single = create_confirmation_email(
+            str(tmp_path / 'single'), job['clients'], job['selected_prices'], job['tax_rate'], True, job['language'],
+        )
+        assert email_content(path) == email_content(single)
@@ -0,0 +1,112 @@
+import locale
+
+import pytest
+from docx import Document
+
+from models.createConfirmationEmail import add_tax_summary_fees_section_french
+from models.currencyFormat import NBSP, format_amount, format_money
+from models.pricing import price_services
+from models.workspace import carryforward_amountsFR
+
+# localeconv() as reported for fr_CA.UTF-8 / French_Canada.1252
+FR_CA_CONV = {
+    'decimal_point': ',', 'thousands_sep': NBSP, 'grouping': [3, 3, 0],
+    'mon_decimal_point': ',', 'mon_thousands_sep': NBSP, 'mon_grouping': [3, 3, 0],
+}
+
+AMOUNTS = (
+    [cents / 100 for cents in range(-2500, 250000, 7)]
+    + [0, 1, 999.995, 1000, 1234.5, 99999.99, 100000, 1234567.891, 12345678.9, -0.004]
+    + [0.125, 0.135, 2.675, 1.005, 1e-9]
+)
+
+
+@pytest.fixture
+def fr_ca_locale(monkeypatch):
+    monkeypatch.setattr(locale, 'localeconv', lambda: FR_CA_CONV)
+
+
+def legacy_docx_fr(amount):
+    """createWordDoc.format_currency before the locale was removed."""
+    return f"{locale.format_string('%.2f', amount, grouping=True).replace('.', ',')} $"
+
+
+def test_fr_matches_fr_ca_locale(fr_ca_locale):
+    for amount in AMOUNTS:
+        assert format_money(amount, 'FR') == legacy_docx_fr(amount), amount
+
+
+def test_fr_integer_matches_fr_ca_locale(fr_ca_locale):
+    for value in list(range(0, 200000, 37)) + [1000000, 12345678]:
+        legacy = locale.format_string("%d", value, grouping=True).replace(",", " ")
+        assert format_amount(value, 'FR', decimals=0) == legacy
+
+    # "%d" truncates, so the tuition carryforwards are passed through int() first
+    for value in [1234.6, 999.99, 100000.5, 0.7]:
+        legacy = locale.format_string("%d", value, grouping=True).replace(",", " ")
+        assert format_amount(int(value), 'FR', decimals=0) == legacy
+    doc = Document()
+    carryforward_amountsFR(doc, {'carryforward_amounts': {'federal_tuition_amount': "1234.6",
+                                                          'quebec_tuition_8_percent': 999.99}})
+    text = doc.paragraphs[-1].text
+    assert f"1{NBSP}234 $" in text and "999 $" in text
+
+
+def legacy_format_french_number(amount):
+    """format_french_number of the docx builders and the French confirmation email."""
+    return f"{amount:,.2f}".replace(",", " ").replace(".", ",")
+
+
+def test_fr_number_matches_space_grouped_helpers():
+    for amount in AMOUNTS:
+        assert format_amount(amount, 'FR', thousands=' ') == legacy_format_french_number(amount)
+        assert format_money(amount, 'fr', thousands=' ') == legacy_format_french_number(amount) + " $"
+
+
+def test_fr_email_fees_keep_ascii_spaces():
+    prices = [{'service': {'en': 'Return', 'fr': 'Déclaration'}, 'amount': 1234.5, 'quantity': 2, 'type': 'number'}]
+    pricing = price_services(prices, {'province': 'QC', 'fedRate': 5, 'provRate': '9.975%'}, True)
+    doc = Document()
+    add_tax_summary_fees_section_french(doc, pricing)
+    text = "\n".join(paragraph.text for paragraph in doc.paragraphs)
+    for amount in (1234.5, 2469, 123.45, 246.28, 2838.73):
+        assert legacy_format_french_number(amount) + " $" in text
+    assert NBSP not in text
+
+
+def test_en_matches_fstring():
+    for amount in AMOUNTS:
+        assert format_money(amount, 'EN') == f"${amount:,.2f}"
+        assert format_money(amount, 'en', grouping=False) == f"${amount:.2f}"
+
+
+def test_fr_ungrouped_matches_invoice():
+    for amount in AMOUNTS:
+        assert format_money(amount, 'fr', grouping=False) == f"{amount:.2f}".replace('.', ',') + " $"
+
+
+def test_examples():
+    assert format_money(1234.56, 'EN') == "$1,234.56"
+    assert format_money(1234.56, 'FR') == f"1{NBSP}234,56 $"
+    assert format_amount(1006, 'fr', decimals=0, thousands=' ') == "1 006"
+
+
+def test_missing_amount_raises():
+    # The locale and f-string formatting raised too; a missing amount must not print as 0,00 $
+    with pytest.raises(TypeError):
+        format_money(None, 'FR')
+    with pytest.raises(TypeError):
+        format_amount(None, 'EN')
+    assert format_amount(1006, 'fr', decimals=0) == f"1{NBSP}006"
+
+
+def test_negative_zero_does_not_poison_cache():
+    assert format_money(-0.0, 'EN') == "$0.00"
+    assert format_money(0.0, 'EN') == "$0.00"
+
+
+def test_import_does_not_touch_global_locale():
+    before = locale.setlocale(locale.LC_ALL)
+    import models.createWordDoc  # noqa: F401
+    import models.createWordDocMultiYear  # noqa: F401
+    assert locale.setlocale(locale.LC_ALL) == before
@@ -0,0 +1,26 @@
+import json
+
+from benchmarks.importTime import BUDGET_PATH, check, measure, parse_importtime
+
+SAMPLE = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     _json
+import time:       300 |        420 |   json.decoder
+import time:       900 |       1320 | json
+"""
+
+
+def test_parse_importtime():
+    assert parse_importtime(SAMPLE) == [
+        ('_json', 120, 120, 2),
+        ('json.decoder', 300, 420, 1),
+        ('json', 900, 1320, 0),
+    ]
+
+
+def test_entry_points_defer_heavy_imports():
+    # Only the forbidden-module part of the budget: wall-clock budgets are machine dependent
+    with open(BUDGET_PATH, encoding='utf-8') as f:
+        budgets = json.load(f)
+    for module, budget in budgets.items():
+        report = measure(module, runs=1)
+        assert check(report, {'forbidden': budget['forbidden']}) == []
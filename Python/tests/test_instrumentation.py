@@ -0,0 +1,85 @@
+import json
+import threading
+
+from benchmarks.syntheticReturns import CONFIGURATION, build_client_files
+from createSummaryDocuments import process_files
+from models import instrumentation
+from models.instrumentation import count, job, span
+
+
+def test_disabled_by_default(monkeypatch):
+    monkeypatch.delenv(instrumentation.ENV_VAR, raising=False)
+    with job('summary') as recorder:
+        assert recorder is None
+        assert span('pdf.open') is span('split')
+        count('pages')
+    assert not instrumentation.enabled()
+
+
+def test_summary_job_writes_sidecar(monkeypatch, tmp_path):
+    monkeypatch.setenv(instrumentation.ENV_VAR, str(tmp_path / 'metrics'))
+    client_files = build_client_files(str(tmp_path / 'returns'), 2, 'EN', filler_pages=2)
+    with job('summary', clients=2):
+        process_files(client_files, str(tmp_path / 'out'), CONFIGURATION)
+
+    [sidecar] = (tmp_path / 'metrics').glob('summary-*.json')
+    metrics = json.loads(sidecar.read_text(encoding='utf-8'))
+    assert metrics['attributes'] == {'clients': 2, 'status': 'ok'}
+    assert metrics['spans']['split']['count'] == 2
+    assert metrics['spans']['split.encrypt']['count'] == 2
+    assert metrics['spans']['split.write']['count'] >= 2
+    assert metrics['spans']['extract.extract_child_benefit']['count'] == 2
+    assert metrics['spans']['docx.individual']['count'] == 2
+    assert metrics['counters']['docx.documents'] == 2
+    assert not instrumentation.enabled()
+
+
+def test_stderr_line_on_failure(monkeypatch, capsys):
+    monkeypatch.setenv(instrumentation.ENV_VAR, '1')
+    try:
+        with job('confirmation'):
+            with span('invoice.render'):
+                raise RuntimeError('boom')
+    except RuntimeError:
+        pass
+    line = capsys.readouterr().err.strip()
+    assert line.startswith(instrumentation.LOG_PREFIX)
+    metrics = json.loads(line[len(instrumentation.LOG_PREFIX):])
+    assert metrics['attributes']['status'] == 'error'
+    assert metrics['spans']['invoice.render']['errors'] == 1
+
+
+def test_overlapping_jobs_keep_their_spans(monkeypatch, tmp_path):
+    monkeypatch.setenv(instrumentation.ENV_VAR, str(tmp_path / 'metrics'))
+    started, release = threading.Barrier(2), threading.Event()
+
+    def run(name):
+        with job(name):
+            started.wait()
+            with span(name + '.stage'):
+                release.wait()
+            count(name + '.items', 2)
+
+    threads = [threading.Thread(target=run, args=(name,)) for name in ('summary', 'confirmation')]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    for name in ('summary', 'confirmation'):
+        [sidecar] = (tmp_path / 'metrics').glob(f'{name}-*.json')
+        metrics = json.loads(sidecar.read_text(encoding='utf-8'))
+        assert list(metrics['spans']) == [name + '.stage']
+        assert metrics['counters'] == {name + '.items': 2}
+    assert not instrumentation.enabled()
+
+
+def test_jobs_finishing_together_keep_their_sidecars(monkeypatch, tmp_path):
+    monkeypatch.setenv(instrumentation.ENV_VAR, str(tmp_path / 'metrics'))
+    for clients in range(3):
+        with job('summary', clients=clients):
+            count('pages')
+    sidecars = sorted((tmp_path / 'metrics').glob('summary-*.json'))
+    assert len(sidecars) == 3
+    assert sorted(json.loads(path.read_text(encoding='utf-8'))['attributes']['clients'] for path in sidecars) == [0, 1, 2]
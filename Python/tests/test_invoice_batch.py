@@ -0,0 +1,53 @@
+import datetime
+import os
+
+import fitz
+
+from benchmarks.syntheticReturns import build_invoice_job
+from models.createInvoicePDF import create_confirmation_invoice, create_confirmation_invoices
+
+
+def invoice_jobs(directory, variants):
+    jobs = []
+    for i, (language, province) in enumerate(variants):
+        selected_prices, invoice_details, tax_rate, include_taxes, _ = build_invoice_job(20, language, province)
+        jobs.append({
+            'directory': directory, 'selected_prices': selected_prices, 'tax_rate': tax_rate,
+            'invoice_details': {**invoice_details, 'name': f"Client {i}"},
+            'include_taxes': include_taxes, 'language': language,
+        })
+    return jobs
+
+
+def page_texts(path):
+    with fitz.open(path) as doc:
+        return [page.get_text() for page in doc]
+
+
+def test_batch_matches_single_invoices(tmp_path):
+    jobs = invoice_jobs(str(tmp_path / 'batch'), [('en', 'ON'), ('fr', 'QC'), ('en', 'QC'), ('de', 'ON')])
+    paths = create_confirmation_invoices(jobs)
+    date_str = datetime.date.today().strftime('%d%m%y')
+    assert [os.path.basename(p) if p else p for p in paths] == [
+        f"Invoice_Client0_{date_str}.pdf", f"Facture_Client1_{date_str}.pdf", f"Invoice_Client2_{date_str}.pdf", None,
+    ]
+    for job, path in zip(jobs[:3], paths):
+        single = create_confirmation_invoice(
+            str(tmp_path / 'single'), job['selected_prices'], job['invoice_details'], job['tax_rate'],
+            job['include_taxes'], job['language'],
+        )
+        assert page_texts(path) == page_texts(single)
+
+
+def test_combined_document_embeds_images_once(tmp_path):
+    jobs = invoice_jobs(str(tmp_path), [('en', 'ON'), ('en', 'QC'), ('fr', 'QC')] * 3)
+    combined_path = str(tmp_path / 'combined.pdf')
+    paths = create_confirmation_invoices(jobs, combined_path)
+
+    with fitz.open(combined_path) as combined:
+        assert len(combined) == sum(len(page_texts(p)) for p in paths) == 18
+        # logoEN, logoFR and donate, shared by every invoice
+        assert len({image[0] for page in combined for image in page.get_images()}) == 3
+    with fitz.open(paths[0]) as first:
+        assert len({image[0] for page in first for image in page.get_images()}) == 2
+    assert page_texts(combined_path)[:2] == page_texts(paths[0])
@@ -0,0 +1,62 @@
+import fitz
+
+from models.invoiceLayout import COMPANY_HEADERS, RIGHT_MARGIN, TRAILER_TEXT, draw_trailer, right_align_lines, text_width
+
+
+def test_static_strings_are_measured_once():
+    text_width.cache_clear()
+    for _ in range(3):
+        for layout in COMPANY_HEADERS.values():
+            for text, _, fontname, fontsize in layout:
+                text_width(text, fontname, fontsize)
+    distinct = len({(text, fontname, fontsize) for layout in COMPANY_HEADERS.values() for text, _, fontname, fontsize in layout})
+    assert text_width.cache_info().misses == distinct
+    assert text_width("INVOICE", "Courier-Bold", 24) == fitz.Font("Courier-Bold").text_length("INVOICE", fontsize=24)
+
+
+def test_right_aligned_lines_end_at_the_margin():
+    doc = fitz.open()
+    page = doc.new_page()
+    right_align_lines(page, COMPANY_HEADERS['bilingual'])
+    words = page.get_text('words')
+    assert max(word[2] for word in words) <= RIGHT_MARGIN + 0.5
+    assert all(abs(line[0][2] - RIGHT_MARGIN) < 1 for line in _lines(words))
+
+
+def _lines(words):
+    by_line = {}
+    for word in words:
+        by_line.setdefault((word[5], word[6]), []).append(word)
+    return [sorted(line, key=lambda w: -w[2]) for line in by_line.values()]
+
+
+def test_invoice_text_keeps_its_fonts_over_the_template(tmp_path):
+    from benchmarks.syntheticReturns import build_invoice_job
+    from models.createInvoicePDF import create_confirmation_invoice
+
+    selected_prices, invoice_details, tax_rate, include_taxes, _ = build_invoice_job(3, 'en', 'QC')
+    path = create_confirmation_invoice(str(tmp_path), selected_prices, invoice_details, tax_rate, include_taxes, 'en')
+    with fitz.open(path) as doc:
+        fonts = {span['text']: span['font'] for block in doc[0].get_text('dict')['blocks']
+                 for line in block.get('lines', []) for span in line['spans']}
+    assert fonts['Synthetic Client'] == 'Helvetica-Bold'
+    assert fonts['004242'] == 'Helvetica'
+    assert fonts['INVOICE / FACTURE'] == 'Courier-Bold'
+
+
+def test_trailer_labels_per_layout():
+    from benchmarks.syntheticReturns import build_invoice_job
+    from models.pricing import price_services
+
+    selected_prices, invoice_details, tax_rate, _, _ = build_invoice_job(2, 'en', 'QC')
+    for layout, text in TRAILER_TEXT.items():
+        for include_taxes in (True, False):
+            page = fitz.open().new_page()
+            draw_trailer(page, 300, price_services(selected_prices, tax_rate, include_taxes), invoice_details, layout)
+            content = page.get_text()
+            assert (text['subtotal'] in content) == include_taxes
+            assert (f"{text['qst']} (9.975%):" in content) == include_taxes
+            assert text['notes'] in content and invoice_details['notes'] in content
+            # search_for ignores case: "Total:" is also found in "Sous-total:", above the total
+            total = max((rect for rect in page.search_for(text['total']) if rect.x0 < 450), key=lambda rect: rect.y0)
+            assert abs(total.x0 - 400) < 1 and total.y1 > 300
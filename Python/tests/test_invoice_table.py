@@ -0,0 +1,57 @@
+import fitz
+
+from benchmarks.syntheticReturns import build_invoice_job
+from models.createInvoicePDF import create_confirmation_invoice
+from models.invoiceLayout import text_width
+from models.invoiceTable import (
+    CONTINUATION_ROW_Y, FIRST_ROW_Y, FOOTER_TOP, LINE_HEIGHT, PAGE_BOTTOM, ROW_HEIGHT, TRAILER_HEIGHT, paginate,
+    wrap_text,
+)
+
+
+def test_wrap_text_fits_the_column():
+    text = "Tax return preparation including slips, carry-forward amounts and prior-year adjustments"
+    lines = wrap_text(text, 150)
+    assert len(lines) > 1
+    assert " ".join(lines) == text
+    assert all(text_width(line, "Helvetica", 9) <= 150 for line in lines)
+
+    assert wrap_text("Short", 150) == ["Short"]
+    assert wrap_text("", 150) == [""]
+    long_word = wrap_text("x" * 80, 100)
+    assert "".join(long_word) == "x" * 80
+    assert all(text_width(line, "Helvetica", 9) <= 100 for line in long_word)
+
+
+def test_paginate_by_remaining_height():
+    pages, trailer_y = paginate([1, 1, 3])
+    assert pages == [[(0, FIRST_ROW_Y), (1, FIRST_ROW_Y + ROW_HEIGHT), (2, FIRST_ROW_Y + 2 * ROW_HEIGHT)]]
+    assert trailer_y == FIRST_ROW_Y + 3 * ROW_HEIGHT + 2 * LINE_HEIGHT
+
+    pages, trailer_y = paginate([1] * 60)
+    assert [index for page in pages for index, _ in page] == list(range(60))
+    assert all(y <= PAGE_BOTTOM for page in pages for _, y in page)
+    assert pages[1][0][1] == CONTINUATION_ROW_Y
+    assert trailer_y + TRAILER_HEIGHT <= FOOTER_TOP
+
+    # The rows fit on the first page but the totals do not
+    pages, trailer_y = paginate([1] * 20)
+    assert len(pages[0]) == 20 and pages[1] == []
+    assert trailer_y == CONTINUATION_ROW_Y
+
+
+def test_long_invoice_repeats_the_band(tmp_path):
+    selected_prices, invoice_details, tax_rate, include_taxes, _ = build_invoice_job(60, 'fr', 'QC')
+    selected_prices[0]['service']['fr'] += " avec les feuillets, les reports et les ajustements des années antérieures"
+    path = create_confirmation_invoice(str(tmp_path), selected_prices, invoice_details, tax_rate, include_taxes, 'fr')
+
+    with fitz.open(path) as doc:
+        texts = [page.get_text() for page in doc]
+        assert len(doc) == 3
+        assert all("Articles" in text for text in texts)
+        assert all(f"service {i}\n" in "".join(texts) for i in range(1, 60))
+        assert "antérieures" in texts[0]
+        assert "Notes / Conditions" in texts[-1] and "Notes / Conditions" not in texts[0]
+        # Nothing drawn over the footer of the last page
+        notes = doc[-1].search_for("Interac")[0]
+        assert notes.y1 < 660
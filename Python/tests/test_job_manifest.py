@@ -0,0 +1,81 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks.syntheticReturns import CONFIGURATION, build_client_files
+from models.jobManifest import ManifestError, iter_manifests, manifest_source, read_manifest, validate
+
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def summary_manifest(client_files, directory):
+    return {
+        'version': 1,
+        'job': 'createSummaryDocuments',
+        'payload': {'client_files': client_files, 'directory': directory, 'configuration': CONFIGURATION},
+    }
+
+
+def test_validate_reports_the_first_problem():
+    manifest = summary_manifest([{'directory': 'a.pdf'}], '/out')
+    assert validate(manifest, 'createSummaryDocuments') is manifest['payload']
+
+    with pytest.raises(ManifestError, match='version'):
+        validate({**manifest, 'version': 2})
+    with pytest.raises(ManifestError, match='not createConfirmationDocuments'):
+        validate(manifest, 'createConfirmationDocuments')
+    with pytest.raises(ManifestError, match=r'client_files\[1\] is missing directory'):
+        validate(summary_manifest([{'directory': 'a.pdf'}, {'label': 'b'}], '/out'))
+    with pytest.raises(ManifestError, match='missing configuration'):
+        validate({**manifest, 'payload': {'client_files': [], 'directory': '/out'}})
+    with pytest.raises(ManifestError, match='include_taxes must be a boolean'):
+        validate({'version': 1, 'job': 'createConfirmationDocuments', 'payload': {
+            'directory': '/out', 'clients': [], 'selected_prices': [], 'invoice_details': {},
+            'tax_rate': {'province': 'QC'}, 'include_taxes': 'true', 'language': 'en',
+        }})
+
+
+def test_additions_extend_the_previous_manifest():
+    lines = [
+        json.dumps(summary_manifest([{'directory': 'a.pdf'}], '/out')),
+        '',
+        json.dumps({'version': 1, 'append': {'client_files': [{'directory': 'b.pdf'}]}}),
+    ]
+    seen = [len(m['payload']['client_files']) for m in iter_manifests(lines, 'createSummaryDocuments')]
+    assert seen == [1, 2]
+    assert read_manifest('\n'.join(lines))['payload']['client_files'][1] == {'directory': 'b.pdf'}
+
+    with pytest.raises(ManifestError, match='not a list field'):
+        read_manifest('\n'.join(lines[:1] + [json.dumps({'version': 1, 'append': {'directory': '/x'}})]))
+    with pytest.raises(ManifestError, match='never sent'):
+        read_manifest(lines[2] + '\n' + lines[2])
+
+
+def test_manifest_source():
+    assert manifest_source(['job']) == '-'
+    assert manifest_source(['job', '--manifest', 'job.json']) == 'job.json'
+    with pytest.raises(ManifestError, match='Usage'):
+        manifest_source(['job', '[]', '/out'])
+
+
+def test_summary_cli_reads_the_manifest_from_stdin(tmp_path):
+    client_files = build_client_files(str(tmp_path), 2, 'EN', filler_pages=1)
+    manifest = summary_manifest(client_files, str(tmp_path / 'out'))
+    result = subprocess.run(
+        [sys.executable, 'createSummaryDocuments.py', '--manifest', '-'],
+        input=json.dumps(manifest), cwd=PYTHON_DIR, capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    assert json.loads(result.stdout) == {'result': 'Documents created successfully.'}
+    assert len(list((tmp_path / 'out').glob('*.docx'))) == 2
+
+    manifest['payload']['client_files'] = 'not a list'
+    result = subprocess.run(
+        [sys.executable, 'createSummaryDocuments.py'],
+        input=json.dumps(manifest), cwd=PYTHON_DIR, capture_output=True, text=True,
+    )
+    assert result.returncode == 1
+    assert result.stderr.strip().splitlines()[-1].endswith('ManifestError: createSummaryDocuments: client_files must be a list')
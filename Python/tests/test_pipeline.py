@@ -0,0 +1,189 @@
+import copy
+import os
+
+import fitz
+import pytest
+
+from benchmarks.runBenchmarks import run_benchmarks
+from benchmarks.syntheticReturns import CONFIGURATION, build_client_files, pair_as_couples
+from createSummaryDocuments import (
+    detect_language_and_year, parse_bookmark, prepare_client_files, process_files, read_cover_lines, split_return,
+    summary_outline,
+)
+from models.createSummary import (
+    create_summary_documents, document_summaries, extract_return_summary, prepare_summary, summarize_client_files,
+)
+
+
+def test_synthetic_returns_round_trip(tmp_path):
+    client_files = build_client_files(str(tmp_path / 'EN'), 3, 'EN', filler_pages=2)
+    client_files += build_client_files(str(tmp_path / 'FR'), 3, 'FR', filler_pages=2, start=3)
+    original = copy.deepcopy(client_files)
+
+    prepared = prepare_client_files(client_files, str(tmp_path / 'out'), CONFIGURATION)
+    summaries = {cf['label']: cf['summary'].to_dict() for cf in summarize_client_files(prepared)}
+    assert client_files == original
+
+    quebec = summaries['Alex Tremblay0']
+    assert quebec['tax_summary']['federal_refund'] == 1234.56
+    assert quebec['tax_summary']['quebec_refund'] == 567.89
+    assert quebec['ccb_amounts']['ccb_amount'] == 1203.96
+    assert quebec['family_allowance_amounts']['fa_amount'] == 3000.0
+    assert summaries['Sam Tremblay1']['ontario_trillium_amounts']['ontario_trillium_amount'] == 360.0
+    assert summaries['Jordan Tremblay2']['climate_action_credit_amounts']['climate_action_amount'] == 504.0
+    assert [cf['language'] for cf in prepared] == ['EN'] * 3 + ['FR'] * 3
+    assert {cf['year'] for cf in prepared} == {2024}
+
+
+def test_outline_leaves_the_sections_unchanged(tmp_path):
+    client_files = build_client_files(str(tmp_path / 'returns'), 3, 'EN', filler_pages=2, overview_pages=3)
+    for cf in prepare_client_files(client_files, str(tmp_path / 'out'), CONFIGURATION):
+        outline = cf['summary_outline']
+        assert outline[0] == ('Two-year comparison 1', 0)
+        guided = prepare_summary(cf['summary_file_path'], 'EN', outline)
+        assert guided == prepare_summary(cf['summary_file_path'], 'EN')
+        assert (extract_return_summary(cf['summary_file_path'], 'EN', 2024, outline)
+                == extract_return_summary(cf['summary_file_path'], 'EN', 2024))
+
+
+def test_title_scan_without_section_bookmarks(tmp_path):
+    client_files = build_client_files(str(tmp_path / 'returns'), 1, 'FR', filler_pages=2, overview_pages=2)
+    [cf] = prepare_client_files(client_files, str(tmp_path / 'out'), CONFIGURATION)
+    overview = [(title, page) for title, page in cf['summary_outline'] if page < 2]
+    scanned = extract_return_summary(cf['summary_file_path'], 'FR', 2024, overview)
+    assert scanned == extract_return_summary(cf['summary_file_path'], 'FR', 2024, cf['summary_outline'])
+    assert scanned.ccb.total == 120396
+
+
+def test_page_level_outline_keeps_every_section(tmp_path):
+    client_files = build_client_files(str(tmp_path / 'returns'), 3, 'EN', filler_pages=1, overview_pages=1)
+    for cf in prepare_client_files(client_files, str(tmp_path / 'out'), CONFIGURATION):
+        # One bookmark per page, as tax software writes them: most name a group of sections, not one
+        pages = {}
+        for title, page in cf['summary_outline']:
+            if 'comparison' in title or 'Tax return summary' in title or 'Carryforward' in title:
+                pages.setdefault(page, title)
+            else:
+                pages.setdefault(page, "Benefits and credits" if len(pages) % 2 else "Provincial benefits")
+        outline = sorted(((title, page) for page, title in pages.items()), key=lambda entry: entry[1])
+        assert any(title == "Benefits and credits" for title, _ in outline)
+
+        full = extract_return_summary(cf['summary_file_path'], 'EN', 2024)
+        assert extract_return_summary(cf['summary_file_path'], 'EN', 2024, outline) == full
+        assert full.gst is not None and full.ccb is not None
+
+
+def test_summary_outline_maps_bookmarks_to_summary_pages():
+    bookmarks = [" > Executive summary (Page 1)", " > Benefits (Page 9)", " > GST/HST Tax Credit (Page 9)",
+                 " > Tax return summary (Page 3)", " > Form > T1 (Page 12)"]
+    assert parse_bookmark(bookmarks[-1]) == ('Form > T1', 11)
+    assert parse_bookmark("Error reading PDF: EOF") is None
+    assert summary_outline(bookmarks, [2, 8]) == [
+        ('Tax return summary', 0), ('Benefits', 1), ('GST/HST Tax Credit', 1),
+    ]
+
+
+def test_language_and_year_from_cover_line():
+    assert detect_language_and_year(["Tax Software", "T1 return for the 2023 taxation year"]) == ('EN', '2023')
+    assert detect_language_and_year(["Déclaration pour l’année d'imposition 2024"]) == ('FR', '2024')
+    assert detect_language_and_year(["Executive summary", "2024"]) == (None, None)
+
+
+def test_year_below_cover_header(tmp_path):
+    [client_file] = build_client_files(str(tmp_path / 'returns'), 1, 'EN', filler_pages=1)
+    path = client_file['directory']
+    doc = fitz.open(path)
+    cover = doc[0]
+    cover.add_redact_annot(cover.search_for("taxation year")[0] + (-200, -2, 0, 2))
+    cover.apply_redactions()
+    cover.insert_text((36, 400), "Prepared for the 2023 taxation year", fontname="helv", fontsize=6.5)
+    doc.saveIncr()
+    doc.close()
+
+    assert detect_language_and_year(read_cover_lines(path)) == (None, None)
+    split = split_return(path, str(tmp_path / 'out'), CONFIGURATION)
+    assert (split['language'], split['year']) == ('EN', 2023)
+
+
+def test_language_from_outline_when_cover_wording_differs(tmp_path):
+    [client_file] = build_client_files(str(tmp_path / 'returns'), 1, 'EN', filler_pages=1)
+    path = client_file['directory']
+    doc = fitz.open(path)
+    cover = doc[0]
+    cover.add_redact_annot(cover.search_for("taxation year")[0] + (-200, -2, 0, 2))
+    cover.apply_redactions()
+    cover.insert_text((36, 100), "Taxation year: 2022", fontname="helv", fontsize=6.5)
+    doc.saveIncr()
+    doc.close()
+
+    split = split_return(path, str(tmp_path / 'out'), CONFIGURATION)
+    assert (split['language'], split['year']) == ('EN', 2022)
+
+
+def test_unknown_cover_and_outline(tmp_path):
+    path = str(tmp_path / '123456789 - No Outline.pdf')
+    doc = fitz.open()
+    doc.new_page().insert_text((36, 72), "Some other document")
+    doc.save(path)
+    with pytest.raises(ValueError, match="Executive Summary"):
+        split_return(path, str(tmp_path / 'out'), CONFIGURATION)
+
+
+def test_process_files_builds_couple_and_individual_documents(tmp_path):
+    client_files = pair_as_couples(build_client_files(str(tmp_path), 3, 'FR', filler_pages=2))
+    paths = process_files(client_files, str(tmp_path / 'out'), CONFIGURATION)
+    assert [os.path.basename(p) for p in paths] == [
+        'Sommaire Alex Tremblay0 & Sam Tremblay1 2024.docx',
+        'Sommaire Jordan Tremblay2 2024.docx',
+    ]
+
+
+def test_summary_job_leaves_client_files_untouched(tmp_path):
+    store = str(tmp_path / 'summaries.sqlite')
+    [earlier] = build_client_files(str(tmp_path / 'returns2023'), 1, 'EN', year=2023, filler_pages=1, start=2)
+    process_files([earlier], str(tmp_path / 'season1'), CONFIGURATION, summary_store=store)
+
+    client_files = pair_as_couples(build_client_files(str(tmp_path / 'returns'), 3, 'EN', filler_pages=1))
+    client_files[2]['prior_years'] = [2023]
+    prepared = prepare_client_files(client_files, str(tmp_path / 'out'), CONFIGURATION)
+    original = copy.deepcopy(prepared)
+
+    paths = create_summary_documents(prepared, str(tmp_path / 'out'), export=True, summary_store=store)
+    assert prepared == original
+
+    summarized = summarize_client_files(prepared)
+    document_summaries(summarized, str(tmp_path / 'out'), summary_store=store)
+    assert prepared == original
+    assert [client_file['label'] for client_file in summarized] == [client_file['label'] for client_file in prepared]
+    assert [os.path.basename(path) for path in paths[:2]] == [
+        'Summary Alex Tremblay0 & Sam Tremblay1 2024.docx', 'Summary Jordan Tremblay2 2023 & 2024.docx',
+    ]
+    assert [os.path.splitext(path)[1] for path in paths[2:]] == ['.csv', '.npz']
+
+
+def test_benchmark_results_document(tmp_path):
+    document = run_benchmarks([1], repeat=1, only=['extract:', 'invoice:fr'], pages=2, workdir=str(tmp_path), log=lambda _: None)
+    results = document['results']
+    assert 'extract:extract_child_benefitFR@1' in results
+    assert results['invoice:fr@1']['items'] == 1
+    assert all(r['min_s'] >= 0 and r['peak_kib'] >= 0 for r in results.values())
+
+
+def test_multi_year_fr_results_of_an_individual_quebec_resident():
+    from docx import Document
+    from models.createWordDocMultiYear import tax_returnFR
+
+    tax_summary = {'province': 'Québec', 'last_name': 'Tremblay', 'federal_refund': 1234.5, 'federal_owing': 0,
+                   'quebec_refund': 0, 'quebec_owing': 12}
+    doc = Document()
+    # The secondary Quebec block used to run for every Quebec return, and failed without a secondary summary
+    tax_returnFR(doc, {'tax_summary': tax_summary}, 2024, 2024)
+    text = "\n".join(paragraph.text for paragraph in doc.paragraphs)
+    assert text.count("Déclaration Provinciale") == 1
+    assert "remboursement de 1 234,50 $" in text and "montant de 12,00 $" in text
+
+    doc = Document()
+    secondary = {'tax_summary': {**tax_summary, 'last_name': 'Gagnon', 'quebec_owing': 0, 'quebec_refund': 45}}
+    tax_returnFR(doc, {'tax_summary': tax_summary}, 2024, 2024, secondary, 'M.', 'Mme', isCouple=True)
+    text = "\n".join(paragraph.text for paragraph in doc.paragraphs)
+    assert text.count("Déclaration Provinciale") == 2 and "remboursement de 45,00 $" in text
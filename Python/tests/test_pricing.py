@@ -0,0 +1,59 @@
+from decimal import Decimal
+
+import fitz
+from docx import Document
+
+from models.createConfirmationEmail import create_confirmation_email
+from models.createInvoicePDF import create_confirmation_invoice
+from models.pricing import format_rate, parse_rate, price_batch, price_services, round_cents
+
+QC = {'province': 'QC', 'fedRate': 5, 'provRate': '9.975%'}
+PRICES = [
+    {'service': {'en': 'Tax return', 'fr': "Déclaration"}, 'amount': 49.99, 'quantity': 3, 'type': 'number'},
+    {'service': {'en': 'Loyalty', 'fr': 'Fidélité'}, 'amount': -10, 'quantity': 1, 'type': '%'},
+    {'service': {'en': 'Slip', 'fr': 'Feuillet'}, 'amount': 12.5, 'quantity': 1, 'type': 'number'},
+    {'service': {'en': 'Rush', 'fr': 'Urgent'}, 'amount': 5, 'quantity': 1, 'type': '%'},
+]
+
+
+def test_rates_and_rounding():
+    assert parse_rate('9.975%') == parse_rate(9.975) == Decimal('9.975')
+    assert parse_rate(None) == parse_rate('n/a') == 0
+    assert format_rate(parse_rate('5')) == '5' and format_rate(Decimal('9.975')) == '9.975'
+    # Half a cent rounds up, where float formatting would round half to even
+    assert round_cents(Decimal('5.005')) == Decimal('5.01')
+    assert round_cents(Decimal('-16.247')) == Decimal('-16.25')
+
+
+def test_percentages_apply_in_order_after_the_fixed_lines():
+    pricing = price_services(PRICES, QC, True)
+    assert [line['total'] for line in pricing['lines']] == [
+        Decimal('149.97'), Decimal('-16.25'), Decimal('12.50'), Decimal('7.31'),
+    ]
+    assert pricing['subtotal'] == Decimal('162.47')
+    assert pricing['adjusted_subtotal'] == Decimal('153.53')
+    assert (pricing['gst'], pricing['qst']) == (Decimal('7.68'), Decimal('15.31'))
+    assert pricing['total'] == Decimal('176.52')
+
+    untaxed = price_services(PRICES, {**QC, 'province': 'ON'}, False)
+    assert (untaxed['qst_rate'], untaxed['gst'], untaxed['total']) == (0, 0, Decimal('153.53'))
+    assert price_services(PRICES[:1], {'province': 'QC', 'fedRate': 5, 'provRate': 0}, True)['gst'] == Decimal('7.50')
+
+
+def test_batch_shares_identical_pricings():
+    other = {'province': 'ON', 'fedRate': 13, 'provRate': 0}
+    first, second, third = price_batch([(PRICES, QC, True), (list(PRICES), dict(QC), True), (PRICES, other, True)])
+    assert first is second
+    assert third['gst'] == round_cents(third['adjusted_subtotal'] * Decimal('0.13'))
+
+
+def test_invoice_and_email_print_the_same_amounts(tmp_path):
+    clients = [{'title': 'Mr', 'name': 'Jean Tremblay', 'years': [{'year': 2024, 'confirmationNumbers': {'federal': 'A1', 'quebec': 'Q1'}}]}]
+    invoice = create_confirmation_invoice(str(tmp_path), PRICES, {'name': 'Jean Tremblay', 'invoiceNumber': 7}, QC, True, 'fr')
+    email = create_confirmation_email(str(tmp_path), clients, PRICES, QC, True, 'fr')
+
+    with fitz.open(invoice) as doc:
+        invoice_text = "".join(page.get_text() for page in doc)
+    email_text = "\n".join(paragraph.text for paragraph in Document(email).paragraphs)
+    for amount in ("153,53", "7,68", "15,31", "176,52"):
+        assert amount in invoice_text and amount in email_text
@@ -0,0 +1,43 @@
+from benchmarks.syntheticReturns import CONFIGURATION, build_client_files
+from createSummaryDocuments import process_files
+from models import profiling
+from models.profiling import profiled_job
+
+
+def test_job_profile_written_next_to_outputs(monkeypatch, tmp_path):
+    monkeypatch.setenv(profiling.ENV_VAR, 'cpu,memory')
+    monkeypatch.delenv(profiling.CLIENTS_ENV_VAR, raising=False)
+    with profiled_job('summary', str(tmp_path)):
+        sum(range(1000))
+    [prof] = tmp_path.glob('profile-summary-*.prof')
+    base = str(prof)[:-len('.prof')]
+    assert 'cumulative' in open(base + '.txt').read()
+    assert open(base + '-memory.txt').read().startswith('Peak traced memory')
+
+
+def test_only_selected_clients_are_profiled(monkeypatch, tmp_path):
+    monkeypatch.setenv(profiling.ENV_VAR, 'cpu')
+    monkeypatch.setenv(profiling.CLIENTS_ENV_VAR, 'Sam Tremblay1')
+    client_files = build_client_files(str(tmp_path / 'returns'), 3, 'EN', filler_pages=2)
+    out = tmp_path / 'out'
+    with profiled_job('summary', str(out)):
+        process_files(client_files, str(out), CONFIGURATION)
+    stages = sorted(p.name.split('-Sam_Tremblay1-')[0] for p in out.glob('profile-*.prof'))
+    assert stages == ['profile-docx', 'profile-extract', 'profile-split']
+
+
+def test_clients_match_whole_names_or_sins(monkeypatch):
+    monkeypatch.setenv(profiling.CLIENTS_ENV_VAR, 'Sam, 123456789')
+    assert not profiling.is_selected('Samantha Tremblay', '/returns/987654321 - Samantha Tremblay.pdf')
+    assert profiling.is_selected('Someone', '/returns/123456789 - Someone_2023.pdf')
+    monkeypatch.setenv(profiling.CLIENTS_ENV_VAR, 'sam tremblay')
+    assert profiling.is_selected('Sam Tremblay', None)
+    assert profiling.is_selected(None, '/returns/987654321 - Sam Tremblay.pdf')
+    assert not profiling.is_selected('Sam Tremblay Jr')
+
+
+def test_disabled_without_env(monkeypatch, tmp_path):
+    monkeypatch.delenv(profiling.ENV_VAR, raising=False)
+    with profiled_job('summary', str(tmp_path)):
+        pass
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,95 @@
+import json
+import os
+import sys
+
+import taxAutomate
+from benchmarks.syntheticReturns import CONFIGURATION, build_client_files
+from createSummaryDocuments import create_documents, pipeline_files, prepare_client_files, process_batch
+from models.returnRegistry import find_returns, processed_sources, source_hash
+
+
+def test_split_returns_are_recorded(tmp_path):
+    registry = str(tmp_path / 'registry.sqlite')
+    client_files = build_client_files(str(tmp_path / 'returns'), 3, 'EN', filler_pages=1)
+    prepare_client_files(client_files, str(tmp_path / 'season'), CONFIGURATION, registry)
+
+    [record] = find_returns(registry, sin=client_files[1]['directory'].split(os.sep)[-1].split(' - ')[0])
+    assert (record['name'], record['year'], record['language']) == ("Sam Tremblay1", 2024, 'EN')
+    assert record['source_hash'] == source_hash(client_files[1]['directory'])
+    assert record['directory'] == str(tmp_path / 'season')
+    assert all(os.path.isfile(path) for path in record['outputs'])
+    assert os.path.basename(record['outputs'][1]) == "COPY of 2024 Tax Return - Sam Tremblay1.pdf"
+    assert record['read_s'] > 0 and record['split_s'] > 0 and record['write_s'] > 0
+    assert [r['name'] for r in find_returns(registry, year=2024, name="sam tremblay1")] == ["Sam Tremblay1"]
+    assert find_returns(registry, year=2023) == []
+
+    # The same source again: replaced in the same directory, added for another one
+    again = create_documents(dict(client_files[1]), str(tmp_path / 'season'), CONFIGURATION, registry)
+    assert [r['directory'] for r in again['processed_before']] == [str(tmp_path / 'season')]
+    create_documents(dict(client_files[1]), str(tmp_path / 'copy'), CONFIGURATION, registry)
+    assert len(find_returns(registry)) == 4
+    assert [r['directory'] for r in find_returns(registry, name="Sam Tremblay1")] == \
+        [str(tmp_path / 'copy'), str(tmp_path / 'season')]
+
+    [new] = build_client_files(str(tmp_path / 'new'), 1, 'EN', filler_pages=1, start=5)
+    processed = processed_sources(registry, [client_files[0]['directory'], new['directory']])
+    assert list(processed) == [client_files[0]['directory']]
+
+
+def test_lookup_cli(tmp_path, capsys, monkeypatch):
+    registry = str(tmp_path / 'registry.sqlite')
+    client_files = build_client_files(str(tmp_path / 'returns'), 2, 'FR', filler_pages=1)
+    prepare_client_files(client_files, str(tmp_path / 'out'), CONFIGURATION, registry)
+    monkeypatch.setattr(sys, 'argv', list(sys.argv))
+
+    assert taxAutomate.main(['taxAutomate', 'lookupReturns', registry, '--year', '2024']) == 0
+    assert len(json.loads(capsys.readouterr().out)['returns']) == 2
+
+    assert taxAutomate.main(['taxAutomate', 'lookupReturns', registry, '--file', client_files[0]['directory']]) == 0
+    [(path, [record])] = json.loads(capsys.readouterr().out)['processed'].items()
+    assert path == client_files[0]['directory'] and record['language'] == 'FR'
+
+    assert taxAutomate.main(['taxAutomate', 'lookupReturns', str(tmp_path / 'none.sqlite')]) == 1
+    assert 'No registry' in json.loads(capsys.readouterr().out)['error']
+
+
+def test_batch_reports_the_returns_already_processed(tmp_path, monkeypatch):
+    import models.returnRegistry as returnRegistry
+
+    registry = str(tmp_path / 'registry.sqlite')
+    client_files = build_client_files(str(tmp_path / 'returns'), 3, 'EN', filler_pages=1)
+    assert process_batch(client_files[:1], str(tmp_path / 'season1'), CONFIGURATION, registry=registry)[
+        'processed_before'] == {}
+
+    # The returns are hashed from the bytes read to split them, never from their files
+    monkeypatch.setattr(returnRegistry, 'source_hash', None)
+    pipelined = pipeline_files(client_files[:2], str(tmp_path / 'season2'), CONFIGURATION, 2, registry=registry)
+    assert list(pipelined['processed_before']) == [client_files[0]['directory']]
+    [record] = pipelined['processed_before'][client_files[0]['directory']]
+    assert record['directory'] == str(tmp_path / 'season1')
+
+    batch = process_batch(client_files, str(tmp_path / 'season3'), CONFIGURATION, registry=registry)
+    assert list(batch['processed_before']) == [cf['directory'] for cf in client_files[:2]]
+    assert len(batch['processed_before'][client_files[0]['directory']]) == 2
+    assert len(find_returns(registry, source_hash=record['source_hash'])) == 3
+
+
+def test_summary_job_result_lists_the_returns_already_processed(tmp_path, capsys, monkeypatch):
+    import io
+
+    import createSummaryDocuments
+
+    registry = str(tmp_path / 'registry.sqlite')
+    client_files = build_client_files(str(tmp_path / 'returns'), 1, 'EN', filler_pages=1)
+    payload = {'client_files': client_files, 'directory': str(tmp_path / 'out'), 'configuration': CONFIGURATION,
+               'return_registry': registry}
+    manifest = json.dumps({'version': 1, 'job': 'createSummaryDocuments', 'payload': payload})
+    monkeypatch.setattr(sys, 'argv', ['createSummaryDocuments.py', '--manifest', '-'])
+    results = []
+    for _ in range(2):
+        monkeypatch.setattr(sys, 'stdin', io.StringIO(manifest))
+        createSummaryDocuments.main()
+        results.append(json.loads(capsys.readouterr().out))
+    assert 'processed_before' not in results[0]
+    [(path, [record])] = results[1]['processed_before'].items()
+    assert path == client_files[0]['directory'] and record['directory'] == str(tmp_path / 'out')
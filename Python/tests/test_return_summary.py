@@ -0,0 +1,65 @@
+import pickle
+
+from benchmarks.syntheticReturns import CONFIGURATION, build_client_files
+from createSummaryDocuments import prepare_client_files
+from models.createSummary import summarize_client_files
+from models.returnSummary import MONTHS, BenefitSchedule, ReturnSummary, TaxSummary
+
+
+def test_summaries_round_trip_through_dicts(tmp_path):
+    client_files = build_client_files(str(tmp_path / 'EN'), 3, 'EN')
+    client_files += build_client_files(str(tmp_path / 'FR'), 3, 'FR', start=3)
+    summaries = {cf['label']: cf['summary'] for cf in
+                 summarize_client_files(prepare_client_files(client_files, str(tmp_path / 'out'), CONFIGURATION))}
+    for summary in summaries.values():
+        assert isinstance(summary, ReturnSummary)
+        assert ReturnSummary.from_dict(summary.to_dict()) == summary
+        assert ReturnSummary.from_dict(summary.to_dict(cents=True), cents=True) == summary
+        assert pickle.loads(pickle.dumps(summary)) == summary
+
+    summary = summaries['Alex Tremblay0']
+    quebec = summary.to_dict()
+    assert list(quebec) == ['tax_summary', 'gst_amounts', 'ecgeb_amounts', 'carryforward_amounts',
+                            'solidarity_amounts', 'ccb_amounts', 'family_allowance_amounts']
+    assert summary.solidarity.total == 12 * summary.solidarity.payment('july') == 109800
+    assert quebec['solidarity_amounts']['solidarity_credit_amount'] == 1098.0
+
+
+def test_schedule_total_is_computed_unless_printed_otherwise():
+    quarterly = {'gst_credit_amount': 519.0, 'july_amount': 129.75, 'october_amount': 129.75,
+                 'january_amount': 129.75, 'april_amount': 129.75}
+    schedule = BenefitSchedule.from_dict('gst_amounts', quarterly)
+    assert schedule.printed_total is None and schedule.total == 51900
+    assert schedule.to_dict() == quarterly
+
+    # A total line that disagrees with the payments is kept as printed
+    printed = {**quarterly, 'gst_credit_amount': 0.0}
+    assert BenefitSchedule.from_dict('gst_amounts', printed).to_dict() == printed
+
+    monthly = BenefitSchedule.from_dict('ccb_amounts', {f"{month}_amount": 0.1 for month in MONTHS})
+    assert monthly.total == 120
+    assert monthly.to_dict()['ccb_amount'] == 1.2
+
+
+def test_missing_sections_stay_missing():
+    summary = ReturnSummary.from_dict({'tax_summary': {'first_name': 'Alex', 'federal_refund': 0.0}})
+    assert summary == ReturnSummary(TaxSummary(first_name='Alex'))
+    assert summary.to_dict() == {'tax_summary': {
+        'first_name': 'Alex', 'last_name': None, 'province': None,
+        'federal_refund': 0.0, 'federal_owing': 0.0, 'quebec_refund': 0.0, 'quebec_owing': 0.0,
+    }}
+    assert not hasattr(summary, '__dict__')
+
+
+def test_builders_read_the_record_by_its_dict_keys():
+    summary = ReturnSummary(TaxSummary('Alex', 'Tremblay', 'QC', federal_refund=123456),
+                            gst=BenefitSchedule.from_cents('gst_amounts', {'july_amount': 12975, 'april_amount': 1}))
+    as_dicts = summary.to_dict()
+    assert 'gst_amounts' in summary and 'ccb_amounts' not in summary
+    for key in ('first_name', 'province', 'federal_refund', 'quebec_owing'):
+        assert summary['tax_summary'][key] == as_dicts['tax_summary'][key]
+    for key in ('gst_credit_amount', 'july_amount', 'october_amount', 'april_amount'):
+        assert summary['gst_amounts'][key] == as_dicts['gst_amounts'][key]
+    assert summary['gst_amounts']['gst_credit_amount'] == 129.76
+    assert summary['gst_amounts'].get('august_amount', 0) == 0
+    assert summary.to_dict(cents=True)['tax_summary']['federal_refund'] == 123456
@@ -0,0 +1,82 @@
+import os
+import time
+
+import pytest
+from docx import Document
+
+from benchmarks.syntheticReturns import CONFIGURATION, build_client_files, register_synthetic_profiles
+from createSummaryDocuments import pipeline_files, process_files, read_stage, split_stage
+from models.pipeline import run_stages
+from models.returnRegistry import find_returns
+from models.summaryLayout import PROFILES, register_profiles
+
+
+def _text(path):
+    return [paragraph.text for paragraph in Document(path).paragraphs]
+
+
+def _slow_double(value):
+    time.sleep(0.01)
+    if value == 3:
+        raise ValueError("three")
+    return value * 2
+
+
+def _square(value):
+    return value * value
+
+
+def test_run_stages_keeps_order_and_reports():
+    results, stats = run_stages(range(8), [('add', lambda v: v + 1, 3, 'thread'),
+                                           ('square', _square, 2, 'process')], queue_size=1)
+    assert results == [(v + 1) ** 2 for v in range(8)]
+    assert stats['stages']['square']['kind'] == 'process'
+    assert list(stats['stages']) == ['add', 'square']
+    assert all(stage['items'] == 8 and 0 <= stage['utilization'] <= 1 for stage in stats['stages'].values())
+
+
+def test_run_stages_raises_the_first_error():
+    with pytest.raises(ValueError, match="three"):
+        run_stages(range(20), [('double', _slow_double, 2, 'thread'), ('same', lambda v: v, 1, 'thread')])
+
+
+def _name(path):
+    name = os.path.basename(path)
+    return 'Summaries' + os.path.splitext(name)[1] if name.startswith('Summaries ') else name
+
+
+def test_pipeline_matches_process_files(tmp_path):
+    registry = str(tmp_path / 'registry.sqlite')
+    client_files = build_client_files(str(tmp_path / 'returns'), 4, 'EN', filler_pages=1)
+    client_files += build_client_files(str(tmp_path / 'returnsFR'), 2, 'FR', filler_pages=1, start=4)
+    expected = process_files(client_files, str(tmp_path / 'sequential'), CONFIGURATION, export=True)
+
+    result = pipeline_files(client_files, str(tmp_path / 'pipelined'), CONFIGURATION, 2, export=True,
+                            registry=registry)
+    # The exports are named after their batch
+    assert [_name(path) for path in result['paths']] == [_name(path) for path in expected]
+    for path, pipelined in zip(expected, result['paths']):
+        if path.endswith('.docx'):
+            assert _text(path) == _text(pipelined)
+    assert sorted(map(_name, os.listdir(tmp_path / 'sequential'))) == sorted(map(_name, os.listdir(tmp_path / 'pipelined')))
+
+    stages = result['stages']['stages']
+    assert list(stages) == ['read', 'split', 'write', 'extract', 'render']
+    assert stages['split']['kind'] == ('process' if (os.cpu_count() or 1) > 1 else 'thread')
+    assert all(stage['items'] == 6 for stage in stages.values())
+    assert all(0 <= stages[name]['utilization'] <= 1 for name in ('read', 'split', 'write', 'extract'))
+    assert len(find_returns(registry)) == 6
+
+
+def test_process_stages_get_the_layout_profiles(tmp_path):
+    from functools import partial
+
+    register_synthetic_profiles()
+    client_files = build_client_files(str(tmp_path / 'returns'), 1, 'EN', filler_pages=1)
+    split = partial(split_stage, directory_path=str(tmp_path / 'out'), configuration=CONFIGURATION)
+    stages = [('read', read_stage, 1, 'thread'), ('split', split, 1, 'process')]
+    [(_, response, _)], _ = run_stages(client_files, stages)
+    assert response['layout_profile'] is None
+    [(_, response, _)], _ = run_stages(client_files, stages, initializer=register_profiles,
+                                       initargs=(dict(PROFILES),))
+    assert response['layout_profile'] == 'synthetic-en'
@@ -0,0 +1,84 @@
+import ast
+import csv
+import os
+import struct
+import zipfile
+from array import array
+
+from benchmarks.syntheticReturns import CONFIGURATION, build_client_files
+from createSummaryDocuments import prepare_client_files, process_files
+from models.createSummary import summarize_client_files
+from models.summaryExport import COLUMNS, _npy, export_summaries
+
+
+def read_npy(data):
+    """A column written by _npy, read back the way numpy.load parses the format."""
+    assert data[:8] == b'\x93NUMPY\x01\x00'
+    (length,) = struct.unpack('<H', data[8:10])
+    assert (10 + length) % 64 == 0
+    header = ast.literal_eval(data[10:10 + length].decode('latin1'))
+    body = data[10 + length:]
+    (count,) = header['shape']
+    if header['descr'] == '<i8':
+        values = array('q')
+        values.frombytes(body)
+        return values.tolist()
+    width = int(header['descr'][2:])
+    text = body.decode('utf-32-le')
+    return [text[i * width:(i + 1) * width].rstrip('\0') for i in range(count)]
+
+
+def test_batch_export(tmp_path):
+    client_files = build_client_files(str(tmp_path / 'EN'), 3, 'EN')
+    client_files += build_client_files(str(tmp_path / 'FR'), 2, 'FR', start=3)
+    out = tmp_path / 'out'
+    paths = process_files(client_files, str(out), CONFIGURATION, export=True)
+    csv_path, npz_path = paths[-2:]
+    assert os.path.dirname(csv_path) == str(out) and csv_path.endswith('.csv')
+    assert os.path.basename(csv_path).startswith('Summaries ') and npz_path == csv_path[:-4] + '.npz'
+
+    with open(csv_path, newline='', encoding='utf-8') as stream:
+        rows = list(csv.DictReader(stream))
+    assert [row['label'] for row in rows] == [cf['label'] for cf in client_files]
+    quebec = rows[0]
+    assert (quebec['province'], quebec['year'], quebec['language']) == ('Quebec', '2024', 'EN')
+    assert quebec['federal_refund'] == '1234.56'
+    assert quebec['ccb_total'] == '1203.96' and quebec['ccb_july'] == '100.33'
+    assert quebec['ontario_trillium_total'] == '0.00'
+
+    with zipfile.ZipFile(npz_path) as archive:
+        assert archive.namelist() == [f"{column}.npy" for column in COLUMNS]
+        columns = {name[:-4]: read_npy(archive.read(name)) for name in archive.namelist()}
+    assert columns['label'] == [row['label'] for row in rows]
+    assert columns['last_name'][3] == 'Tremblay3'
+    assert columns['federal_refund'][0] == 123456
+    assert columns['ccb_total'] == [round(float(row['ccb_total']) * 100) for row in rows]
+
+
+def test_export_is_optional(tmp_path):
+    out = tmp_path / 'out'
+    paths = process_files(build_client_files(str(tmp_path / 'EN'), 1, 'EN'), str(out), CONFIGURATION)
+    assert all(path.endswith('.docx') for path in paths)
+    assert not any(name.startswith('Summaries') for name in os.listdir(out))
+
+
+def test_batches_keep_their_own_exports(tmp_path):
+    [client_file] = build_client_files(str(tmp_path / 'EN'), 1, 'EN')
+    [summarized] = summarize_client_files(prepare_client_files([client_file], str(tmp_path / 'out'), CONFIGURATION))
+    first = export_summaries([summarized], str(tmp_path))
+    second = export_summaries([summarized], str(tmp_path))
+    assert len(set(first + second)) == 4 and all(os.path.exists(path) for path in first + second)
+    assert export_summaries([summarized], str(tmp_path), batch='job-7') == [
+        str(tmp_path / 'Summaries job-7.csv'), str(tmp_path / 'Summaries job-7.npz')]
+
+
+def test_npy_bytes_match_numpy():
+    # What numpy.save writes for numpy.array([1, -2]) and numpy.array(['ab', 'c'])
+    header = b"\x93NUMPY\x01\x00v\x00{'descr': '%s', 'fortran_order': False, 'shape': (2,), }" + b' ' * 60 + b'\n'
+    assert _npy([1, -2]) == header % b'<i8' + b'\x01\0\0\0\0\0\0\0' + b'\xfe' + b'\xff' * 7
+    assert _npy(['ab', 'c']) == header % b'<U2' + 'abc\0'.encode('utf-32-le')
+
+
+def test_empty_text_column():
+    assert read_npy(_npy(['', ''])) == ['', '']
+    assert read_npy(_npy([-5, 2 ** 40])) == [-5, 2 ** 40]
@@ -0,0 +1,118 @@
+import json
+import os
+import subprocess
+import sys
+
+import fitz
+import pytest
+
+from benchmarks.syntheticReturns import CONFIGURATION, COVER, build_client_files, register_synthetic_profiles
+from createSummaryDocuments import prepare_client_files
+from models.createSummary import TITLES_FR, extract_return_summary, outline_sections, page_text, prepare_summary
+from models.summaryLayout import (
+    PROFILES, load_profiles, profile_clip, profile_for, register_profile, save_profiles, section_words,
+)
+
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(autouse=True)
+def synthetic_profiles():
+    register_synthetic_profiles()
+
+
+def _prepared(tmp_path, language, count):
+    client_files = build_client_files(str(tmp_path / 'returns'), count, language, filler_pages=1,
+                                      overview_pages=1, note_lines=12)
+    return prepare_client_files(client_files, str(tmp_path / 'out'), CONFIGURATION)
+
+
+def test_profile_selected_from_cover():
+    assert profile_for(COVER['EN'], 'EN') == 'synthetic-en'
+    assert profile_for(COVER['FR'], 'FR') == 'synthetic-fr'
+    assert profile_for(COVER['EN'], 'FR') is None
+    assert profile_for("Other software 2019", 'EN') is None
+
+
+def test_clipped_tables_match_full_pages(tmp_path):
+    for cf in _prepared(tmp_path, 'EN', 3):
+        assert cf['layout_profile'] == 'synthetic-en'
+        clipped = prepare_summary(cf['summary_file_path'], 'EN', cf['summary_outline'], cf['layout_profile'])
+        full = prepare_summary(cf['summary_file_path'], 'EN')
+        # The full read also gives the last section of a page the explanations under it
+        for title, lines in clipped['sections'].items():
+            assert full['sections'][title][:len(lines)] == lines
+        assert (extract_return_summary(cf['summary_file_path'], 'EN', 2024, cf['summary_outline'], cf['layout_profile'])
+                == extract_return_summary(cf['summary_file_path'], 'EN', 2024))
+
+
+def test_moved_anchor_is_found_by_title_search(tmp_path):
+    [cf] = _prepared(tmp_path, 'EN', 1)
+    sections = {title: dict(section) for title, section in PROFILES['synthetic-en']['sections'].items()}
+    x0, y0, x1, y1 = sections["GST/HST Tax Credit"]['anchor']
+    sections["GST/HST Tax Credit"]['anchor'] = (x0, y0 + 40, x1, y1 + 40)
+    register_profile('moved', "unused", 'EN', sections)
+    try:
+        page = fitz.open(cf['summary_file_path'])[2]
+        titles = ["GST/HST Tax Credit", "Estimated of the Canada Groceries"]
+        with page_text(page, profile_clip(PROFILES['moved'], titles)) as textpage:
+            assert section_words(page, textpage, PROFILES['moved'], titles) is None
+        with page_text(page) as textpage:
+            relocated = section_words(page, textpage, PROFILES['moved'], titles, relocate=True)
+            assert relocated == section_words(page, textpage, PROFILES['synthetic-en'], titles)
+            # The GST table, moved with its title, would now reach into the groceries section
+            sections["GST/HST Tax Credit"]['table'] = (0, 11, 550, 100)
+            assert section_words(page, textpage, PROFILES['moved'], titles, relocate=True) is None
+        assert profile_clip(PROFILES['moved'], ["Canada carbon rebate", "Not a section"]) is None
+
+        moved = prepare_summary(cf['summary_file_path'], 'EN', cf['summary_outline'], 'moved')
+        full = prepare_summary(cf['summary_file_path'], 'EN')
+        assert moved['sections']["GST/HST Tax Credit"] == full['sections']["GST/HST Tax Credit"]
+    finally:
+        del PROFILES['moved']
+
+
+def test_text_page_serves_every_pass(tmp_path):
+    [cf] = _prepared(tmp_path, 'EN', 1)
+    page = fitz.open(cf['summary_file_path'])[1]
+    with page_text(page) as textpage:
+        assert page.search_for("Tax return summary", textpage=textpage)
+        assert page.get_text("words", textpage=textpage) == page.get_text("words")
+
+
+def test_profiles_are_only_registered_explicitly(tmp_path, monkeypatch):
+    code = "import benchmarks.syntheticReturns, models.summaryLayout as layout; print(len(layout.PROFILES))"
+    result = subprocess.run([sys.executable, '-c', code], cwd=PYTHON_DIR, capture_output=True, text=True)
+    assert result.stdout.strip() == '0', result.stderr
+
+    path = save_profiles(str(tmp_path / 'profiles.json'), ['synthetic-en'])
+    assert list(json.load(open(path, encoding='utf-8'))) == ['synthetic-en']
+    monkeypatch.setattr('models.summaryLayout.PROFILES', {})
+    from models import summaryLayout
+    assert summaryLayout.profile_for(COVER['EN'], 'EN') is None
+    assert load_profiles(path) == ['synthetic-en']
+    assert summaryLayout.PROFILES['synthetic-en'] == PROFILES['synthetic-en']
+    assert summaryLayout.profile_for(COVER['EN'], 'EN') == 'synthetic-en'
+
+
+def test_measured_profile_reads_the_same_sections(tmp_path, monkeypatch):
+    import taxAutomate
+    from models import summaryLayout
+
+    prepared = _prepared(tmp_path, 'FR', 2)
+    profiles = str(tmp_path / 'layoutProfiles.json')
+    monkeypatch.setattr('models.summaryLayout.PROFILES', {})
+    assert taxAutomate.main(['taxAutomate', 'measureLayoutProfile', profiles, 'release-fr',
+                             prepared[0]['directory'], prepared[0]['summary_file_path']]) == 0
+    assert summaryLayout.PROFILES['release-fr']['cover'] == COVER['FR']
+
+    monkeypatch.setattr('models.summaryLayout.PROFILES', {})
+    assert load_profiles(profiles) == ['release-fr']
+    for cf in prepared:
+        page = fitz.open(cf['summary_file_path'])[2]
+        titles = outline_sections(cf['summary_outline'], TITLES_FR)[2]
+        assert titles
+        with page_text(page) as textpage:
+            assert section_words(page, textpage, summaryLayout.PROFILES['release-fr'], titles) is not None
+        assert (extract_return_summary(cf['summary_file_path'], 'FR', 2024, cf['summary_outline'], 'release-fr')
+                == extract_return_summary(cf['summary_file_path'], 'FR', 2024))
@@ -0,0 +1,63 @@
+import os
+
+import pytest
+from docx import Document
+
+from benchmarks.syntheticReturns import CONFIGURATION, build_client_files
+from createSummaryDocuments import pipeline_files, process_files
+from models.summaryStore import load_summaries, stored_years
+
+
+def _returns(tmp_path, year, language='EN', **client):
+    [client_file] = build_client_files(str(tmp_path / f'returns{year}{language}'), 1, language, year=year, filler_pages=1)
+    return {**client_file, **client}
+
+
+def _text(path):
+    return [paragraph.text for paragraph in Document(path).paragraphs]
+
+
+def test_prior_years_come_from_the_store(tmp_path):
+    store = str(tmp_path / 'summaries.sqlite')
+    earlier = [_returns(tmp_path, 2022), _returns(tmp_path, 2023)]
+    process_files(earlier, str(tmp_path / 'season1'), CONFIGURATION, summary_store=store)
+    sin = os.path.basename(earlier[0]['directory']).split(' - ')[0]
+    assert stored_years(store, sin) == [2022, 2023]
+    assert load_summaries(store, sin, [2023, 2019])[2023].tax_summary.first_name == 'Alex'
+
+    current = _returns(tmp_path, 2024, prior_years=[2022, 2023])
+    [path] = process_files([current], str(tmp_path / 'season2'), CONFIGURATION, summary_store=store)
+    assert os.path.basename(path) == "Summary Alex Tremblay0 2022, 2023 & 2024.docx"
+    assert stored_years(store, sin) == [2022, 2023, 2024]
+
+    [uploaded] = process_files(earlier + [_returns(tmp_path, 2024)], str(tmp_path / 'all'), CONFIGURATION)
+    assert _text(path) == _text(uploaded)
+
+
+def test_prior_year_keeps_its_stored_language(tmp_path):
+    store = str(tmp_path / 'summaries.sqlite')
+    earlier = _returns(tmp_path, 2023)
+    process_files([earlier], str(tmp_path / 'season1'), CONFIGURATION, summary_store=store)
+
+    # Filed in English last year and in French this year
+    current = _returns(tmp_path, 2024, 'FR', prior_years=[2023])
+    [path] = process_files([current], str(tmp_path / 'season2'), CONFIGURATION, summary_store=store)
+    [uploaded] = process_files([earlier, _returns(tmp_path, 2024, 'FR')], str(tmp_path / 'all'), CONFIGURATION)
+    assert os.path.basename(path) == os.path.basename(uploaded) == "Summary Alex Tremblay0 2023 & 2024.docx"
+    assert _text(path) == _text(uploaded)
+
+
+def test_missing_prior_year_is_reported(tmp_path):
+    store = str(tmp_path / 'summaries.sqlite')
+    current = _returns(tmp_path, 2024, prior_years=[2021])
+    with pytest.raises(ValueError, match="Alex Tremblay0 2021"):
+        process_files([current], str(tmp_path / 'out'), CONFIGURATION, summary_store=store)
+    with pytest.raises(ValueError, match="Alex Tremblay0 2021"):
+        pipeline_files([current], str(tmp_path / 'out'), CONFIGURATION, 2, summary_store=store,
+                       registry=str(tmp_path / 'registry.sqlite'))
+    # Reported before any return is split
+    assert not (tmp_path / 'out').exists() and not (tmp_path / 'registry.sqlite').exists()
+
+    # Without a store the client is documented for the uploaded year only
+    [path] = process_files([current], str(tmp_path / 'out'), CONFIGURATION)
+    assert os.path.basename(path) == "Summary Alex Tremblay0 2024.docx"
@@ -0,0 +1,17 @@
+import json
+import sys
+
+import taxAutomate
+
+
+def test_unknown_job_prints_usage(capsys):
+    assert taxAutomate.main(['taxAutomate', 'nope']) == 2
+    assert 'Usage: taxAutomate' in json.loads(capsys.readouterr().out)['error']
+
+
+def test_job_sees_its_own_argv(monkeypatch):
+    seen = []
+    monkeypatch.setitem(taxAutomate.JOBS, 'createSummaryDocuments', lambda: seen.append(list(sys.argv)) or 0)
+    monkeypatch.setattr(sys, 'argv', list(sys.argv))
+    assert taxAutomate.main(['taxAutomate', 'createSummaryDocuments', '{"a": 1}', '/tmp/out']) == 0
+    assert seen == [['createSummaryDocuments', '{"a": 1}', '/tmp/out']]
@@ -1,3 +1,4 @@
+import fs from 'fs';
 import path from 'path';
 import { app, BrowserWindow, shell, ipcMain, dialog, screen } from 'electron';
 import { autoUpdater } from 'electron-updater';
@@ -293,16 +294,24 @@ function parsePythonError(stderr: string): string {
   return 'An unexpected error occurred while running the script.';
 }
 
-ipcMain.on('run-python', (event, scriptName, args) => {
+// Version of the job manifest the Python jobs accept (see Python/models/jobManifest.py)
+const JOB_MANIFEST_VERSION = 1;
+
+// Summary layout profiles written by the measureLayoutProfile job (see Python/models/summaryLayout.py)
+const layoutProfilesPath = () =>
+  path.join(app.getPath('userData'), 'layoutProfiles.json');
+
+ipcMain.on('run-python', (event, scriptName, payload) => {
   let pythonPath: string;
 
   if (app.isPackaged) {
+    // One shared bundle: taxAutomate <scriptName> [args...] (see Python/taxAutomate.py)
     const exeName =
-      process.platform === 'win32' ? `${scriptName}.exe` : scriptName;
+      process.platform === 'win32' ? 'taxAutomate.exe' : 'taxAutomate';
     pythonPath = path.join(
       process.resourcesPath,
       'Python',
-      scriptName,
+      'taxAutomate',
       exeName
     );
   } else {
@@ -314,29 +323,32 @@ ipcMain.on('run-python', (event, scriptName, args) => {
     pythonPath = scriptPath;
   }
 
-  // Write large JSON args to temp files to avoid ENAMETOOLONG on Windows
-  const fs = require('fs');
-  const os = require('os');
-  const tempFiles: string[] = [];
-  const processedArgs = args.map((arg: string) => {
-    if (typeof arg === 'string' && arg.length > 4000 && arg.startsWith('{')) {
-      const tmpFile = path.join(os.tmpdir(), `taxapp_${Date.now()}_${Math.random().toString(36).slice(2)}.json`);
-      fs.writeFileSync(tmpFile, arg, 'utf-8');
-      tempFiles.push(tmpFile);
-      return `@file:${tmpFile}`;
-    }
-    return arg;
-  });
+  const jobPayload =
+    scriptName === 'createSummaryDocuments' &&
+    fs.existsSync(layoutProfilesPath())
+      ? { ...payload, layout_profiles: layoutProfilesPath() }
+      : payload;
 
-  const execArgs = app.isPackaged ? processedArgs : [pythonPath, ...processedArgs];
+  // The job reads its inputs from one manifest on stdin, whatever their size
+  const manifest = JSON.stringify({
+    version: JOB_MANIFEST_VERSION,
+    job: scriptName,
+    payload: jobPayload,
+  });
+  const jobArgs = ['--manifest', '-'];
+  const execArgs = app.isPackaged
+    ? [scriptName, ...jobArgs]
+    : [pythonPath, ...jobArgs];
   const execCommand = app.isPackaged ? pythonPath : 'python';
 
-  log.info(`Executing Python: ${execCommand} with args count:`, execArgs.length);
+  log.info(`Executing Python: ${execCommand} with a ${manifest.length} byte manifest`);
 
-  execFile(execCommand, execArgs, (error, stdout, stderr) => {
-    // Clean up temp files
-    for (const f of tempFiles) {
-      try { fs.unlinkSync(f); } catch (_) { /* ignore */ }
+  const child = execFile(execCommand, execArgs, (error, stdout, stderr) => {
+    // Stage timings, printed when TAX_APP_METRICS is set (see Python/models/instrumentation.py)
+    for (const line of (stderr ?? '').split('\n')) {
+      if (line.startsWith('METRICS ')) {
+        log.info(`[Python Metrics] Script: ${scriptName} ${line.slice('METRICS '.length)}`);
+      }
     }
 
     if (error) {
@@ -350,8 +362,20 @@ ipcMain.on('run-python', (event, scriptName, args) => {
       return;
     }
     log.info('Python script executed successfully');
+    // createConfirmationDocuments reports the time of each document it wrote
+    try {
+      const { timings, documents } = JSON.parse(stdout);
+      if (timings) {
+        log.info(
+          `[Python Timings] Script: ${scriptName} ${JSON.stringify({ timings, documents })}`,
+        );
+      }
+    } catch {
+      // Not a JSON result
+    }
     event.reply('python-result', { success: true, result: stdout });
   });
+  child.stdin?.end(manifest, 'utf-8');
 });
 
 ipcMain.handle('db:getConfigurations', async () => {
@@ -2,8 +2,8 @@ const { contextBridge, ipcRenderer } = require('electron');
 
 contextBridge.exposeInMainWorld('electron', {
   selectFile: () => ipcRenderer.invoke('dialog:openFile'),
-  runPythonScript: (scriptName, args) =>
-    ipcRenderer.send('run-python', scriptName, args),
+  runPythonScript: (scriptName, payload) =>
+    ipcRenderer.send('run-python', scriptName, payload),
   onPythonResult: (callback) => {
     ipcRenderer.removeAllListeners('python-result');
     ipcRenderer.on('python-result', (event, data) => callback(data));
@@ -376,20 +376,15 @@ function ConfirmationComponent() {
       return;
     }
 
-    const clientsJson = JSON.stringify(clients);
-    const selectedPricesJson = JSON.stringify(selectedPrices);
-    const invoiceDetailsJson = JSON.stringify(invoiceDetails);
-    const taxRatesJson = JSON.stringify(taxRates[0]);
-
-    await window.electron.runPythonScript('createConfirmationDocuments', [
-      directory.path,
-      clientsJson,
-      selectedPricesJson,
-      invoiceDetailsJson,
-      taxRatesJson,
-      includeTaxes,
+    await window.electron.runPythonScript('createConfirmationDocuments', {
+      directory: directory.path,
+      clients,
+      selected_prices: selectedPrices,
+      invoice_details: invoiceDetails,
+      tax_rate: taxRates[0],
+      include_taxes: includeTaxes,
       language,
-    ]);
+    });
 
     await api.invoiceNumber.update(invoiceDetails.invoiceNumber + 1);
 
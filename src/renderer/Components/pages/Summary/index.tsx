@@ -201,16 +201,12 @@ function SummaryComponent() {
 
     setIsLoading(true);
 
-    const clientsJson = JSON.stringify(clientFiles);
-    const configurationJson = JSON.stringify(configuration);
-    const docTextConfigJson = JSON.stringify(docTextConfig || {});
-
-    window.electron.runPythonScript('createSummaryDocuments', [
-      clientsJson,
+    window.electron.runPythonScript('createSummaryDocuments', {
+      client_files: clientFiles,
       directory,
-      configurationJson,
-      docTextConfigJson,
-    ]);
+      configuration,
+      doc_text_config: docTextConfig || {},
+    });
   };
 
   useEffect(() => {
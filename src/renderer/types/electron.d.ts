@@ -21,7 +21,7 @@ export interface ElectronAPI {
   selectFiles: () => Promise<string[]>;
 
   // Python execution
-  runPythonScript: (scriptName: string, args: string[]) => void;
+  runPythonScript: (scriptName: string, payload: Record<string, unknown>) => void;
   onPythonResult: (
     callback: (data: {
       success: boolean;